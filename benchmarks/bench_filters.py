@@ -0,0 +1,99 @@
+"""
+Measures the per node cost of the filters.py attribute rules, comparing
+the interpreted rules (attrs_filter) with the compiled matchers that
+get_filter builds.
+
+Usage:
+    python -m benchmarks.bench_filters PAGE.html [--repeat N]
+"""
+from html.parser import HTMLParser
+
+from functools import partial
+
+import argparse
+import time
+
+from src.reader.filters import FILTERS_DATA, attrs_filter, compile_attrs
+
+
+class StartTagCollector(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.nodes = []
+
+    def handle_starttag(self, tag, attrs):
+        self.nodes.append((tag, {key: value or "" for key, value in attrs}))
+
+
+def read_nodes(page: str):
+    """
+    Returns the (tag, attributes) pair of every element in the page.
+
+    Parameters:
+        - page: Path of the saved chart page
+    """
+    collector = StartTagCollector()
+    with open(page, encoding="utf-8") as f:
+        collector.feed(f.read())
+
+    return collector.nodes
+
+
+def time_per_node(nodes: list,
+                  tag_name: str,
+                  matcher,
+                  short_circuit: bool,
+                  repeat: int):
+    """
+    Returns the best nanoseconds per node of running the matcher over
+    every node.
+
+    Parameters:
+        - nodes: (tag, attributes) pairs to evaluate
+        - tag_name: Tag of the filter
+        - matcher: Attributes matcher to time
+        - short_circuit: If True, the tag name is checked before the
+            attributes
+        - repeat: Times the measure is repeated
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        if short_circuit:
+            for tag, attrs in nodes:
+                if tag == tag_name:
+                    matcher(attrs)
+        else:
+            for tag, attrs in nodes:
+                matcher(attrs)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best / len(nodes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("page")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    nodes = read_nodes(args.page)
+    print(f"{len(nodes)} nodes in {args.page}")
+    print(f"{'filter':<22}{'interpreted':>14}{'compiled':>12}{'+tag check':>14}")
+
+    for name, rules in FILTERS_DATA.items():
+        attr_rules = rules.get("attributes", {})
+        interpreted = partial(attrs_filter, rules=attr_rules)
+        compiled = compile_attrs(attr_rules)
+        tag_name = rules.get("tag")
+
+        before = time_per_node(nodes, tag_name, interpreted, False, args.repeat)
+        after = time_per_node(nodes, tag_name, compiled, False, args.repeat)
+        short = time_per_node(nodes, tag_name, compiled, True, args.repeat)
+
+        print(f"{name:<22}{before:>11.0f} ns{after:>9.0f} ns{short:>11.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Measures the cold import time of the package modules, each run in a
+fresh interpreter with -X importtime. Results are printed as JSON with
+the best and median total times and the slowest modules imported.
+
+By default it measures src.reader.website, which is what main.py and
+the CLIs import before doing any work.
+
+Usage:
+    python -m benchmarks.bench_import [MODULE ...] [--runs N] [--top N]
+"""
+from typing import Dict, List
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PACKAGE_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = ["src.reader.website"]
+
+
+def read_import_times(module: str) -> Dict[str, int]:
+    """
+    Returns the dictionary of {module: cumulative microseconds} of
+    importing a module in a fresh interpreter.
+
+    Parameters:
+        - module: Name of the module to import
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=PACKAGE_FOLDER,
+                            capture_output=True,
+                            text=True,
+                            check=True)
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_time, cumulative, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        times[name] = (int(self_time), int(cumulative))
+
+    return times
+
+
+def bench_module(module: str,
+                 runs: int,
+                 top: int) -> dict:
+    """
+    Returns the import times of a module.
+
+    Parameters:
+        - module: Name of the module to import
+        - runs: Fresh interpreters to measure
+        - top: Amount of slowest modules to report
+    """
+    totals: List[float] = []
+    last_times = {}
+
+    for _ in range(runs):
+        last_times = read_import_times(module)
+        totals.append(last_times[module][1] / 1000)
+
+    slowest = sorted(last_times.items(), key=lambda item: item[1][0], reverse=True)[:top]
+
+    return {
+        "module": module,
+        "runs": runs,
+        "best_ms": min(totals),
+        "median_ms": statistics.median(totals),
+        "modules_imported": len(last_times),
+        "slowest_self_ms": {name: self_time / 1000 for name, (self_time, _) in slowest},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    results = [bench_module(module, args.runs, args.top) for module in args.modules]
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Measures the cost of reading the entry nodes out of every card of a
+saved chart page, comparing one find/find_all walk per filter with the
+single pass CardScanner.
+
+Usage:
+    python -m benchmarks.bench_items PAGE.html [--repeat N]
+"""
+import argparse
+import time
+
+from src.reader.filters import CARDS_FILTER, CREDITS_FILTER, IMAGES_FILTER
+from src.reader.filters import EXTRAS_FILTER, MEANINGUL_DATES_FILTER
+from src.reader.filters import MEANINGUL_POSITIONS_FILTER, POSITIONS_FILTER
+from src.reader.filters import TITLES_FILTER
+from src.reader.parsers.backends import get_parser
+from src.reader.website import get_card_scanner
+
+
+def walk_per_filter(node):
+    """
+    Returns the card nodes found with one walk per filter.
+
+    Parameters:
+        - node: Card node to read
+    """
+    return {
+        "position": node.find(POSITIONS_FILTER),
+        "title": node.find(TITLES_FILTER),
+        "credits": node.find(CREDITS_FILTER),
+        "meaningful_dates": node.find_all(MEANINGUL_DATES_FILTER),
+        "image": node.find_all(IMAGES_FILTER),
+        "extra_values": node.find_all(EXTRAS_FILTER),
+        "meaningful_positions": node.find_all(MEANINGUL_POSITIONS_FILTER),
+    }
+
+
+def walk_once(node):
+    """
+    Returns the card nodes found with a single scanner walk.
+
+    Parameters:
+        - node: Card node to read
+    """
+    return get_card_scanner().scan(node)
+
+
+def time_cards(cards: list,
+               reader,
+               repeat: int):
+    """
+    Returns the best milliseconds spent reading every card.
+
+    Parameters:
+        - cards: Card nodes of the page
+        - reader: Function reading a single card
+        - repeat: Times the measure is repeated
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for card in cards:
+            reader(card)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("page")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.page, encoding="utf-8") as f:
+        soup = get_parser("mysoup").parse(f.read())
+    cards = soup.find_all(CARDS_FILTER)
+
+    for card in cards:
+        before = walk_per_filter(card)
+        after = walk_once(card)
+        for slot, nodes in before.items():
+            first = after[slot][0] if after[slot] else None
+            assert nodes == after[slot] or nodes is first, slot
+
+    before = time_cards(cards, walk_per_filter, args.repeat)
+    after = time_cards(cards, walk_once, args.repeat)
+
+    print(f"{len(cards)} cards in {args.page}")
+    print(f"one walk per filter: {before:.2f} ms")
+    print(f"single pass scanner: {after:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+Times each stage of reading a chart page: parsing the page, every
+filter's find_all over it, extracting the items out of the parsed page
+or card by card, and building the ChartItem objects, from text and
+from typed values. Results are printed as JSON so runs can be stored
+and compared.
+
+The pages are the saved corpus in benchmarks/fixtures (see
+make_fixtures) unless other saved pages are given.
+
+Usage:
+    python -m benchmarks.bench_pipeline [PAGE.html[.gz] ...] [--parser NAME ...] [--repeat N] [--output FILE]
+"""
+from typing import Callable, List
+
+import argparse
+import datetime
+import gzip
+import json
+import os
+import platform
+import tempfile
+import time
+
+from src.reader.cache import ChartDateCache, HtmlCache
+from src.reader.filters import FILTERS_DATA, get_filter
+from src.reader.parsers.backends import PARSERS, get_parser
+from src.reader.website import BillboardChartWebsite
+from src.records.chart_item import ChartItem
+
+from .make_fixtures import CORPUS, get_fixture_path
+
+FILTERS = {name: get_filter(rules) for name, rules in FILTERS_DATA.items()}
+
+DEFAULT_CHART = "hot-100"
+
+
+def read_page(path: str) -> str:
+    """
+    Returns the html of a saved page, compressed or not.
+
+    Parameters:
+        - path: Path of the page
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+
+    with opener(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+def best_time(function: Callable,
+              repeat: int) -> float:
+    """
+    Returns the best milliseconds spent running the function.
+
+    Parameters:
+        - function: Function to time
+        - repeat: Times the measure is repeated
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best * 1000
+
+
+def get_item_arguments(item: ChartItem) -> dict:
+    """
+    Returns the arguments ChartItem was built with for an item.
+
+    Parameters:
+        - item: Item built out of a page
+    """
+    return {
+        "position": item.position,
+        "title": item.title,
+        "image": item.image or "",
+        "last_week": "" if item.last_week is None else str(item.last_week),
+        "peak": item.peak,
+        "weeks": item.weeks,
+        "debut_date": item.debut_date.isoformat(),
+        "debut_position": item.debut_position,
+        "peak_date": item.peak_date.isoformat(),
+        "date": item.date,
+        "credits": item.credits,
+    }
+
+
+def get_parsed_arguments(item: ChartItem) -> dict:
+    """
+    Returns the typed values ChartItem.from_parsed takes for an item.
+
+    Parameters:
+        - item: Item built out of a page
+    """
+    return {
+        "position": item.position,
+        "title": item.title,
+        "image": item.image,
+        "last_week": item.last_week,
+        "peak": item.peak,
+        "weeks": item.weeks,
+        "debut_date": item.debut_date,
+        "debut_position": item.debut_position,
+        "peak_date": item.peak_date,
+        "date": item.date,
+        "credits": item.credits,
+    }
+
+
+def bench_page(name: str,
+               html: str,
+               chart: str,
+               date: datetime.date,
+               parser_name: str,
+               repeat: int) -> dict:
+    """
+    Returns the timings of every stage for a page.
+
+    Parameters:
+        - name: Name the page is reported with
+        - html: Html of the page
+        - chart: Key of the chart of the page
+        - date: Date of the chart of the page
+        - parser_name: Name of the parser backend to use
+        - repeat: Times each measure is repeated
+    """
+    cache = HtmlCache(tempfile.mkdtemp())
+    parser = get_parser(parser_name)
+
+    def get_website():
+        return BillboardChartWebsite(chart, date, cache=cache, date_cache=ChartDateCache(), parser=parser)
+
+    soup = parser.parse(html)
+
+    def read_parsed():
+        website = get_website()
+        website.set_html(html)
+        website.soup = soup
+        return website.get_items()
+
+    def read_streamed():
+        website = get_website()
+        website.set_html(html)
+        return list(website.iter_items())
+
+    items = read_parsed()
+    arguments = [get_item_arguments(item) for item in items]
+    parsed_arguments = [get_parsed_arguments(item) for item in items]
+
+    return {
+        "page": name,
+        "parser": parser_name,
+        "chart": chart,
+        "date": date.isoformat(),
+        "bytes": len(html.encode("utf-8")),
+        "items": len(items),
+        "timings_ms": {
+            "parse": best_time(lambda: parser.parse(html), repeat),
+            "find_all": {filter_name: best_time(lambda: soup.find_all(node_filter), repeat)
+                         for filter_name, node_filter in FILTERS.items()},
+            "get_items": best_time(read_parsed, repeat),
+            "get_items_streamed": best_time(read_streamed, repeat),
+            "build_items": best_time(lambda: [ChartItem(**kwargs) for kwargs in arguments], repeat),
+            "build_items_parsed": best_time(lambda: [ChartItem.from_parsed(**kwargs) for kwargs in parsed_arguments],
+                                            repeat),
+        },
+    }
+
+
+def get_corpus(pages: List[str]):
+    """
+    Returns the (name, path, chart, date) of the pages to measure.
+
+    Parameters:
+        - pages: Paths of saved pages. If empty, the fixtures corpus
+    """
+    if not pages:
+        return [(os.path.basename(get_fixture_path(chart, date)), get_fixture_path(chart, date), chart, date)
+                for chart, date, _, _ in CORPUS]
+
+    corpus = []
+    for path in pages:
+        html = read_page(path)
+        website = BillboardChartWebsite(DEFAULT_CHART, cache=HtmlCache(tempfile.mkdtemp()))
+        website.set_html(html)
+        corpus.append((os.path.basename(path), path, DEFAULT_CHART, website.get_chart_date()))
+
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*")
+    parser.add_argument("--parser", nargs="+", default=["mysoup"], choices=list(PARSERS),
+                        help="Parser backends to measure")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default=None, help="File where the JSON is written instead of stdout")
+    args = parser.parse_args()
+
+    results = {
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "pages": [bench_page(name, read_page(path), chart, date, parser_name, args.repeat)
+                  for name, path, chart, date in get_corpus(args.pages)
+                  for parser_name in args.parser],
+    }
+
+    if args.output is None:
+        print(json.dumps(results, indent=2))
+    else:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
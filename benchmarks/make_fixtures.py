@@ -0,0 +1,160 @@
+"""
+Writes the chart pages of the benchmarks corpus. The pages follow the
+markup of billboard.com chart pages (cards, filters' classes and date
+picker) with made up entries, so they can be rebuilt anywhere and are
+stable between runs.
+
+Usage:
+    python -m benchmarks.make_fixtures [--folder FOLDER]
+"""
+import argparse
+import datetime
+import gzip
+import os
+import random
+
+FIXTURES_FOLDER = os.path.join(os.path.dirname(__file__), "fixtures")
+FIXTURE_EXTENSION = ".html.gz"
+
+# (chart, chart date, entries, head tags before the chart)
+CORPUS = [
+    ("hot-100", datetime.date(1958, 8, 4), 100, 150),
+    ("hot-100", datetime.date(2025, 8, 9), 100, 400),
+    ("billboard-global-200", datetime.date(2025, 8, 9), 200, 400),
+]
+
+WEEK = datetime.timedelta(days=7)
+
+HEAD_TAG = '<meta name="{name}" content="chart page metadata {i}"/>'
+DATE_PICKER = '<div id="chart-date-picker" data-date="{date}"></div>'
+NO_IMAGE_URL = "https://www.billboard.com/wp-content/themes/vip/pmc-billboard-2021/assets/public/lazyload-fallback.gif"
+IMAGE_URL = "https://charts-static.billboard.com/img/{year}/{i:02d}/artist-{i}-180x180.jpg"
+
+CARD = (
+    '<div class="o-chart-results-list-row-container">'
+    '<ul class="o-chart-results-list-row">'
+    '<li class="lrv-u-width-100p"><span class="c-label  a-font-basic u-font-size-32">{position}</span></li>'
+    '<li><div class="c-lazy-image  lrv-u-width-100p"><div class="c-lazy-image__wrapper">'
+    '<img class="c-lazy-image__img" src="{image}"/></div></div></li>'
+    '<li><h3 id="title-of-a-story" class="c-title  a-font-basic u-letter-spacing-0010">\n\t{title}\n</h3>'
+    '<span class="c-label a-no-trucate a-font-primary-s lrv-u-font-size-14@mobile-max">\n\t{credits}\n</span></li>'
+    '<li>{extras}</li>'
+    '{meaningful}'
+    '</ul></div>'
+)
+EXTRA = '<span class="c-label  u-font-family-secondary">{value}</span>'
+MEANINGFUL = (
+    '<li><span class="c-label  a-font-secondary-fancy-xxl">{debut_position}</span>'
+    '<span class="c-label  a-font-secondary-fancy-xxl">{peak}</span>'
+    '<a class="c-label__link lrv-u-color-grey-lightest" href="#">{debut_date}</a>'
+    '<a class="c-label__link lrv-u-color-grey-lightest" href="#">{peak_date}</a></li>'
+)
+
+WORDS = ["love", "night", "heart", "baby", "dance", "fire", "summer", "blue",
+         "rain", "gold", "home", "wild", "dream", "city", "light", "road"]
+ARTISTS = ["The Rivers", "Ana Sol", "Marcus Lane", "Del Ray Trio", "Kiko",
+           "Jules Arden", "The Night Owls", "Perez Vega", "Lia Monroe", "DJ Harbor"]
+
+
+def get_fixture_path(chart: str,
+                     date: datetime.date,
+                     folder: str = FIXTURES_FOLDER):
+    """
+    Returns the path of the saved page of a chart.
+
+    Parameters:
+        - chart: Link of the chart
+        - date: Date of the chart
+        - folder: Folder of the corpus
+    """
+    return os.path.join(folder, f"{chart}-{date.isoformat()}{FIXTURE_EXTENSION}")
+
+
+def build_card(rng: random.Random,
+               position: int,
+               date: datetime.date,
+               entries: int) -> str:
+    """
+    Returns the html of an entry card.
+
+    Parameters:
+        - rng: Random generator of the page
+        - position: Position of the entry
+        - date: Date of the chart
+        - entries: Amount of entries in the chart
+    """
+    title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3))).title()
+    credits = rng.choice(ARTISTS)
+    if rng.random() < 0.3:
+        credits = f"{credits} Featuring {rng.choice(ARTISTS)}"
+
+    weeks = 1 if rng.random() < 0.1 else rng.randint(2, 40)
+    image = NO_IMAGE_URL if date.year < 1990 else IMAGE_URL.format(year=date.year, i=position)
+
+    if weeks == 1:
+        extras = ["-", position, 1]
+        meaningful = ""
+    else:
+        peak = rng.randint(1, position)
+        last_week = "-" if rng.random() < 0.05 else max(1, min(entries, position + rng.randint(-5, 5)))
+        extras = [last_week, peak, weeks]
+        debut_date = date - WEEK * (weeks - 1)
+        peak_date = date - WEEK * rng.randint(0, weeks - 1)
+        meaningful = MEANINGFUL.format(debut_position=rng.randint(peak, entries),
+                                       peak=peak,
+                                       debut_date=debut_date.strftime("%m/%d/%y"),
+                                       peak_date=peak_date.strftime("%m/%d/%y"))
+
+    # The page repeats the extra values for the mobile layout
+    extras = "".join(EXTRA.format(value=value) for value in extras * 2)
+
+    return CARD.format(position=position,
+                       image=image,
+                       title=title,
+                       credits=credits,
+                       extras=extras,
+                       meaningful=meaningful)
+
+
+def build_page(chart: str,
+               date: datetime.date,
+               entries: int,
+               head_tags: int) -> str:
+    """
+    Returns the html of a chart page.
+
+    Parameters:
+        - chart: Link of the chart
+        - date: Date of the chart
+        - entries: Amount of entries in the chart
+        - head_tags: Amount of tags before the chart
+    """
+    rng = random.Random(f"{chart}/{date.isoformat()}")
+
+    head = "".join(HEAD_TAG.format(name=f"meta-{i}", i=i) for i in range(head_tags))
+    cards = "".join(build_card(rng, position, date, entries) for position in range(1, entries + 1))
+
+    return (f"<!DOCTYPE html><html><head><title>{chart}</title>{head}</head><body>"
+            f"{DATE_PICKER.format(date=date.isoformat())}"
+            f"<div class=\"chart-results-list\">{cards}</div>"
+            f"</body></html>")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--folder", default=FIXTURES_FOLDER)
+    args = parser.parse_args()
+
+    os.makedirs(args.folder, exist_ok=True)
+
+    for chart, date, entries, head_tags in CORPUS:
+        path = get_fixture_path(chart, date, args.folder)
+        page = build_page(chart, date, entries, head_tags)
+        with open(path, "wb") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+                f.write(page.encode("utf-8"))
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
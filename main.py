@@ -1,5 +1,3 @@
-import json
-
 from src.reader.website import BillboardChartWebsite
 
 import datetime
@@ -1,10 +1,13 @@
 from typing import Optional
 
 import json
+import pickle
 
 import os
+import threading
 
 from .chart_data import ChartData
+from .chart_search import ChartSearch
 
 CHARTS_FOLDER = os.path.dirname(__file__)
 SRC_FOLDER = os.path.dirname(CHARTS_FOLDER)
@@ -17,11 +20,21 @@ NAME_FIELD = "name"
 LINK_FIELD = "url"
 
 
+def normalize_key(key: str):
+    """
+    Returns the form in which chart keys are compared.
+
+    Parameters:
+        - key: Abbreviation, name or link of a chart
+    """
+    return key.strip().upper()
+
+
 class ChartsIndex():
     def __init__(self,
                  file: str):
         if not os.path.isfile(file):
-            raise OSError(f"Charts File Doesn't Exist")
+            raise OSError("Charts File Doesn't Exist")
 
         self.file = file
         with open(file) as f:
@@ -41,10 +54,18 @@ class ChartsIndex():
         self.charts_by_link = {}
 
         for i, chart in enumerate(self.charts):
-            self.charts_by_abbr[chart.abbreviation] = i
-            self.charts_by_name[chart.name.upper()] = i
+            self.charts_by_abbr[normalize_key(chart.abbreviation)] = i
+            self.charts_by_name[normalize_key(chart.name)] = i
             if chart.link:
-                self.charts_by_link[chart.link.upper()] = i
+                self.charts_by_link[normalize_key(chart.link)] = i
+
+        # Abbreviations win over names and names over links
+        self.charts_by_key = {}
+        self.charts_by_key.update(self.charts_by_link)
+        self.charts_by_key.update(self.charts_by_name)
+        self.charts_by_key.update(self.charts_by_abbr)
+
+        self.searcher = None
 
     def get_chart(self,
                   key: str):
@@ -54,23 +75,66 @@ class ChartsIndex():
         Parameters:
             - key: String identifying the chart
         """
-        position = None
-
         if not isinstance(key, str):
             raise TypeError(f"Key For Chart Index Must Be A String [{type(key)}]")
 
-        key = key.upper()
-        if key in self.charts_by_abbr:
-            position = self.charts_by_abbr[key]
-        elif key in self.charts_by_name:
-            position = self.charts_by_name[key]
-        elif key in self.charts_by_link:
-            position = self.charts_by_link[key]
-        else:
+        key = normalize_key(key)
+        position = self.charts_by_key.get(key)
+        if position is None:
             raise KeyError(f"{key} Key Couldn't Be Found")
 
         return self.charts[position]
 
+    def search(self,
+               query: str,
+               limit: int = 10):
+        """
+        Returns the charts that best match a partial or misspelled
+        query, as a list of (score, chart) sorted from the best match.
+
+        Parameters:
+            - query: Text to look for in the abbreviations, names and
+                links
+            - limit: Maximum amount of charts to return
+        """
+        if self.searcher is None:
+            self.searcher = ChartSearch(self.charts)
+
+        return self.searcher.search(query, limit)
+
+    def get_fetchable(self):
+        """
+        Returns the charts that have a link, so can be fetched
+        """
+        return [chart for chart in self.charts if chart.link]
+
+    def get_unfetchable(self):
+        """
+        Returns the charts without a link, which can't be fetched
+        """
+        return [chart for chart in self.charts if not chart.link]
+
+    def save_snapshot(self,
+                      snapshot: str):
+        """
+        Stores a pickled copy of the index, to be loaded by get_index
+        instead of parsing the charts file again.
+
+        Parameters:
+            - snapshot: Path of the snapshot file
+        """
+        temp_path = f"{snapshot}.tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump((os.path.getmtime(self.file), self), f)
+
+        os.replace(temp_path, snapshot)
+
+    def __getstate__(self) -> dict:
+        # The searcher is derived from the charts, so it isn't stored
+        state = dict(self.__dict__)
+        state["searcher"] = None
+        return state
+
     def __getitem__(self,
                     key: str):
         return self.get_chart(key)
@@ -83,3 +147,65 @@ class ChartsIndex():
 
     def __str__(self):
         return f"ChartsIndex(file={self.file} | Items: {len(self.charts)})"
+
+
+LOADED_INDEXES = {}
+LOADED_INDEXES_LOCK = threading.Lock()
+
+
+def load_snapshot(snapshot: Optional[str],
+                  mtime: float) -> Optional[ChartsIndex]:
+    """
+    Returns the index stored in a snapshot, or None if there is no
+    snapshot or it is older than the charts file.
+
+    Parameters:
+        - snapshot: Path of the snapshot file
+        - mtime: Modification time of the charts file
+    """
+    if snapshot is None or not os.path.isfile(snapshot):
+        return None
+
+    try:
+        with open(snapshot, "rb") as f:
+            snapshot_mtime, index = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+
+    if snapshot_mtime != mtime or not isinstance(index, ChartsIndex):
+        return None
+
+    return index
+
+
+def get_index(file: str,
+              snapshot: Optional[str] = None) -> ChartsIndex:
+    """
+    Returns the index of a charts file, shared by the whole process. It
+    is built on the first call and only built again when the file
+    changes.
+
+    Parameters:
+        - file: Path of the charts file
+        - snapshot: Path of a snapshot saved with save_snapshot, used
+            instead of parsing the file while it is up to date
+    """
+    try:
+        mtime = os.stat(file).st_mtime
+    except OSError:
+        raise OSError("Charts File Doesn't Exist")
+
+    with LOADED_INDEXES_LOCK:
+        loaded = LOADED_INDEXES.get(file)
+        if loaded is not None and loaded[0] == mtime:
+            return loaded[1]
+
+        index = load_snapshot(snapshot, mtime)
+        if index is None:
+            index = ChartsIndex(file)
+            if snapshot is not None:
+                index.save_snapshot(snapshot)
+
+        LOADED_INDEXES[file] = (mtime, index)
+
+    return index
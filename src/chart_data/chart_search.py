@@ -0,0 +1,148 @@
+from typing import Dict, List, Set, Tuple
+
+import re
+
+from .chart_data import ChartData
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+EXACT_SCORE = 2.0
+PREFIX_WEIGHT = 0.5
+MIN_SCORE = 0.1
+
+
+def get_words(text: str) -> List[str]:
+    """
+    Returns the lower cased words of a text.
+
+    Parameters:
+        - text: Text to split
+    """
+    return WORD_PATTERN.findall(text.lower())
+
+
+def get_trigrams(text: str) -> Set[str]:
+    """
+    Returns the set of three letter slices of the words of a text,
+    padded so short words still have trigrams. The words joined
+    together are sliced too, so missing spaces still match.
+
+    Parameters:
+        - text: Text to slice
+    """
+    words = get_words(text)
+
+    trigrams = set()
+    for word in words + ["".join(words)]:
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            trigrams.add(padded[i:i + 3])
+
+    return trigrams
+
+
+def get_texts(chart: ChartData) -> List[str]:
+    """
+    Returns the texts a chart can be searched by.
+
+    Parameters:
+        - chart: Chart to read
+    """
+    texts = [chart.abbreviation, chart.name]
+    if chart.link:
+        texts.append(chart.link)
+
+    return texts
+
+
+class ChartSearch():
+    def __init__(self,
+                 charts: List[ChartData]) -> None:
+        """
+        Trigram and word prefix index over the charts names,
+        abbreviations and links, for partial or misspelled queries.
+
+        Parameters:
+            - charts: Charts to index
+        """
+        self.charts = charts
+        self.trigrams_by_chart = []
+        self.words_by_chart = []
+        self.exact_keys = {}
+        self.charts_by_trigram: Dict[str, List[int]] = {}
+
+        for i, chart in enumerate(charts):
+            trigrams = set()
+            words = set()
+            for text in get_texts(chart):
+                trigrams |= get_trigrams(text)
+                words.update(get_words(text))
+                self.exact_keys.setdefault(" ".join(get_words(text)), i)
+
+            self.trigrams_by_chart.append(trigrams)
+            self.words_by_chart.append(words)
+            for trigram in trigrams:
+                self.charts_by_trigram.setdefault(trigram, []).append(i)
+
+    def get_prefix_score(self,
+                         query_words: List[str],
+                         position: int) -> float:
+        """
+        Returns the share of query words that start a word of the chart.
+
+        Parameters:
+            - query_words: Words of the query
+            - position: Position of the chart
+        """
+        if len(query_words) == 0:
+            return 0
+
+        chart_words = self.words_by_chart[position]
+        matches = 0
+        for query_word in query_words:
+            if any(word.startswith(query_word) for word in chart_words):
+                matches += 1
+
+        return matches / len(query_words)
+
+    def search(self,
+               query: str,
+               limit: int = 10) -> List[Tuple[float, ChartData]]:
+        """
+        Returns the charts that best match the query, as a list of
+        (score, chart) sorted from the best match.
+
+        Parameters:
+            - query: Partial or misspelled abbreviation, name or link
+            - limit: Maximum amount of charts to return
+        """
+        query_words = get_words(query)
+        query_trigrams = get_trigrams(query)
+
+        shared = {}
+        for trigram in query_trigrams:
+            for position in self.charts_by_trigram.get(trigram, ()):
+                shared[position] = shared.get(position, 0) + 1
+
+        scores = {}
+        for position, count in shared.items():
+            total = len(query_trigrams) + len(self.trigrams_by_chart[position]) - count
+            similarity = count / total
+            prefix = self.get_prefix_score(query_words, position)
+            scores[position] = similarity + PREFIX_WEIGHT * prefix
+
+        exact = self.exact_keys.get(" ".join(query_words))
+        if exact is not None:
+            scores[exact] = EXACT_SCORE
+
+        ranked = sorted(((score, position) for position, score in scores.items()
+                         if score >= MIN_SCORE),
+                        key=lambda match: (-match[0], match[1]))
+
+        return [(score, self.charts[position]) for score, position in ranked[:limit]]
+
+    def __repr__(self) -> str:
+        return f"ChartSearch(Charts: {len(self.charts)} | Trigrams: {len(self.charts_by_trigram)})"
+
+    def __str__(self) -> str:
+        return f"ChartSearch(Charts: {len(self.charts)} | Trigrams: {len(self.charts_by_trigram)})"
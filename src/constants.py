@@ -6,4 +6,13 @@ DATA_FOLDER = os.path.join(PACKAGE_FOLDER, "data")
 
 CHARTS_FILE = os.path.join(DATA_FOLDER, "charts.json")
 
-BILLBOARD_URL = "https://www.billboard.com"
\ No newline at end of file
+BILLBOARD_URL = "https://www.billboard.com"
+
+# The cache lives in the user cache directory, unless the variable
+# points somewhere else
+CACHE_FOLDER_VARIABLE = "BILLBOARD_CACHE_FOLDER"
+USER_CACHE_FOLDER = (os.environ.get("XDG_CACHE_HOME")
+                     or os.environ.get("LOCALAPPDATA")
+                     or os.path.join(os.path.expanduser("~"), ".cache"))
+
+CACHE_FOLDER = os.environ.get(CACHE_FOLDER_VARIABLE) or os.path.join(USER_CACHE_FOLDER, "billboard")
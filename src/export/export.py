@@ -0,0 +1,144 @@
+from typing import Iterable, Optional
+
+from itertools import islice
+
+import importlib
+
+from ..records.chart_item import ChartItem
+from .rows import iter_history_rows, iter_item_rows
+from .writers import ExportWriter, get_compression
+
+# {format: (module, class)}, imported on first use so Parquet only
+# needs pyarrow when selected
+WRITERS = {
+    "ndjson": ("writers", "NdjsonWriter"),
+    "csv": ("writers", "CsvWriter"),
+    "parquet": ("parquet_writer", "ParquetWriter"),
+}
+FORMAT_EXTENSIONS = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv", ".parquet": "parquet"}
+
+BATCH_SIZE = 10000
+
+
+def get_format(file: str) -> str:
+    """
+    Returns the export format matching the extension of a file,
+    ignoring the compression one.
+
+    Parameters:
+        - file: Path of the file
+    """
+    name = file
+    compression = get_compression(file)
+    if compression is not None:
+        name = name[:name.rfind(".")]
+
+    for extension, format in FORMAT_EXTENSIONS.items():
+        if name.endswith(extension):
+            return format
+
+    raise ValueError(f"Unknown Export Format [{file}] (Options: {', '.join(FORMAT_EXTENSIONS)})")
+
+
+def get_writer(file: str,
+               format: Optional[str] = None,
+               compression: Optional[str] = None) -> ExportWriter:
+    """
+    Returns a writer for the file.
+
+    Parameters:
+        - file: Path of the file
+        - format: Format of the file, one of WRITERS. If None, it is
+            taken from the file extension
+        - compression: Compression of the file. If None, text formats
+            take it from the file extension
+    """
+    format = get_format(file) if format is None else format
+    if format not in WRITERS:
+        raise ValueError(f"Unknown Export Format [{format}] (Options: {', '.join(WRITERS)})")
+
+    if compression is None and format != "parquet":
+        compression = get_compression(file)
+
+    module_name, class_name = WRITERS[format]
+    module = importlib.import_module(f"{__package__}.{module_name}")
+
+    return getattr(module, class_name)(file, compression)
+
+
+def write_rows(writer: ExportWriter,
+               rows: Iterable[tuple],
+               batch_size: int = BATCH_SIZE) -> int:
+    """
+    Writes the rows in batches, so only one batch is held at a time.
+    Returns the amount of rows written.
+
+    Parameters:
+        - writer: Writer of the file
+        - rows: Rows to write
+        - batch_size: Rows written at a time
+    """
+    rows = iter(rows)
+    written = 0
+
+    while True:
+        batch = list(islice(rows, batch_size))
+        if len(batch) == 0:
+            return written
+
+        writer.write_rows(batch)
+        written += len(batch)
+
+
+def export_items(items: Iterable[ChartItem],
+                 file: str,
+                 format: Optional[str] = None,
+                 compression: Optional[str] = None,
+                 batch_size: int = BATCH_SIZE) -> int:
+    """
+    Streams chart items, like the ones of get_items, to a file. Returns
+    the amount of rows written.
+
+    Parameters:
+        - items: Items to export
+        - file: Path of the file
+        - format: Format of the file, one of WRITERS. If None, it is
+            taken from the file extension
+        - compression: Compression of the file. If None, text formats
+            take it from the file extension
+        - batch_size: Rows written at a time
+    """
+    with get_writer(file, format, compression) as writer:
+        return write_rows(writer, iter_item_rows(items, writer.TEXT_DATES), batch_size)
+
+
+def export_history(history,
+                   file: str,
+                   format: Optional[str] = None,
+                   compression: Optional[str] = None,
+                   batch_size: int = BATCH_SIZE,
+                   start: int = 0,
+                   end: Optional[int] = None) -> int:
+    """
+    Streams the rows of a chart history to a file, reading the stored
+    columns without building chart items. Returns the amount of rows
+    written.
+
+    Parameters:
+        - history: ChartHistory read from a chart store
+        - file: Path of the file
+        - format: Format of the file, one of WRITERS. If None, it is
+            taken from the file extension
+        - compression: Compression of the file. If None, text formats
+            take it from the file extension
+        - batch_size: Rows written at a time
+        - start: First row
+        - end: End row, not included. If None, up to the last row
+    """
+    with get_writer(file, format, compression) as writer:
+        if writer.COLUMNAR:
+            end = history.rows if end is None else end
+            return writer.write_history(history, start, end, batch_size)
+
+        rows = iter_history_rows(history, start, end, writer.TEXT_DATES)
+        return write_rows(writer, rows, batch_size)
@@ -0,0 +1,126 @@
+from typing import List, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..records.analytics import EPOCH_ORDINAL
+from ..records.columns import NULL_DATE, NULL_INT, NULL_STRING
+from .rows import FIELDS, DATE_FIELDS, STRING_FIELDS
+from .writers import ExportWriter
+
+# Int fields stored as NULL_INT when missing
+OPTIONAL_INT_FIELDS = ("last_week", "debut_position")
+
+DEFAULT_COMPRESSION = "snappy"
+
+
+def get_schema() -> pa.Schema:
+    """
+    Returns the schema of the exported rows
+    """
+    fields = []
+    for name in FIELDS:
+        if name in DATE_FIELDS:
+            fields.append(pa.field(name, pa.date32()))
+        elif name in STRING_FIELDS:
+            fields.append(pa.field(name, pa.string()))
+        else:
+            fields.append(pa.field(name, pa.int32()))
+
+    return pa.schema(fields)
+
+
+def get_strings_table(history) -> pa.Array:
+    """
+    Returns the strings table of a chart history as an Arrow array,
+    built over its mapped offsets and bytes without copying them.
+
+    Parameters:
+        - history: ChartHistory read from a chart store
+    """
+    offsets = history.string_offsets
+    if len(offsets) == 0:
+        return pa.array([], type=pa.large_string())
+
+    return pa.Array.from_buffers(pa.large_string(),
+                                 len(offsets) - 1,
+                                 [None, pa.py_buffer(offsets), pa.py_buffer(history.strings)])
+
+
+def get_column_array(values: np.ndarray,
+                     field: pa.Field,
+                     strings: pa.Array) -> pa.Array:
+    """
+    Returns the Arrow array of a slice of a stored column.
+
+    Parameters:
+        - values: Stored int32 values of the column
+        - field: Field of the column in the schema
+        - strings: Strings table the string ids point at
+    """
+    name = field.name
+    if name in DATE_FIELDS:
+        days = values - EPOCH_ORDINAL
+        return pa.array(days, mask=values == NULL_DATE).cast(pa.date32())
+
+    if name in STRING_FIELDS:
+        ids = pa.array(values, mask=values == NULL_STRING)
+        return strings.take(ids).cast(pa.string())
+
+    if name in OPTIONAL_INT_FIELDS:
+        return pa.array(values, mask=values == NULL_INT)
+
+    return pa.array(values)
+
+
+class ParquetWriter(ExportWriter):
+    TEXT_DATES = False
+    COLUMNAR = True
+
+    def __init__(self,
+                 file: str,
+                 compression: Optional[str] = None) -> None:
+        """
+        Writes the rows as a Parquet file, one row group per batch.
+
+        Parameters:
+            - file: Path of the file
+            - compression: Parquet compression codec, like snappy, gzip
+                or zstd. If None, snappy
+        """
+        super().__init__(file, compression)
+        self.schema = get_schema()
+        self.writer = pq.ParquetWriter(file,
+                                       self.schema,
+                                       compression=compression or DEFAULT_COMPRESSION)
+
+    def write_rows(self,
+                   rows: List[tuple]):
+        if len(rows) == 0:
+            return
+
+        columns = [pa.array(values, type=field.type)
+                   for values, field in zip(zip(*rows), self.schema)]
+        self.writer.write_table(pa.Table.from_arrays(columns, schema=self.schema))
+        self.rows += len(rows)
+
+    def write_history(self,
+                      history,
+                      start: int,
+                      end: int,
+                      batch_size: int) -> int:
+        strings = get_strings_table(history)
+        columns = [np.frombuffer(history.column(field.name), dtype=np.int32) for field in self.schema]
+
+        for batch_start in range(start, end, batch_size):
+            batch_end = min(batch_start + batch_size, end)
+            arrays = [get_column_array(values[batch_start:batch_end], field, strings)
+                      for values, field in zip(columns, self.schema)]
+            self.writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+            self.rows += batch_end - batch_start
+
+        return max(end - start, 0)
+
+    def close(self):
+        self.writer.close()
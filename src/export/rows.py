@@ -0,0 +1,128 @@
+from typing import Iterable, Iterator, Optional
+
+from functools import lru_cache
+
+import datetime
+
+from ..records.chart_item import ChartItem
+from ..records.columns import NULL_DATE, NULL_INT
+
+# Exported fields, in the order of ChartItem.to_dict
+FIELDS = ("position", "title", "image", "last_week", "peak", "weeks",
+          "debut_date", "debut_position", "peak_date", "date", "credits")
+INT_FIELDS = ("position", "last_week", "peak", "weeks", "debut_position")
+DATE_FIELDS = ("debut_date", "peak_date", "date")
+STRING_FIELDS = ("title", "image", "credits")
+
+# A full chart history has a few thousand distinct weeks
+DATES_CACHE_SIZE = 16384
+STRINGS_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=DATES_CACHE_SIZE)
+def get_date_text(date: Optional[datetime.date]) -> Optional[str]:
+    """
+    Returns the ISO text of a date, formatting each date only once.
+
+    Parameters:
+        - date: Date to format, or None
+    """
+    return None if date is None else date.isoformat()
+
+
+@lru_cache(maxsize=DATES_CACHE_SIZE)
+def get_ordinal_date(ordinal: int) -> Optional[datetime.date]:
+    """
+    Returns the date of a stored day ordinal, building each date only
+    once.
+
+    Parameters:
+        - ordinal: Stored day ordinal
+    """
+    return None if ordinal == NULL_DATE else datetime.date.fromordinal(ordinal)
+
+
+@lru_cache(maxsize=DATES_CACHE_SIZE)
+def get_ordinal_text(ordinal: int) -> Optional[str]:
+    """
+    Returns the ISO text of a stored day ordinal, formatting each date
+    only once.
+
+    Parameters:
+        - ordinal: Stored day ordinal
+    """
+    return None if ordinal == NULL_DATE else datetime.date.fromordinal(ordinal).isoformat()
+
+
+def iter_item_rows(items: Iterable[ChartItem],
+                   text_dates: bool = True) -> Iterator[tuple]:
+    """
+    Yields the values of every item, in the order of FIELDS.
+
+    Parameters:
+        - items: Items to export
+        - text_dates: If True, dates are given as ISO text, otherwise as
+            dates
+    """
+    date_value = get_date_text if text_dates else None
+
+    for item in items:
+        debut_date = item.debut_date
+        peak_date = item.peak_date
+        date = item.date
+        if date_value is not None:
+            debut_date = date_value(debut_date)
+            peak_date = date_value(peak_date)
+            date = date_value(date)
+
+        yield (item.position, item.title, item.image, item.last_week, item.peak, item.weeks,
+               debut_date, item.debut_position, peak_date, date, item.credits)
+
+
+def iter_history_rows(history,
+                      start: int = 0,
+                      end: Optional[int] = None,
+                      text_dates: bool = True) -> Iterator[tuple]:
+    """
+    Yields the values of the rows of a chart history, in the order of
+    FIELDS, read straight from its columns without building items.
+
+    Parameters:
+        - history: ChartHistory read from a chart store
+        - start: First row
+        - end: End row, not included. If None, up to the last row
+        - text_dates: If True, dates are given as ISO text, otherwise as
+            dates
+    """
+    end = history.rows if end is None else end
+    date_value = get_ordinal_text if text_dates else get_ordinal_date
+    get_string = lru_cache(maxsize=STRINGS_CACHE_SIZE)(history.get_string)
+
+    columns = {name: history.column(name) for name in FIELDS}
+    position = columns["position"]
+    title = columns["title"]
+    image = columns["image"]
+    last_week = columns["last_week"]
+    peak = columns["peak"]
+    weeks = columns["weeks"]
+    debut_date = columns["debut_date"]
+    debut_position = columns["debut_position"]
+    peak_date = columns["peak_date"]
+    date = columns["date"]
+    credits = columns["credits"]
+
+    for row in range(start, end):
+        last = last_week[row]
+        debut = debut_position[row]
+
+        yield (position[row],
+               get_string(title[row]),
+               get_string(image[row]),
+               None if last == NULL_INT else last,
+               peak[row],
+               weeks[row],
+               date_value(debut_date[row]),
+               None if debut == NULL_INT else debut,
+               date_value(peak_date[row]),
+               date_value(date[row]),
+               get_string(credits[row]))
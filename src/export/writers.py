@@ -0,0 +1,208 @@
+from typing import List, Optional
+
+from functools import lru_cache
+
+import bz2
+import csv
+import gzip
+import json
+import lzma
+
+from .rows import FIELDS
+
+BUFFER_SIZE = 1024 * 1024
+GZIP_LEVEL = 6
+STRINGS_CACHE_SIZE = 65536
+
+# {compression: opener}
+COMPRESSIONS = {
+    "gzip": lambda file: gzip.open(file, "wt", compresslevel=GZIP_LEVEL, encoding="utf-8", newline=""),
+    "bz2": lambda file: bz2.open(file, "wt", encoding="utf-8", newline=""),
+    "xz": lambda file: lzma.open(file, "wt", encoding="utf-8", newline=""),
+}
+COMPRESSION_EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+
+
+def get_compression(file: str) -> Optional[str]:
+    """
+    Returns the compression matching the extension of a file, None if
+    it has none.
+
+    Parameters:
+        - file: Path of the file
+    """
+    for extension, compression in COMPRESSION_EXTENSIONS.items():
+        if file.endswith(extension):
+            return compression
+
+    return None
+
+
+def open_output(file: str,
+                compression: Optional[str] = None):
+    """
+    Opens a buffered text file for writing, compressed or not.
+
+    Parameters:
+        - file: Path of the file
+        - compression: Compression of the file, one of COMPRESSIONS. If
+            None, the file is written as is
+    """
+    if compression is None:
+        return open(file, "w", buffering=BUFFER_SIZE, encoding="utf-8", newline="")
+
+    opener = COMPRESSIONS.get(compression)
+    if opener is None:
+        raise ValueError(f"Unknown Compression [{compression}] (Options: {', '.join(COMPRESSIONS)})")
+
+    return opener(file)
+
+
+@lru_cache(maxsize=STRINGS_CACHE_SIZE)
+def encode_string(value: str) -> str:
+    """
+    Returns the JSON of a string, encoding each repeated title or
+    credit only once.
+
+    Parameters:
+        - value: String to encode
+    """
+    return json.dumps(value, ensure_ascii=False)
+
+
+def encode_value(value) -> str:
+    """
+    Returns the JSON of an exported value.
+
+    Parameters:
+        - value: Integer, text or None
+    """
+    if value is None:
+        return "null"
+
+    if type(value) is int:
+        return str(value)
+
+    return encode_string(value)
+
+
+class ExportWriter():
+    # Whether the rows given to write_rows have their dates as ISO text
+    TEXT_DATES = True
+    # Whether a chart history is written straight from its columns,
+    # through write_history, instead of row by row
+    COLUMNAR = False
+
+    def __init__(self,
+                 file: str,
+                 compression: Optional[str] = None) -> None:
+        """
+        Writes exported rows to a file, batch by batch.
+
+        Parameters:
+            - file: Path of the file
+            - compression: Compression of the file
+        """
+        self.file = file
+        self.compression = compression
+        self.rows = 0
+
+    def write_rows(self,
+                   rows: List[tuple]):
+        """
+        Writes a batch of rows, with the values in the order of FIELDS.
+
+        Parameters:
+            - rows: Rows to write
+        """
+        raise NotImplementedError
+
+    def write_history(self,
+                      history,
+                      start: int,
+                      end: int,
+                      batch_size: int):
+        """
+        Writes the rows of a chart history from its stored columns, in
+        batches. Only used by writers marked as COLUMNAR. Returns the
+        amount of rows written.
+
+        Parameters:
+            - history: ChartHistory read from a chart store
+            - start: First row
+            - end: End row, not included
+            - batch_size: Rows written at a time
+        """
+        raise NotImplementedError
+
+    def close(self):
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(file={self.file} | Rows: {self.rows})"
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}(file={self.file} | Rows: {self.rows})"
+
+
+class NdjsonWriter(ExportWriter):
+    def __init__(self,
+                 file: str,
+                 compression: Optional[str] = None) -> None:
+        """
+        Writes one JSON object per line, with the keys of
+        ChartItem.to_dict.
+
+        Parameters:
+            - file: Path of the file
+            - compression: Compression of the file, one of COMPRESSIONS
+        """
+        super().__init__(file, compression)
+        self.keys = [f"{json.dumps(field)}:" for field in FIELDS]
+        self.output = open_output(file, compression)
+
+    def write_rows(self,
+                   rows: List[tuple]):
+        keys = self.keys
+        lines = []
+        for row in rows:
+            values = ",".join([key + encode_value(value) for key, value in zip(keys, row)])
+            lines.append(f"{{{values}}}\n")
+
+        self.output.write("".join(lines))
+        self.rows += len(rows)
+
+    def close(self):
+        self.output.close()
+
+
+class CsvWriter(ExportWriter):
+    def __init__(self,
+                 file: str,
+                 compression: Optional[str] = None) -> None:
+        """
+        Writes the rows as CSV, headed by the field names. Missing
+        values are left empty.
+
+        Parameters:
+            - file: Path of the file
+            - compression: Compression of the file, one of COMPRESSIONS
+        """
+        super().__init__(file, compression)
+        self.output = open_output(file, compression)
+        self.writer = csv.writer(self.output)
+        self.writer.writerow(FIELDS)
+
+    def write_rows(self,
+                   rows: List[tuple]):
+        self.writer.writerows(rows)
+        self.rows += len(rows)
+
+    def close(self):
+        self.output.close()
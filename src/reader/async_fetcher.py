@@ -0,0 +1,130 @@
+from typing import Optional
+
+from urllib.parse import urlsplit
+
+import asyncio
+
+import aiohttp
+
+from .exceptions import ConnectionError
+from .fetcher import DEFAULT_WORKERS, DEFAULT_TIMEOUT, DEFAULT_RETRIES, DEFAULT_BACKOFF, DEFAULT_RATE
+from .fetcher import RETRY_STATUSES, RETRY_AFTER_HEADER, HostRateLimiter
+
+
+class AsyncChartFetcher():
+    def __init__(self,
+                 workers: int = DEFAULT_WORKERS,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF,
+                 rate: Optional[float] = DEFAULT_RATE) -> None:
+        """
+        Fetches pages without blocking the event loop, over a pooled
+        aiohttp session, with retries, a cap on concurrent requests and
+        the per host rate limit of ChartFetcher. The session is opened
+        on the first fetch, inside the running loop.
+
+        Parameters:
+            - workers: Amount of requests that can run at the same time
+            - timeout: Seconds to wait for a response
+            - retries: Times a failed request is retried
+            - backoff: Base seconds to wait between retries, doubled on
+                each attempt
+            - rate: Maximum requests per second for each host
+        """
+        self.workers = workers
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.limiter = HostRateLimiter(rate)
+
+        self.session = None
+        self.semaphore = None
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the session, opening it if needed
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.workers)
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            self.semaphore = asyncio.Semaphore(self.workers)
+
+        return self.session
+
+    def get_delay(self,
+                  attempt: int,
+                  retry_after: Optional[str] = None):
+        """
+        Returns the seconds to wait before retrying.
+
+        Parameters:
+            - attempt: Number of the attempt that failed, starting at 0
+            - retry_after: Retry-After header of the failed response
+        """
+        if retry_after and retry_after.isdigit():
+            return int(retry_after)
+
+        return self.backoff * (2 ** attempt)
+
+    async def fetch(self,
+                    url: str) -> str:
+        """
+        Returns the decoded body of the url, retrying on connection
+        errors and on 429/5xx responses.
+
+        Parameters:
+            - url: Url to fetch
+        """
+        session = self.get_session()
+        host = urlsplit(url).netloc
+
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+
+            delay = self.limiter.reserve(host)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            try:
+                async with self.semaphore:
+                    async with session.get(url) as response:
+                        status = response.status
+                        reason = response.reason
+                        retry_after = response.headers.get(RETRY_AFTER_HEADER)
+                        body = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if last_attempt:
+                    raise ConnectionError(f"Could Not Connect To The Base Website [URL: {url} | Reason: {e}]")
+                await asyncio.sleep(self.get_delay(attempt))
+                continue
+
+            if status in RETRY_STATUSES and not last_attempt:
+                await asyncio.sleep(self.get_delay(attempt, retry_after))
+                continue
+
+            if status // 100 != 2:
+                raise ConnectionError(f"Could Not Connect To The Base Website [URL: {url} | Reason: {reason}]")
+
+            return body.decode("utf-8")
+
+    async def close(self):
+        """
+        Closes the pooled connections
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def __repr__(self) -> str:
+        return f"AsyncChartFetcher(Workers: {self.workers} | Retries: {self.retries})"
+
+    def __str__(self) -> str:
+        return f"AsyncChartFetcher(Workers: {self.workers} | Retries: {self.retries})"
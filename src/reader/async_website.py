@@ -0,0 +1,171 @@
+from typing import AsyncIterator, List, Optional, Union
+
+from concurrent.futures import Executor
+
+import asyncio
+import datetime
+
+from ..records.chart_item import ChartItem
+from .async_fetcher import AsyncChartFetcher
+from .cache import ChartDateCache, HtmlCache
+from .instrumentation import Metrics, measure, FETCH_STAGE
+from .parsers.base import ParserBackend
+from .website import BillboardChartWebsite
+
+END_OF_ITEMS = object()
+
+
+class AsyncBillboardChartWebsite():
+    def __init__(self,
+                 chart: str,
+                 date: Optional[datetime.date] = None,
+                 yearly: bool = False,
+                 fetcher: Optional[AsyncChartFetcher] = None,
+                 cache: Optional[HtmlCache] = None,
+                 date_cache: Optional[ChartDateCache] = None,
+                 executor: Optional[Executor] = None,
+                 parser: Optional[Union[str, ParserBackend]] = None,
+                 metrics: Optional[Metrics] = None) -> None:
+        """
+        Asyncio counterpart of BillboardChartWebsite. The page is
+        fetched without blocking the loop and parsed in an executor by
+        the wrapped BillboardChartWebsite.
+
+        Parameters:
+            - chart: Key of the chart
+            - date: Date of the chart. If None, the current chart
+            - yearly: Whether the chart is a yearly one
+            - fetcher: Async fetcher to use. Share one between websites
+                to share its connection pool. If None, the website opens
+                its own, closed by close or when leaving an async with
+            - cache: Pages cache to use, the shared one if None
+            - date_cache: Chart dates cache to use, the shared one if
+                None
+            - executor: Executor where the parsing runs, the loop
+                default one if None
+            - parser: Parser backend, or its name. If None, the default
+                one
+            - metrics: Metrics where the measures are recorded. If
+                None, the shared ones
+        """
+        self.website = BillboardChartWebsite(chart, date, yearly,
+                                             cache=cache,
+                                             date_cache=date_cache,
+                                             parser=parser,
+                                             metrics=metrics)
+        self.own_fetcher = fetcher is None
+        self.fetcher = fetcher if fetcher is not None else AsyncChartFetcher()
+        self.executor = executor
+
+    @property
+    def chart(self):
+        return self.website.chart
+
+    @property
+    def date(self):
+        return self.website.date
+
+    async def run(self,
+                  function,
+                  *args):
+        """
+        Runs a blocking function in the executor.
+
+        Parameters:
+            - function: Function to run
+            - args: Arguments of the function
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    async def get_html(self) -> str:
+        """
+        Returns the html code of the chart, requesting the Billboard
+        website only if the page isn't cached
+        """
+        website = self.website
+        if website.html is not None:
+            return website.html
+
+        html = await self.run(website.get_cached_html)
+        if html is None:
+            chart = website.chart
+            with measure(website.metrics, FETCH_STAGE, chart=chart.link):
+                html = await self.fetcher.fetch(chart.get_url(website.date))
+            await self.run(website.cache_downloaded_html, html)
+
+        website.set_html(html)
+
+        return html
+
+    async def refresh(self):
+        """
+        Drops the parsed and cached page, fetching it again
+        """
+        website = self.website
+        await self.run(website.cache.remove, website.chart.link, website.date)
+        website.html = None
+        website.soup = None
+        website.chart_date = None
+
+        return await self.get_html()
+
+    async def get_chart_date(self) -> datetime.date:
+        """
+        Returns the date as presented in the chart. A date already
+        resolved is taken from the chart dates cache, without requesting
+        the page
+        """
+        chart_date = self.website.get_known_chart_date()
+        if chart_date is not None:
+            return chart_date
+
+        await self.get_html()
+
+        return await self.run(self.website.get_chart_date)
+
+    async def get_items(self) -> List[ChartItem]:
+        """
+        Returns a list with the entries of the chart
+        """
+        await self.get_html()
+
+        return await self.run(self.website.get_items)
+
+    async def iter_items(self) -> AsyncIterator[ChartItem]:
+        """
+        Yields the entries of the chart, parsing each card in the
+        executor as it is asked for
+        """
+        await self.get_html()
+
+        items = self.website.iter_items()
+        while True:
+            item = await self.run(next, items, END_OF_ITEMS)
+            if item is END_OF_ITEMS:
+                return
+            yield item
+
+    async def close(self):
+        """
+        Closes the fetcher if the website opened it. Shared fetchers
+        are left to their owner
+        """
+        if self.own_fetcher:
+            await self.fetcher.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def __aiter__(self):
+        return self.iter_items()
+
+    def __repr__(self) -> str:
+        return f"AsyncBillboardChartWebsite(Chart: {self.chart.name} | Date: {self.date})"
+
+    def __str__(self) -> str:
+        return f"AsyncBillboardChartWebsite(Chart: {self.chart.name} | Date: {self.date})"
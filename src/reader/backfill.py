@@ -0,0 +1,212 @@
+from typing import Callable, Dict, List, Optional
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import datetime
+import os
+import threading
+
+from ..records.chart_item import ChartItem
+from .cache import CHART_DATES_NAME, ChartDateCache, HtmlCache
+from .exceptions import ConnectionError
+from .fetcher import DEFAULT_RATE, ChartFetcher
+from .website import BillboardChartWebsite
+
+WEEK = datetime.timedelta(days=7)
+DEFAULT_BACKFILL_WORKERS = os.cpu_count() or 4
+
+# Fetcher and caches of the running worker process, built on its first
+# week and reused for the next ones
+WORKER_STATE = {}
+
+
+def get_week_dates(start_date: datetime.date,
+                   end_date: datetime.date) -> List[datetime.date]:
+    """
+    Returns one date per week between both dates, both included.
+
+    Parameters:
+        - start_date: First date of the range
+        - end_date: Last date of the range
+    """
+    dates = []
+
+    date = start_date
+    while date <= end_date:
+        dates.append(date)
+        date += WEEK
+
+    return dates
+
+
+def get_worker_state(rate: Optional[float],
+                     cache_folder: Optional[str]) -> dict:
+    """
+    Returns the fetcher and caches of the running worker process.
+
+    Parameters:
+        - rate: Maximum requests per second of this worker
+        - cache_folder: Folder of the pages cache and the chart dates
+            log. If None, the shared ones
+    """
+    key = (rate, cache_folder)
+    state = WORKER_STATE.get(key)
+
+    if state is None:
+        state = {"fetcher": ChartFetcher(workers=1, rate=rate), "cache": None, "date_cache": None}
+        if cache_folder is not None:
+            state["cache"] = HtmlCache(cache_folder)
+            state["date_cache"] = ChartDateCache(os.path.join(cache_folder, CHART_DATES_NAME))
+        WORKER_STATE[key] = state
+
+    return state
+
+
+def fetch_week(chart: str,
+               date: datetime.date,
+               rate: Optional[float] = DEFAULT_RATE,
+               parser: Optional[str] = None,
+               cache_folder: Optional[str] = None):
+    """
+    Fetches and parses a single chart week. Runs inside the worker
+    processes.
+
+    Parameters:
+        - chart: Key of the chart
+        - date: Date asked for
+        - rate: Maximum requests per second of this worker
+        - parser: Name of the parser backend. If None, the default one
+        - cache_folder: Folder of the pages cache and the chart dates
+            log. If None, the shared ones
+    """
+    state = get_worker_state(rate, cache_folder)
+    website = BillboardChartWebsite(chart,
+                                    date,
+                                    fetcher=state["fetcher"],
+                                    cache=state["cache"],
+                                    date_cache=state["date_cache"],
+                                    parser=parser)
+    items = website.get_items()
+
+    return website.get_chart_date(), items
+
+
+class BackfillCheckpoint():
+    def __init__(self,
+                 file: str) -> None:
+        """
+        Append only log of the weeks already processed by a backfill.
+
+        Parameters:
+            - file: Path of the log file. Created if it doesn't exist
+        """
+        self.file = file
+        self.done = set()
+        self.lock = threading.Lock()
+
+        if os.path.isfile(file):
+            with open(file) as f:
+                for line in f:
+                    try:
+                        self.done.add(datetime.date.fromisoformat(line.strip()))
+                    except ValueError:
+                        continue
+
+    def is_done(self,
+                date: datetime.date):
+        """
+        Returns a bool indicating if the week was already processed.
+
+        Parameters:
+            - date: Date asked for
+        """
+        return date in self.done
+
+    def mark_done(self,
+                  date: datetime.date):
+        """
+        Records the week as processed.
+
+        Parameters:
+            - date: Date asked for
+        """
+        with self.lock:
+            with open(self.file, "a") as f:
+                f.write(f"{date.isoformat()}\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self.done.add(date)
+
+    def __len__(self):
+        return len(self.done)
+
+    def __repr__(self) -> str:
+        return f"BackfillCheckpoint(file={self.file} | Done: {len(self.done)})"
+
+    def __str__(self) -> str:
+        return f"BackfillCheckpoint(file={self.file} | Done: {len(self.done)})"
+
+
+def backfill(chart: str,
+             start_date: datetime.date,
+             end_date: datetime.date,
+             sink: Callable[[datetime.date, List[ChartItem]], None],
+             workers: int = DEFAULT_BACKFILL_WORKERS,
+             checkpoint: Optional[str] = None,
+             rate: Optional[float] = DEFAULT_RATE,
+             parser: Optional[str] = None,
+             cache_folder: Optional[str] = None) -> Dict[datetime.date, BaseException]:
+    """
+    Fetches and parses every week of a chart between two dates in a
+    pool of processes. Each week is handed to the sink as soon as it is
+    ready, in completion order. Returns a dictionary of {date: error}
+    with the weeks that failed, which are not checkpointed.
+
+    Parameters:
+        - chart: Key of the chart
+        - start_date: First date of the range
+        - end_date: Last date of the range
+        - sink: Function receiving the chart date and the items of
+            each week
+        - workers: Amount of processes fetching and parsing weeks
+        - checkpoint: Path of the progress log. Weeks already in it
+            are skipped, so a killed job can be run again to resume
+        - rate: Maximum requests per second to Billboard, split between
+            the workers. If None or 0, no limit is applied
+        - parser: Name of the parser backend. If None, the default one
+        - cache_folder: Folder of the pages cache and the chart dates
+            log. If None, the shared ones
+    """
+    if workers < 1:
+        raise ValueError(f"At Least One Worker Needed To Backfill [Workers: {workers}]")
+
+    progress = BackfillCheckpoint(checkpoint) if checkpoint else None
+
+    dates = get_week_dates(start_date, end_date)
+    if progress is not None:
+        dates = [date for date in dates if not progress.is_done(date)]
+
+    failures = {}
+    if len(dates) == 0:
+        return failures
+
+    worker_rate = rate / workers if rate else None
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(fetch_week, chart, date, worker_rate, parser, cache_folder): date
+                   for date in dates}
+
+        for future in as_completed(futures):
+            date = futures[future]
+            try:
+                chart_date, items = future.result()
+            except (Exception, ConnectionError) as e:
+                failures[date] = e
+                continue
+
+            sink(chart_date, items)
+
+            if progress is not None:
+                progress.mark_done(date)
+
+    return failures
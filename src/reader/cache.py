@@ -0,0 +1,280 @@
+from typing import Optional
+
+import datetime
+import gzip
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+from ..constants import CACHE_FOLDER
+
+DEFAULT_TTL = 60 * 60
+LATEST_KEY = "latest"
+CACHE_EXTENSION = ".html.gz"
+
+CHART_DATES_NAME = "chart_dates.log"
+CHART_DATES_FILE = os.path.join(CACHE_FOLDER, CHART_DATES_NAME)
+SETTLED_DAYS = 7
+
+
+def is_settled(date: Optional[datetime.date]) -> bool:
+    """
+    Returns a bool indicating if the chart a date resolves to can't
+    change anymore: charts are published days before the date they
+    carry, so a week after a date its chart is already out.
+
+    Parameters:
+        - date: Date asked for, None for the current chart
+    """
+    if date is None:
+        return False
+
+    return (datetime.date.today() - date).days >= SETTLED_DAYS
+
+
+class HtmlCache():
+    def __init__(self,
+                 folder: str = CACHE_FOLDER,
+                 ttl: Optional[float] = DEFAULT_TTL) -> None:
+        """
+        Compressed on disk cache of chart pages.
+
+        Pages of settled dates never change, so they never expire. The
+        current chart page (date None) and the pages of recent or future
+        dates, which resolve to the last published chart until theirs
+        comes out, expire after ttl seconds.
+
+        Parameters:
+            - folder: Folder where the pages are stored
+            - ttl: Seconds the pages of unsettled dates are kept. If
+                None, they never expire
+        """
+        self.folder = folder
+        self.ttl = ttl
+
+    def get_key(self,
+                link: str,
+                date: Optional[datetime.date] = None):
+        """
+        Returns the key of a chart page.
+
+        Parameters:
+            - link: Link of the chart
+            - date: Date of the chart, None for the current one
+        """
+        date_key = LATEST_KEY if date is None else date.isoformat()
+
+        return hashlib.sha256(f"{link}/{date_key}".encode("utf-8")).hexdigest()
+
+    def get_path(self,
+                 link: str,
+                 date: Optional[datetime.date] = None):
+        """
+        Returns the file path where a chart page is stored.
+
+        Parameters:
+            - link: Link of the chart
+            - date: Date of the chart, None for the current one
+        """
+        key = self.get_key(link, date)
+
+        return os.path.join(self.folder, key[:2], f"{key}{CACHE_EXTENSION}")
+
+    def is_expired(self,
+                   path: str,
+                   date: Optional[datetime.date] = None):
+        """
+        Returns a bool indicating if the stored page is too old to be
+        used.
+
+        Parameters:
+            - path: File path of the stored page
+            - date: Date of the chart, None for the current one
+        """
+        if self.ttl is None or is_settled(date):
+            return False
+
+        return time.time() - os.path.getmtime(path) > self.ttl
+
+    def get(self,
+            link: str,
+            date: Optional[datetime.date] = None) -> Optional[str]:
+        """
+        Returns the stored html of a chart page, or None if it isn't
+        stored or has expired.
+
+        Parameters:
+            - link: Link of the chart
+            - date: Date of the chart, None for the current one
+        """
+        path = self.get_path(link, date)
+
+        try:
+            if self.is_expired(path, date):
+                return None
+
+            with gzip.open(path, "rb") as f:
+                return f.read().decode("utf-8")
+        except (OSError, EOFError):
+            return None
+
+    def set(self,
+            link: str,
+            date: Optional[datetime.date],
+            html: str):
+        """
+        Stores the html of a chart page. The file is written to a
+        temporary file first and then moved, so readers never see a
+        partial page.
+
+        Parameters:
+            - link: Link of the chart
+            - date: Date of the chart, None for the current one
+            - html: Html of the page
+        """
+        path = self.get_path(link, date)
+        folder = os.path.dirname(path)
+        os.makedirs(folder, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+                    f.write(html.encode("utf-8"))
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def remove(self,
+               link: str,
+               date: Optional[datetime.date] = None):
+        """
+        Removes a chart page from the cache.
+
+        Parameters:
+            - link: Link of the chart
+            - date: Date of the chart, None for the current one
+        """
+        try:
+            os.remove(self.get_path(link, date))
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self) -> str:
+        return f"HtmlCache(Folder: {self.folder} | TTL: {self.ttl})"
+
+    def __str__(self) -> str:
+        return f"HtmlCache(Folder: {self.folder} | TTL: {self.ttl})"
+
+
+DEFAULT_CACHE = None
+DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def get_cache():
+    """
+    Returns the cache shared by every website that doesn't get its own
+    """
+    global DEFAULT_CACHE
+
+    with DEFAULT_CACHE_LOCK:
+        if DEFAULT_CACHE is None:
+            DEFAULT_CACHE = HtmlCache()
+
+    return DEFAULT_CACHE
+
+
+class ChartDateCache():
+    def __init__(self,
+                 file: Optional[str] = None) -> None:
+        """
+        Maps the dates asked for to the real chart dates they resolve
+        to. Only settled dates are kept: a date whose chart is a week
+        or more older than it may not be published yet.
+
+        Parameters:
+            - file: Append only log where the mapping is kept between
+                runs. If None, it is only kept in memory
+        """
+        self.file = file
+        self.dates = {}
+        self.lock = threading.Lock()
+
+        if file is not None and os.path.isfile(file):
+            with open(file) as f:
+                for line in f:
+                    try:
+                        link, date, chart_date = line.split()
+                        key = (link, datetime.date.fromisoformat(date))
+                        self.dates[key] = datetime.date.fromisoformat(chart_date)
+                    except ValueError:
+                        continue
+
+    def get(self,
+            link: str,
+            date: datetime.date) -> Optional[datetime.date]:
+        """
+        Returns the chart date a date resolves to, or None if unknown.
+
+        Parameters:
+            - link: Link of the chart
+            - date: Date asked for
+        """
+        return self.dates.get((link, date))
+
+    def set(self,
+            link: str,
+            date: Optional[datetime.date],
+            chart_date: datetime.date):
+        """
+        Records the chart date a date resolves to, if it is settled: a
+        week or more has passed since it and its chart is less than a
+        week older than it.
+
+        Parameters:
+            - link: Link of the chart
+            - date: Date asked for. None (the current chart) is never
+                recorded
+            - chart_date: Date of the chart it resolved to
+        """
+        if not is_settled(date) or (date - chart_date).days >= SETTLED_DAYS:
+            return
+
+        with self.lock:
+            if self.dates.get((link, date)) == chart_date:
+                return
+            self.dates[(link, date)] = chart_date
+
+            if self.file is not None:
+                os.makedirs(os.path.dirname(self.file) or ".", exist_ok=True)
+                with open(self.file, "a") as f:
+                    f.write(f"{link} {date.isoformat()} {chart_date.isoformat()}\n")
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __repr__(self) -> str:
+        return f"ChartDateCache(File: {self.file} | Dates: {len(self.dates)})"
+
+    def __str__(self) -> str:
+        return f"ChartDateCache(File: {self.file} | Dates: {len(self.dates)})"
+
+
+DEFAULT_DATE_CACHE = None
+
+
+def get_date_cache():
+    """
+    Returns the chart dates cache shared by every website that doesn't
+    get its own
+    """
+    global DEFAULT_DATE_CACHE
+
+    with DEFAULT_CACHE_LOCK:
+        if DEFAULT_DATE_CACHE is None:
+            DEFAULT_DATE_CACHE = ChartDateCache(CHART_DATES_FILE)
+
+    return DEFAULT_DATE_CACHE
@@ -0,0 +1,322 @@
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from urllib.parse import urlsplit
+
+import threading
+import time
+
+from .exceptions import ConnectionError
+
+DEFAULT_WORKERS = 8
+DEFAULT_TIMEOUT = 30
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_RATE = 5
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_AFTER_HEADER = "Retry-After"
+ETAG_HEADER = "ETag"
+LAST_MODIFIED_HEADER = "Last-Modified"
+IF_NONE_MATCH_HEADER = "If-None-Match"
+IF_MODIFIED_SINCE_HEADER = "If-Modified-Since"
+
+NOT_MODIFIED_STATUS = 304
+
+SCAN_CHUNK_SIZE = 16 * 1024
+
+
+class HostRateLimiter():
+    def __init__(self,
+                 rate: Optional[float] = DEFAULT_RATE) -> None:
+        """
+        Spaces out requests made to the same host.
+
+        Parameters:
+            - rate: Maximum requests per second allowed for each host.
+                If None or 0, no limit is applied
+        """
+        self.interval = 1 / rate if rate else 0
+        self.next_slot = {}
+        self.lock = threading.Lock()
+
+    def reserve(self,
+                host: str) -> float:
+        """
+        Takes the next request slot of the host and returns the seconds
+        to wait until it.
+
+        Parameters:
+            - host: Host the request is going to be sent to
+        """
+        if not self.interval:
+            return 0
+
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+
+        return slot - now
+
+    def wait(self,
+             host: str):
+        """
+        Blocks until a request to the host is allowed.
+
+        Parameters:
+            - host: Host the request is going to be sent to
+        """
+        delay = self.reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ChartFetcher():
+    def __init__(self,
+                 workers: int = DEFAULT_WORKERS,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF,
+                 rate: Optional[float] = DEFAULT_RATE) -> None:
+        """
+        Fetches pages over a pooled keep-alive session, with retries
+        and a per host rate limit. It can be shared by many websites.
+
+        Parameters:
+            - workers: Amount of requests that can run at the same time
+            - timeout: Seconds to wait for a response
+            - retries: Times a failed request is retried
+            - backoff: Base seconds to wait between retries, doubled on
+                each attempt
+            - rate: Maximum requests per second for each host
+        """
+        self.workers = workers
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.limiter = HostRateLimiter(rate)
+
+        # requests is only imported once a fetcher is needed, it is the
+        # slowest import of the package
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def get_executor(self):
+        """
+        Returns the thread pool used for concurrent fetches
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self.lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.workers)
+
+        return self.executor
+
+    def get_delay(self,
+                  attempt: int,
+                  response=None):
+        """
+        Returns the seconds to wait before retrying.
+
+        Parameters:
+            - attempt: Number of the attempt that failed, starting at 0
+            - response: Response of the failed attempt, if any
+        """
+        if response is not None:
+            retry_after = response.headers.get(RETRY_AFTER_HEADER, "")
+            if retry_after.isdigit():
+                return int(retry_after)
+
+        return self.backoff * (2 ** attempt)
+
+    def request(self,
+                url: str,
+                headers: Optional[dict] = None,
+                stream: bool = False):
+        """
+        Requests the url, retrying on connection errors and on 429/5xx
+        responses. Returns the last response received.
+
+        Parameters:
+            - url: Url to request
+            - headers: Extra headers to send
+            - stream: If True, the body is not downloaded up front
+        """
+        from requests import RequestException
+
+        host = urlsplit(url).netloc
+
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            self.limiter.wait(host)
+
+            try:
+                response = self.session.get(url,
+                                            headers=headers,
+                                            timeout=self.timeout,
+                                            stream=stream)
+            except RequestException as e:
+                if last_attempt:
+                    raise ConnectionError(f"Could Not Connect To The Base Website [URL: {url} | Reason: {e}]")
+                time.sleep(self.get_delay(attempt))
+                continue
+
+            if response.status_code not in RETRY_STATUSES or last_attempt:
+                return response
+
+            response.close()
+            time.sleep(self.get_delay(attempt, response))
+
+    def fetch(self,
+              url: str):
+        """
+        Returns the decoded body of the url.
+
+        Parameters:
+            - url: Url to fetch
+        """
+        response = self.request(url)
+        if response.status_code // 100 != 2:
+            raise ConnectionError(f"Could Not Connect To The Base Website [URL: {url} | Reason: {response.reason}]")
+
+        return response.content.decode("utf-8")
+
+    def fetch_if_changed(self,
+                         url: str,
+                         etag: Optional[str] = None,
+                         last_modified: Optional[str] = None) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Fetches the url sending the validators of a previous response.
+        Returns the decoded body, or None if the server answered that
+        it wasn't modified, together with the new ETag and
+        Last-Modified validators.
+
+        Parameters:
+            - url: Url to fetch
+            - etag: ETag of the previous response
+            - last_modified: Last-Modified of the previous response
+        """
+        headers = {}
+        if etag:
+            headers[IF_NONE_MATCH_HEADER] = etag
+        if last_modified:
+            headers[IF_MODIFIED_SINCE_HEADER] = last_modified
+
+        response = self.request(url, headers=headers)
+
+        new_etag = response.headers.get(ETAG_HEADER, etag)
+        new_last_modified = response.headers.get(LAST_MODIFIED_HEADER, last_modified)
+
+        if response.status_code == NOT_MODIFIED_STATUS:
+            return None, new_etag, new_last_modified
+
+        if response.status_code // 100 != 2:
+            raise ConnectionError(f"Could Not Connect To The Base Website [URL: {url} | Reason: {response.reason}]")
+
+        return response.content.decode("utf-8"), new_etag, new_last_modified
+
+    def scan(self,
+             url: str,
+             finder: Callable[[bytearray], Optional[object]],
+             chunk_size: int = SCAN_CHUNK_SIZE) -> Tuple[Optional[object], int]:
+        """
+        Streams the body of the url, calling the finder with everything
+        read so far after each chunk, and stops downloading as soon as
+        it returns something. Returns what the finder returned (None
+        if it never found anything) and the amount of bytes read.
+
+        Parameters:
+            - url: Url to scan
+            - finder: Function receiving the bytearray read and returning
+                None while what it looks for isn't there
+            - chunk_size: Bytes read between finder calls
+        """
+        response = self.request(url, stream=True)
+
+        try:
+            if response.status_code // 100 != 2:
+                raise ConnectionError(f"Could Not Connect To The Base Website [URL: {url} | Reason: {response.reason}]")
+
+            data = bytearray()
+            for chunk in response.iter_content(chunk_size):
+                data += chunk
+                found = finder(data)
+                if found is not None:
+                    return found, len(data)
+
+            return None, len(data)
+        finally:
+            response.close()
+
+    def submit(self,
+               url: str):
+        """
+        Schedules the fetch of the url in the thread pool.
+
+        Parameters:
+            - url: Url to fetch
+        """
+        return self.get_executor().submit(self.fetch, url)
+
+    def fetch_many(self,
+                   urls: Iterable[str]) -> List[str]:
+        """
+        Fetches all the urls concurrently, returning the bodies in the
+        same order as asked.
+
+        Parameters:
+            - urls: Urls to fetch
+        """
+        futures = [self.submit(url) for url in urls]
+
+        return [future.result() for future in futures]
+
+    def close(self):
+        """
+        Stops the thread pool and closes the pooled connections
+        """
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ChartFetcher(Workers: {self.workers} | Retries: {self.retries})"
+
+    def __str__(self) -> str:
+        return f"ChartFetcher(Workers: {self.workers} | Retries: {self.retries})"
+
+
+DEFAULT_FETCHER = None
+DEFAULT_FETCHER_LOCK = threading.Lock()
+
+
+def get_fetcher():
+    """
+    Returns the fetcher shared by every website that doesn't get
+    its own
+    """
+    global DEFAULT_FETCHER
+
+    with DEFAULT_FETCHER_LOCK:
+        if DEFAULT_FETCHER is None:
+            DEFAULT_FETCHER = ChartFetcher()
+
+    return DEFAULT_FETCHER
@@ -1,24 +1,29 @@
+from typing import Callable, Optional
+
 import json
 
 from enum import Enum
 
-from functools import partial
-
 import os
-import sys
-
-THIS_FOLDER = os.path.dirname(__file__)
-AUTOMATIONS_FOLDER = os.path.dirname(os.path.dirname(os.path.dirname(THIS_FOLDER)))
-
-sys.path.append(AUTOMATIONS_FOLDER)
 
-from BeautifulSoup.src.elements.filter import NodeFilter
+from functools import lru_cache
 
 THIS_FOLDER = os.path.dirname(__file__)
 FILTERS_FILE = os.path.join(THIS_FOLDER, "filters.json")
 
-with open(FILTERS_FILE) as f:
-    FILTERS_DATA = json.load(f)
+# {module constant: key in the filters file}. The filters file is read
+# and the filters built the first time one of them is used
+NAMED_FILTERS = {
+    "TITLES_FILTER": "title",
+    "CREDITS_FILTER": "credits",
+    "POSITIONS_FILTER": "position",
+    "IMAGES_FILTER": "image",
+    "EXTRAS_FILTER": "extra_values",
+    "MEANINGUL_POSITIONS_FILTER": "meaningful_positions",
+    "MEANINGUL_DATES_FILTER": "meaningful_dates",
+    "CARDS_FILTER": "node",
+    "DATE_FILTER": "date",
+}
 
 ACTION_FIELD = "action"
 VALUE_FIELD = "value"
@@ -90,27 +95,180 @@ def attrs_filter(attrs: dict,
     return True
 
 
-def get_filter(rules: dict):
+class NodeFilter():
+    def __init__(self,
+                 name: Optional[str] = None,
+                 text: Optional[str] = None,
+                 attrs: Optional[Callable[[dict], bool]] = None,
+                 key: Optional[str] = None) -> None:
+        """
+        Filter of the nodes of a parsed page, read by every parser
+        backend and the card scanner.
+
+        Parameters:
+            - name: Tag of the nodes. If None, any tag matches
+            - text: Kept for compatibility with MySoup's filters, unused
+            - attrs: Function telling if an attributes dictionary
+                matches. If None, any attributes match
+            - key: Key of the filter in the filters file, if it is one
+                of the named filters
+        """
+        self.name = name
+        self.text = text
+        self.attrs = attrs
+        self.key = key
+
+    def __repr__(self) -> str:
+        return f"NodeFilter(Key: {self.key} | Name: {self.name})"
+
+    def __str__(self) -> str:
+        return f"NodeFilter(Key: {self.key} | Name: {self.name})"
+
+
+def never_matches(attr_value: str) -> bool:
+    return False
+
+
+def compile_rule(rule: dict):
+    """
+    Returns a function that evaluates a single attributes rule over an
+    already stripped attribute value, or None if the rule is invalid.
+
+    Parameters:
+        - rule: Dictionary of the rule {action: value}
+    """
+    if not isinstance(rule, dict):
+        return None
+
+    action = rule.get(ACTION_FIELD)
+    value = rule.get(VALUE_FIELD)
+
+    if not action or value is None:
+        return None
+
+    action = Actions(action)
+
+    if action == Actions.EQUALS:
+        return lambda attr_value: attr_value == value
+    elif action == Actions.STARTS:
+        return lambda attr_value: attr_value.startswith(value)
+    elif action == Actions.CONTAINS:
+        return lambda attr_value: value in attr_value
+    elif action == Actions.ENDS:
+        return lambda attr_value: attr_value.endswith(value)
+    elif action == Actions.NOT_EQUALS:
+        return lambda attr_value: attr_value != value
+    else:
+        raise ValueError(f"Unsupported action: {action}")
+
+
+def compile_condition(condition):
+    """
+    Returns a function that evaluates if a stripped attribute value
+    matches any of the rules of the condition.
+
+    Parameters:
+        - condition: Rule dictionary or list of rule dictionaries
+    """
+    rule_list = condition if isinstance(condition, list) else [condition]
+
+    actions = [rule.get(ACTION_FIELD) for rule in rule_list if isinstance(rule, dict)]
+    values = [rule.get(VALUE_FIELD) for rule in rule_list if isinstance(rule, dict)]
+    if len(actions) == len(rule_list) and None not in values:
+        if all(action == Actions.STARTS.value for action in actions):
+            prefixes = tuple(values)
+            return lambda attr_value: attr_value.startswith(prefixes)
+        if all(action == Actions.EQUALS.value for action in actions):
+            options = frozenset(values)
+            return lambda attr_value: attr_value in options
+
+    checks = [compile_rule(rule) for rule in rule_list]
+    checks = tuple(check for check in checks if check is not None)
+
+    if len(checks) == 0:
+        return never_matches
+    if len(checks) == 1:
+        return checks[0]
+
+    return lambda attr_value: any(check(attr_value) for check in checks)
+
+
+def compile_attrs(rules: dict):
+    """
+    Returns a function that evaluates an attributes dictionary against
+    the rules. Every rule is read once here instead of on each node.
+
+    Parameters:
+        - rules: Dictionary of rules to use for the given item
+    """
+    checks = tuple((attr_key, compile_condition(condition))
+                   for attr_key, condition in rules.items())
+
+    if len(checks) == 1:
+        (attr_key, check), = checks
+
+        def matcher(attrs: dict) -> bool:
+            attr_value = attrs.get(attr_key)
+            return attr_value is not None and check(attr_value.strip())
+
+        return matcher
+
+    def matcher(attrs: dict) -> bool:
+        for attr_key, check in checks:
+            attr_value = attrs.get(attr_key)
+            if attr_value is None or not check(attr_value.strip()):
+                return False
+
+        return True
+
+    return matcher
+
+
+def get_filter(rules: dict,
+               key: Optional[str] = None) -> NodeFilter:
     """
     Returns the NodeFilter for the json data given
 
     Parameters:
         - rules: Dictionary with the rules to follow
+        - key: Key of the rules in the filters file, kept on the filter
     """
     tag_name = rules.get("tag", None)
     attr_rules = rules.get("attributes", {})
 
-    attr_rules = partial(attrs_filter, rules=attr_rules)
+    attr_rules = compile_attrs(attr_rules)
+
+    return NodeFilter(tag_name, None, attr_rules, key)
+
+
+@lru_cache(maxsize=None)
+def load_filters_data() -> dict:
+    """
+    Returns the rules of the filters file, reading it only once
+    """
+    with open(FILTERS_FILE) as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def get_named_filter(constant: str) -> NodeFilter:
+    """
+    Returns one of the filters of the filters file, building it only
+    once.
+
+    Parameters:
+        - constant: Module constant of the filter, one of NAMED_FILTERS
+    """
+    key = NAMED_FILTERS[constant]
+    return get_filter(load_filters_data().get(key, {}), key)
 
-    return NodeFilter(tag_name, None, attr_rules)
 
+def __getattr__(name: str):
+    # The filters file and the filters are loaded on first access and
+    # kept in the caches of their accessors
+    if name == "FILTERS_DATA":
+        return load_filters_data()
+    if name in NAMED_FILTERS:
+        return get_named_filter(name)
 
-TITLES_FILTER = get_filter(FILTERS_DATA.get("title", {}))
-CREDITS_FILTER = get_filter(FILTERS_DATA.get("credits", {}))
-POSITIONS_FILTER = get_filter(FILTERS_DATA.get("position", {}))
-IMAGES_FILTER = get_filter(FILTERS_DATA.get("image", {}))
-EXTRAS_FILTER = get_filter(FILTERS_DATA.get("extra_values", {}))
-MEANINGUL_POSITIONS_FILTER = get_filter(FILTERS_DATA.get("meaningful_positions", {}))
-MEANINGUL_DATES_FILTER = get_filter(FILTERS_DATA.get("meaningful_dates", {}))
-CARDS_FILTER = get_filter(FILTERS_DATA.get("node", {}))
-DATE_FILTER = get_filter(FILTERS_DATA.get("date", {}))
\ No newline at end of file
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
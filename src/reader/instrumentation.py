@@ -0,0 +1,315 @@
+from typing import Callable, Dict, Optional, Tuple
+
+from contextlib import contextmanager, nullcontext
+
+import json
+import threading
+import time
+
+# Stages timed for every chart read
+FETCH_STAGE = "fetch"
+CACHE_STAGE = "cache"
+PARSE_STAGE = "parse"
+CARDS_STAGE = "cards"
+FILTERS_STAGE = "filters"
+BUILD_STAGE = "build"
+
+# Counters
+CACHE_HITS = "cache_hits"
+CACHE_MISSES = "cache_misses"
+BYTES_FETCHED = "bytes_fetched"
+BYTES_CACHED = "bytes_cached"
+BYTES_PARSED = "bytes_parsed"
+ITEMS_BUILT = "items_built"
+FILTER_CHECKS = "filter_checks"
+FILTER_MATCHES = "filter_matches"
+
+PROMETHEUS_PREFIX = "billboard"
+
+TIMING_EVENT = "timing"
+COUNTER_EVENT = "counter"
+
+
+def get_labels_key(labels: dict) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Returns the labels in the Prometheus text format.
+
+    Parameters:
+        - labels: Pairs of (name, value)
+    """
+    if not labels:
+        return ""
+
+    pairs = ",".join(f'{key}="{value}"' for key, value in labels)
+
+    return f"{{{pairs}}}"
+
+
+class Metrics():
+    def __init__(self,
+                 callback: Optional[Callable[[dict], None]] = None) -> None:
+        """
+        Collects the timings and counters of the chart readers. Websites
+        without metrics skip every measure, so nothing is paid unless
+        one is given to them or set as the shared one.
+
+        Parameters:
+            - callback: Function called with every measure as a
+                dictionary, as soon as it is taken
+        """
+        self.callback = callback
+        self.timings: Dict[tuple, list] = {}
+        self.counters: Dict[tuple, int] = {}
+        self.counted_filters = {}
+        self.lock = threading.Lock()
+
+    def time(self,
+             stage: str,
+             seconds: float,
+             **labels):
+        """
+        Records the time spent in a stage.
+
+        Parameters:
+            - stage: Name of the stage
+            - seconds: Time spent
+            - labels: Labels of the measure, like the chart
+        """
+        key = (stage, get_labels_key(labels))
+
+        with self.lock:
+            timing = self.timings.get(key)
+            if timing is None:
+                self.timings[key] = [1, seconds, seconds]
+            else:
+                timing[0] += 1
+                timing[1] += seconds
+                timing[2] = max(timing[2], seconds)
+
+        if self.callback is not None:
+            self.callback({"event": TIMING_EVENT, "stage": stage, "seconds": seconds, **labels})
+
+    @contextmanager
+    def measure(self,
+                stage: str,
+                **labels):
+        """
+        Times the block run inside it as a stage.
+
+        Parameters:
+            - stage: Name of the stage
+            - labels: Labels of the measure, like the chart
+        """
+        start = time.perf_counter()
+        yield
+        self.time(stage, time.perf_counter() - start, **labels)
+
+    def add(self,
+            name: str,
+            value: int = 1,
+            **labels):
+        """
+        Adds to a counter.
+
+        Parameters:
+            - name: Name of the counter
+            - value: Amount to add
+            - labels: Labels of the measure, like the chart
+        """
+        key = (name, get_labels_key(labels))
+
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+        if self.callback is not None:
+            self.callback({"event": COUNTER_EVENT, "name": name, "value": value, **labels})
+
+    def count_filter(self,
+                     name: str,
+                     node_filter,
+                     **labels):
+        """
+        Returns a copy of a filter that counts the nodes it checks and
+        matches under the filter name and the labels.
+
+        Parameters:
+            - name: Name the filter is reported with
+            - node_filter: Filter to count
+            - labels: Labels of the counts, like the chart
+        """
+        key = (name, get_labels_key(labels))
+
+        with self.lock:
+            counted = self.counted_filters.get(key)
+            if counted is not None and counted[0] is node_filter:
+                return counted[1]
+
+        from .filters import NodeFilter
+
+        check = node_filter.attrs
+        counts = [0, 0]
+        lock = self.lock
+
+        def counted_check(attrs) -> bool:
+            matched = check(attrs)
+            with lock:
+                counts[0] += 1
+                if matched:
+                    counts[1] += 1
+            return matched
+
+        counted_filter = NodeFilter(node_filter.name, None, counted_check, node_filter.key)
+
+        with self.lock:
+            self.counted_filters[key] = (node_filter, counted_filter, counts)
+
+        return counted_filter
+
+    def get_counter(self,
+                    name: str) -> int:
+        """
+        Returns the value of a counter summed over all its labels.
+
+        Parameters:
+            - name: Name of the counter
+        """
+        with self.lock:
+            return sum(value for (counter, _), value in self.counters.items() if counter == name)
+
+    def get_cache_hit_rate(self) -> Optional[float]:
+        """
+        Returns the share of pages read from the cache, or None if no
+        page was read
+        """
+        hits = self.get_counter(CACHE_HITS)
+        total = hits + self.get_counter(CACHE_MISSES)
+
+        return hits / total if total else None
+
+    def get_counters(self) -> Dict[tuple, int]:
+        """
+        Returns the counters, including the filter ones
+        """
+        with self.lock:
+            counters = dict(self.counters)
+            counted_filters = [(key, list(counts)) for key, (_, _, counts) in self.counted_filters.items()]
+
+        for (name, labels), (checks, matches) in counted_filters:
+            labels = get_labels_key({**dict(labels), "filter": name})
+            counters[(FILTER_CHECKS, labels)] = checks
+            counters[(FILTER_MATCHES, labels)] = matches
+
+        return counters
+
+    def to_dict(self) -> dict:
+        with self.lock:
+            timings = dict(self.timings)
+
+        return {
+            "timings": [{"stage": stage,
+                         "labels": dict(labels),
+                         "count": count,
+                         "total_seconds": total,
+                         "max_seconds": longest}
+                        for (stage, labels), (count, total, longest) in timings.items()],
+            "counters": [{"name": name, "labels": dict(labels), "value": value}
+                         for (name, labels), value in self.get_counters().items()],
+            "cache_hit_rate": self.get_cache_hit_rate(),
+        }
+
+    def to_json(self) -> str:
+        """
+        Returns the collected measures as JSON
+        """
+        return json.dumps(self.to_dict())
+
+    def to_prometheus(self,
+                      prefix: str = PROMETHEUS_PREFIX) -> str:
+        """
+        Returns the collected measures in the Prometheus text format.
+
+        Parameters:
+            - prefix: Prefix of the metric names
+        """
+        with self.lock:
+            timings = dict(self.timings)
+
+        lines = [f"# TYPE {prefix}_stage_seconds summary"]
+        for (stage, labels), (count, total, _) in sorted(timings.items()):
+            labels = format_labels((("stage", stage),) + labels)
+            lines.append(f"{prefix}_stage_seconds_count{labels} {count}")
+            lines.append(f"{prefix}_stage_seconds_sum{labels} {total}")
+
+        counters = {}
+        for (name, labels), value in self.get_counters().items():
+            counters.setdefault(name, []).append((labels, value))
+
+        for name, values in sorted(counters.items()):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for labels, value in sorted(values):
+                lines.append(f"{prefix}_{name}_total{format_labels(labels)} {value}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        """
+        Drops every measure taken
+        """
+        with self.lock:
+            self.timings = {}
+            self.counters = {}
+            self.counted_filters = {}
+
+    def __repr__(self) -> str:
+        return f"Metrics(Timings: {len(self.timings)} | Counters: {len(self.counters)})"
+
+    def __str__(self) -> str:
+        return f"Metrics(Timings: {len(self.timings)} | Counters: {len(self.counters)})"
+
+
+NO_MEASURE = nullcontext()
+
+
+def measure(metrics: Optional[Metrics],
+            stage: str,
+            **labels):
+    """
+    Times the block run inside it as a stage, doing nothing when there
+    are no metrics.
+
+    Parameters:
+        - metrics: Metrics where the time is recorded, None if disabled
+        - stage: Name of the stage
+        - labels: Labels of the measure, like the chart
+    """
+    if metrics is None:
+        return NO_MEASURE
+
+    return metrics.measure(stage, **labels)
+
+
+DEFAULT_METRICS = None
+
+
+def get_metrics() -> Optional[Metrics]:
+    """
+    Returns the metrics shared by every website that doesn't get its
+    own, None if they are disabled
+    """
+    return DEFAULT_METRICS
+
+
+def set_metrics(metrics: Optional[Metrics]):
+    """
+    Sets the metrics shared by every website that doesn't get its own.
+
+    Parameters:
+        - metrics: Metrics to share. If None, they are disabled
+    """
+    global DEFAULT_METRICS
+
+    DEFAULT_METRICS = metrics
@@ -0,0 +1,43 @@
+from typing import Optional, Union
+
+import importlib
+import threading
+
+from .base import ParserBackend
+
+# {name: (module, class)}, imported on first use so optional backends
+# only need their packages when selected
+PARSERS = {
+    "mysoup": ("mysoup", "MySoupParser"),
+    "lxml": ("lxml_parser", "LxmlParser"),
+}
+
+DEFAULT_PARSER = "mysoup"
+
+LOADED_PARSERS = {}
+LOADED_PARSERS_LOCK = threading.Lock()
+
+
+def get_parser(parser: Optional[Union[str, ParserBackend]] = None) -> ParserBackend:
+    """
+    Returns a parser backend, shared between every caller asking for
+    it by name.
+
+    Parameters:
+        - parser: Name of the backend, or the backend itself. If None,
+            the default one
+    """
+    if isinstance(parser, ParserBackend):
+        return parser
+
+    name = DEFAULT_PARSER if parser is None else parser
+    if name not in PARSERS:
+        raise ValueError(f"Unknown Parser [{name}] (Options: {', '.join(PARSERS)})")
+
+    with LOADED_PARSERS_LOCK:
+        if name not in LOADED_PARSERS:
+            module_name, class_name = PARSERS[name]
+            module = importlib.import_module(f"{__package__}.{module_name}")
+            LOADED_PARSERS[name] = getattr(module, class_name)()
+
+    return LOADED_PARSERS[name]
@@ -0,0 +1,26 @@
+class ParserBackend():
+    """
+    Builds the tree of a page that the NodeFilters run against.
+
+    The nodes of every backend work the same way: they have name,
+    attrs (a dictionary like mapping), children (element children in
+    document order) and text, plus find and find_all taking a
+    NodeFilter and searching the descendants in document order.
+    """
+    name = None
+
+    def parse(self,
+              html: str):
+        """
+        Returns the root node of the html.
+
+        Parameters:
+            - html: Html code to parse
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(Name: {self.name})"
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}(Name: {self.name})"
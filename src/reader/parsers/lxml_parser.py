@@ -0,0 +1,148 @@
+from typing import Iterator, List, Optional, Tuple
+
+import threading
+
+from lxml import etree
+
+from .base import ParserBackend
+
+ENCODING = "utf-8"
+
+
+class LxmlNode():
+    __slots__ = ("element", "_children")
+
+    def __init__(self,
+                 element: etree._Element) -> None:
+        """
+        Node of a page parsed by lxml, read the same way as the MySoup
+        ones.
+
+        Parameters:
+            - element: Element wrapped
+        """
+        self.element = element
+        self._children = None
+
+    @property
+    def name(self) -> str:
+        return self.element.tag
+
+    @property
+    def attrs(self):
+        return self.element.attrib
+
+    @property
+    def children(self) -> List["LxmlNode"]:
+        if self._children is None:
+            self._children = [LxmlNode(child) for child in self.element
+                              if isinstance(child.tag, str)]
+
+        return self._children
+
+    @property
+    def text(self) -> str:
+        return "".join(self.element.itertext())
+
+    def iter_descendants(self) -> Iterator[Tuple[str, object, etree._Element]]:
+        """
+        Yields the name, attributes and element of every descendant
+        element in document order, without wrapping them
+        """
+        for element in self.element.iterdescendants(etree.Element):
+            yield element.tag, element.attrib, element
+
+    def wrap(self,
+             element: etree._Element) -> "LxmlNode":
+        """
+        Returns the node of an element yielded by iter_descendants.
+
+        Parameters:
+            - element: Element to wrap
+        """
+        return LxmlNode(element)
+
+    def iter_matches(self,
+                     node_filter) -> Iterator[etree._Element]:
+        """
+        Yields the descendant elements matching the filter, in document
+        order. The tag is matched by lxml itself.
+
+        Parameters:
+            - node_filter: Filter to match
+        """
+        check = node_filter.attrs
+
+        if node_filter.name is not None:
+            elements = self.element.iterdescendants(node_filter.name)
+        else:
+            elements = self.element.iterdescendants(etree.Element)
+
+        for element in elements:
+            if check is None or check(element.attrib):
+                yield element
+
+    def find(self,
+             node_filter) -> Optional["LxmlNode"]:
+        """
+        Returns the first descendant matching the filter, or None.
+
+        Parameters:
+            - node_filter: Filter to match
+        """
+        for element in self.iter_matches(node_filter):
+            return LxmlNode(element)
+
+        return None
+
+    def find_all(self,
+                 node_filter) -> List["LxmlNode"]:
+        """
+        Returns every descendant matching the filter.
+
+        Parameters:
+            - node_filter: Filter to match
+        """
+        return [LxmlNode(element) for element in self.iter_matches(node_filter)]
+
+    def __eq__(self, other):
+        if not isinstance(other, LxmlNode):
+            return NotImplemented
+
+        return self.element is other.element
+
+    def __hash__(self):
+        return hash(self.element)
+
+    def __repr__(self) -> str:
+        return f"LxmlNode(Name: {self.name} | Attributes: {dict(self.attrs)})"
+
+    def __str__(self) -> str:
+        return f"LxmlNode(Name: {self.name} | Attributes: {dict(self.attrs)})"
+
+
+class LxmlParser(ParserBackend):
+    """
+    C backed parser. Needs the lxml package
+    """
+    name = "lxml"
+
+    def __init__(self) -> None:
+        self.local = threading.local()
+
+    def get_parser(self) -> etree.HTMLParser:
+        """
+        Returns the lxml parser of the running thread, as they can't be
+        shared between threads
+        """
+        parser = getattr(self.local, "parser", None)
+        if parser is None:
+            parser = self.local.parser = etree.HTMLParser(encoding=ENCODING)
+
+        return parser
+
+    def parse(self,
+              html: str) -> LxmlNode:
+        root = etree.fromstring(html.encode(ENCODING), self.get_parser())
+
+        return LxmlNode(root.getroottree().getroot())
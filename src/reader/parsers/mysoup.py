@@ -0,0 +1,174 @@
+from typing import Iterator, List, Optional, Tuple
+
+import importlib
+import os
+import sys
+
+from .base import ParserBackend
+
+THIS_FOLDER = os.path.dirname(__file__)
+AUTOMATIONS_FOLDER = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(THIS_FOLDER))))
+
+SOUP_PACKAGE = "BeautifulSoup"
+
+
+def import_soup_module(name: str):
+    """
+    Returns a module of the BeautifulSoup package. If it isn't
+    installed, the checkout next to this repository is used.
+
+    Parameters:
+        - name: Name of the module inside the package
+    """
+    module_name = f"{SOUP_PACKAGE}.{name}"
+
+    try:
+        return importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if e.name != SOUP_PACKAGE or AUTOMATIONS_FOLDER in sys.path:
+            raise
+
+    sys.path.append(AUTOMATIONS_FOLDER)
+
+    return importlib.import_module(module_name)
+
+
+class MySoupNode():
+    __slots__ = ("node", "parser", "_children")
+
+    def __init__(self,
+                 node,
+                 parser: "MySoupParser") -> None:
+        """
+        Node of a page parsed by MySoup, searched with the package
+        filters instead of MySoup's own.
+
+        Parameters:
+            - node: MySoup node wrapped
+            - parser: Backend that parsed the node
+        """
+        self.node = node
+        self.parser = parser
+        self._children = None
+
+    @property
+    def name(self) -> str:
+        return self.node.name
+
+    @property
+    def attrs(self) -> dict:
+        return self.node.attrs
+
+    @property
+    def children(self) -> List["MySoupNode"]:
+        if self._children is None:
+            self._children = [MySoupNode(child, self.parser) for child in self.node.children
+                              if getattr(child, "name", None) is not None]
+
+        return self._children
+
+    @property
+    def text(self) -> str:
+        return self.node.text
+
+    def iter_descendants(self) -> Iterator[Tuple[str, dict, object]]:
+        """
+        Yields the name, attributes and MySoup node of every descendant
+        element in document order, without wrapping them
+        """
+        stack = list(reversed(self.node.children))
+        while stack:
+            child = stack.pop()
+
+            name = getattr(child, "name", None)
+            if name is None:
+                continue
+
+            yield name, child.attrs, child
+
+            children = getattr(child, "children", None)
+            if children:
+                stack.extend(reversed(children))
+
+    def wrap(self,
+             node) -> "MySoupNode":
+        """
+        Returns the node of a MySoup node yielded by iter_descendants.
+
+        Parameters:
+            - node: MySoup node to wrap
+        """
+        return MySoupNode(node, self.parser)
+
+    def find(self,
+             node_filter) -> Optional["MySoupNode"]:
+        """
+        Returns the first descendant matching the filter, or None.
+
+        Parameters:
+            - node_filter: Filter to match
+        """
+        found = self.node.find(self.parser.get_soup_filter(node_filter))
+        if found is None:
+            return None
+
+        return MySoupNode(found, self.parser)
+
+    def find_all(self,
+                 node_filter) -> List["MySoupNode"]:
+        """
+        Returns every descendant matching the filter.
+
+        Parameters:
+            - node_filter: Filter to match
+        """
+        return [MySoupNode(node, self.parser)
+                for node in self.node.find_all(self.parser.get_soup_filter(node_filter))]
+
+    def __eq__(self, other):
+        if not isinstance(other, MySoupNode):
+            return NotImplemented
+
+        return self.node is other.node
+
+    def __hash__(self):
+        return id(self.node)
+
+    def __repr__(self) -> str:
+        return f"MySoupNode(Name: {self.name} | Attributes: {self.attrs})"
+
+    def __str__(self) -> str:
+        return f"MySoupNode(Name: {self.name} | Attributes: {self.attrs})"
+
+
+class MySoupParser(ParserBackend):
+    """
+    Reference backend, parsing with MySoup. Needs the BeautifulSoup
+    package
+    """
+    name = "mysoup"
+
+    def __init__(self) -> None:
+        self.soup_class = import_soup_module("src.parser").MySoup
+        self.filter_class = import_soup_module("src.elements.filter").NodeFilter
+        self.soup_filters = {}
+
+    def get_soup_filter(self,
+                        node_filter):
+        """
+        Returns the MySoup filter matching a package filter, built only
+        once per filter.
+
+        Parameters:
+            - node_filter: Filter to adapt
+        """
+        soup_filter = self.soup_filters.get(node_filter)
+        if soup_filter is None:
+            soup_filter = self.filter_class(node_filter.name, None, node_filter.attrs)
+            self.soup_filters[node_filter] = soup_filter
+
+        return soup_filter
+
+    def parse(self,
+              html: str) -> MySoupNode:
+        return MySoupNode(self.soup_class(html), self)
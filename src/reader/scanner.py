@@ -0,0 +1,81 @@
+from typing import Dict, List
+
+
+class CardScanner():
+    def __init__(self,
+                 filters: Dict[str, object]) -> None:
+        """
+        Finds the nodes of many filters walking the tree only once.
+
+        Parameters:
+            - filters: Dictionary of {slot: filter}. The nodes matching
+                each filter are collected under its slot
+        """
+        self.slots = tuple(filters.keys())
+        self.filters_by_tag = {}
+        self.untagged_filters = []
+
+        for slot, node_filter in filters.items():
+            check = (slot, node_filter.attrs)
+            if node_filter.name is None:
+                self.untagged_filters.append(check)
+            else:
+                self.filters_by_tag.setdefault(node_filter.name, []).append(check)
+
+    def scan(self,
+             node) -> Dict[str, List]:
+        """
+        Returns a dictionary of {slot: nodes} with the descendants of
+        the node matching each filter, in document order.
+
+        Parameters:
+            - node: Node whose descendants are scanned
+        """
+        found = {slot: [] for slot in self.slots}
+        filters_by_tag = self.filters_by_tag
+        untagged_filters = self.untagged_filters
+
+        # Backends that can walk their own tree faster than through the
+        # children lists only build the nodes that match
+        iter_descendants = getattr(node, "iter_descendants", None)
+        if iter_descendants is not None:
+            wrap = node.wrap
+            for name, attrs, child in iter_descendants():
+                for slot, check in filters_by_tag.get(name, ()):
+                    if check(attrs):
+                        found[slot].append(wrap(child))
+                for slot, check in untagged_filters:
+                    if check(attrs):
+                        found[slot].append(wrap(child))
+
+            return found
+
+        stack = list(reversed(getattr(node, "children", [])))
+        while stack:
+            child = stack.pop()
+
+            name = getattr(child, "name", None)
+            if name is None:
+                continue
+
+            checks = filters_by_tag.get(name)
+            if checks or untagged_filters:
+                attrs = child.attrs
+                for slot, check in checks or ():
+                    if check(attrs):
+                        found[slot].append(child)
+                for slot, check in untagged_filters:
+                    if check(attrs):
+                        found[slot].append(child)
+
+            children = getattr(child, "children", None)
+            if children:
+                stack.extend(reversed(children))
+
+        return found
+
+    def __repr__(self) -> str:
+        return f"CardScanner(Slots: {', '.join(self.slots)})"
+
+    def __str__(self) -> str:
+        return f"CardScanner(Slots: {', '.join(self.slots)})"
@@ -0,0 +1,192 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import datetime
+
+from ..chart_data.chart_data import ChartData
+from ..chart_data.chart_index import get_index
+from ..constants import CHARTS_FILE
+from ..records.chart_item import ChartItem
+from .cache import ChartDateCache, HtmlCache
+from .exceptions import ConnectionError
+from .fetcher import ChartFetcher
+from .parsers.base import ParserBackend
+from .website import BillboardChartWebsite
+
+DEFAULT_SNAPSHOT_WORKERS = 16
+
+
+class ChartResult():
+    def __init__(self,
+                 chart: ChartData,
+                 chart_date: Optional[datetime.date] = None,
+                 items: Optional[List[ChartItem]] = None,
+                 error: Optional[BaseException] = None) -> None:
+        """
+        Outcome of reading a single chart of a snapshot.
+
+        Parameters:
+            - chart: Chart read
+            - chart_date: Date of the chart week read
+            - items: Items of the chart week
+            - error: Error raised while reading the chart, if it failed
+        """
+        self.chart = chart
+        self.chart_date = chart_date
+        self.items = items if items is not None else []
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns a bool indicating if the chart was read
+        """
+        return self.error is None
+
+    def __repr__(self) -> str:
+        state = f"Items: {len(self.items)}" if self.ok else f"Error: {self.error!r}"
+        return f"ChartResult(Chart: {self.chart.abbreviation} | Date: {self.chart_date} | {state})"
+
+    def __str__(self) -> str:
+        state = f"Items: {len(self.items)}" if self.ok else f"Error: {self.error!r}"
+        return f"ChartResult(Chart: {self.chart.abbreviation} | Date: {self.chart_date} | {state})"
+
+
+def get_snapshot_charts(charts: Optional[Iterable[Union[str, ChartData]]] = None) -> List[ChartData]:
+    """
+    Returns the charts a snapshot reads, without repeating any.
+
+    Parameters:
+        - charts: Keys of the charts, or the charts themselves. If None,
+            every chart of the index that can be fetched
+    """
+    index = get_index(CHARTS_FILE)
+
+    if charts is None:
+        return index.get_fetchable()
+
+    resolved = []
+    seen = set()
+    for chart in charts:
+        if not isinstance(chart, ChartData):
+            chart = index[chart]
+        if chart.abbreviation not in seen:
+            seen.add(chart.abbreviation)
+            resolved.append(chart)
+
+    return resolved
+
+
+def read_chart(chart: ChartData,
+               date: Optional[datetime.date],
+               fetcher: ChartFetcher,
+               cache: Optional[HtmlCache] = None,
+               date_cache: Optional[ChartDateCache] = None,
+               parser: Optional[Union[str, ParserBackend]] = None) -> ChartResult:
+    """
+    Fetches and parses a single chart of a snapshot. Runs inside the
+    worker threads.
+
+    Parameters:
+        - chart: Chart to read
+        - date: Date asked for
+        - fetcher: Fetcher shared by the snapshot
+        - cache: Cache of the pages
+        - date_cache: Cache of the chart dates
+        - parser: Parser backend, or its name
+    """
+    if not chart.link:
+        raise ValueError(f"Chart Can't Be Fetched [Chart: {chart.name}]")
+
+    website = BillboardChartWebsite(chart.abbreviation,
+                                    date,
+                                    fetcher=fetcher,
+                                    cache=cache,
+                                    date_cache=date_cache,
+                                    parser=parser)
+    items = website.get_items()
+
+    return ChartResult(chart, website.get_chart_date(), items)
+
+
+def iter_snapshot(date: Optional[datetime.date] = None,
+                  charts: Optional[Iterable[Union[str, ChartData]]] = None,
+                  concurrency: int = DEFAULT_SNAPSHOT_WORKERS,
+                  fetcher: Optional[ChartFetcher] = None,
+                  cache: Optional[HtmlCache] = None,
+                  date_cache: Optional[ChartDateCache] = None,
+                  parser: Optional[Union[str, ParserBackend]] = None) -> Iterator[ChartResult]:
+    """
+    Fetches and parses many charts of the same week in a pool of
+    threads, yielding each result as soon as it is ready, in completion
+    order. A chart that fails is yielded with its error instead of
+    stopping the rest.
+
+    Requests still go through the fetcher's per host rate limit.
+
+    Parameters:
+        - date: Date asked for. If None, the last week of each chart
+        - charts: Keys of the charts, or the charts themselves. If None,
+            every chart of the index that can be fetched
+        - concurrency: Amount of charts read at the same time
+        - fetcher: Fetcher shared by every chart. If None, one pooled
+            for the concurrency is used and closed at the end
+        - cache: Cache of the pages
+        - date_cache: Cache of the chart dates
+        - parser: Parser backend, or its name
+    """
+    charts = get_snapshot_charts(charts)
+    if len(charts) == 0:
+        return
+
+    own_fetcher = fetcher is None
+    if own_fetcher:
+        fetcher = ChartFetcher(workers=concurrency)
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {executor.submit(read_chart, chart, date, fetcher, cache, date_cache, parser): chart
+                       for chart in charts}
+
+            for future in as_completed(futures):
+                chart = futures[future]
+                try:
+                    yield future.result()
+                except (Exception, ConnectionError) as e:
+                    yield ChartResult(chart, error=e)
+    finally:
+        if own_fetcher:
+            fetcher.close()
+
+
+def snapshot(date: Optional[datetime.date] = None,
+             charts: Optional[Iterable[Union[str, ChartData]]] = None,
+             concurrency: int = DEFAULT_SNAPSHOT_WORKERS,
+             fetcher: Optional[ChartFetcher] = None,
+             cache: Optional[HtmlCache] = None,
+             date_cache: Optional[ChartDateCache] = None,
+             parser: Optional[Union[str, ParserBackend]] = None) -> Dict[str, ChartResult]:
+    """
+    Fetches and parses many charts of the same week concurrently.
+    Returns a dictionary of {abbreviation: result}, in the order the
+    charts were given.
+
+    Parameters:
+        - date: Date asked for. If None, the last week of each chart
+        - charts: Keys of the charts, or the charts themselves. If None,
+            every chart of the index that can be fetched
+        - concurrency: Amount of charts read at the same time
+        - fetcher: Fetcher shared by every chart. If None, one pooled
+            for the concurrency is used and closed at the end
+        - cache: Cache of the pages
+        - date_cache: Cache of the chart dates
+        - parser: Parser backend, or its name
+    """
+    charts = get_snapshot_charts(charts)
+    results = {chart.abbreviation: None for chart in charts}
+
+    for result in iter_snapshot(date, charts, concurrency, fetcher, cache, date_cache, parser):
+        results[result.chart.abbreviation] = result
+
+    return results
@@ -0,0 +1,149 @@
+from typing import Callable, Iterator, Optional, Tuple
+
+import html as html_lib
+import re
+
+ATTRIBUTE_PATTERN = re.compile(r"""([^\s=/>"']+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>"']+)))?""")
+START_TAG_PATTERN = "<{tag}(?=[\\s/>])([^>]*)>"
+TAG_PATTERN = "<(/?){tag}(?=[\\s/>])[^>]*?(/?)>"
+
+
+def read_attributes(text: str) -> dict:
+    """
+    Returns the attributes dictionary of a start tag.
+
+    Parameters:
+        - text: Text of the tag between its name and the closing '>'
+    """
+    attributes = {}
+
+    for match in ATTRIBUTE_PATTERN.finditer(text):
+        name, double, single, bare = match.groups()
+        value = double if double is not None else single if single is not None else bare
+        attributes[name.lower()] = html_lib.unescape(value or "")
+
+    return attributes
+
+
+def get_patterns(tag: str):
+    """
+    Returns the start tag and any tag patterns for a tag name.
+
+    Parameters:
+        - tag: Name of the tag to look for
+    """
+    tag = re.escape(tag)
+    start = re.compile(START_TAG_PATTERN.format(tag=tag), re.IGNORECASE)
+    any_tag = re.compile(TAG_PATTERN.format(tag=tag), re.IGNORECASE)
+
+    return start, any_tag
+
+
+def find_element_end(html: str,
+                     start: int,
+                     tag_pattern: re.Pattern) -> int:
+    """
+    Returns the position right after the end of the element whose
+    start tag begins at start.
+
+    Parameters:
+        - html: Html code being read
+        - start: Position of the element start tag
+        - tag_pattern: Pattern matching start and end tags of the element
+            tag name
+    """
+    depth = 0
+
+    for match in tag_pattern.finditer(html, start):
+        closing, self_closing = match.groups()
+        if closing:
+            depth -= 1
+        elif not self_closing:
+            depth += 1
+
+        if depth <= 0:
+            return match.end()
+
+    return len(html)
+
+
+def iter_elements(html: str,
+                  tag: str,
+                  attrs_filter: Optional[Callable[[dict], bool]] = None,
+                  with_body: bool = True) -> Iterator[Tuple[dict, Optional[str]]]:
+    """
+    Yields the attributes and html of every element with the given tag
+    that matches the filter, without parsing the rest of the page.
+    Matching elements nested inside a previous match are skipped.
+
+    Parameters:
+        - html: Html code to read
+        - tag: Name of the tag of the elements
+        - attrs_filter: Function receiving the attributes dictionary
+            and returning if the element is wanted
+        - with_body: If False, only the attributes are read and None is
+            yielded instead of the element html
+    """
+    start_pattern, tag_pattern = get_patterns(tag)
+
+    position = 0
+    while True:
+        match = start_pattern.search(html, position)
+        if match is None:
+            return
+
+        attributes = read_attributes(match.group(1))
+        if attrs_filter is not None and not attrs_filter(attributes):
+            position = match.end()
+            continue
+
+        if not with_body:
+            yield attributes, None
+            position = match.end()
+            continue
+
+        end = find_element_end(html, match.start(), tag_pattern)
+        yield attributes, html[match.start():end]
+        position = end
+
+
+def find_start_tag(data: bytes,
+                   tag: str,
+                   marker: bytes,
+                   attrs_filter: Optional[Callable[[dict], bool]] = None) -> Optional[dict]:
+    """
+    Returns the attributes of the first start tag with the given name
+    that contains the marker and matches the filter, or None if it
+    isn't in the data. The raw bytes are searched for the marker, so
+    only the tags around it are ever decoded. A tag cut at the end of
+    the data is treated as not found yet.
+
+    Parameters:
+        - data: Bytes of the html read so far
+        - tag: Name of the tag to look for
+        - marker: Bytes that must appear inside the tag
+        - attrs_filter: Function receiving the attributes dictionary
+            and returning if the tag is wanted
+    """
+    start_pattern, _ = get_patterns(tag)
+
+    position = 0
+    while True:
+        found = data.find(marker, position)
+        if found == -1:
+            return None
+
+        end = data.find(b">", found)
+        if end == -1:
+            return None
+
+        start = data.rfind(b"<", 0, found)
+        if start != -1:
+            text = bytes(data[start:end + 1]).decode("utf-8", "replace")
+            match = start_pattern.match(text)
+            if match is not None:
+                attributes = read_attributes(match.group(1))
+                if attrs_filter is None or attrs_filter(attributes):
+                    return attributes
+
+        position = found + len(marker)
@@ -0,0 +1,109 @@
+from typing import List, Optional, Union
+
+import argparse
+import datetime
+
+from ..storage.chart_store import ChartStore
+from .cache import ChartDateCache, HtmlCache
+from .fetcher import ChartFetcher
+from .parsers.base import ParserBackend
+from .website import BillboardChartWebsite
+
+WEEK = datetime.timedelta(days=7)
+
+
+def get_missing_dates(last_date: datetime.date,
+                      until: datetime.date) -> List[datetime.date]:
+    """
+    Returns one date per week after the last stored week, up to the
+    until date included.
+
+    Parameters:
+        - last_date: Date of the last stored week
+        - until: Last date to look for
+    """
+    dates = []
+
+    date = last_date + WEEK
+    while date <= until:
+        dates.append(date)
+        date += WEEK
+
+    return dates
+
+
+def sync(chart: str,
+         store: ChartStore,
+         start_date: Optional[datetime.date] = None,
+         until: Optional[datetime.date] = None,
+         fetcher: Optional[ChartFetcher] = None,
+         cache: Optional[HtmlCache] = None,
+         date_cache: Optional[ChartDateCache] = None,
+         parser: Optional[Union[str, ParserBackend]] = None) -> List[datetime.date]:
+    """
+    Fetches only the weeks of a chart missing from the store, from the
+    last stored week up to today, and appends them. Each asked date is
+    snapped to the real chart date reading only the head of its page,
+    so weeks already stored or not yet published are skipped without
+    being downloaded. Returns the chart dates appended.
+
+    Parameters:
+        - chart: Key of the chart
+        - store: Store holding the chart weeks
+        - start_date: Date to start from when the store is empty
+        - until: Last date to look for. If None, today
+        - fetcher: Fetcher to use, the shared one if None
+        - cache: Pages cache to use, the shared one if None
+        - date_cache: Chart dates cache to use, the shared one if None
+        - parser: Parser backend, or its name. If None, the default one
+    """
+    until = until if until is not None else datetime.date.today()
+
+    with store.read() as history:
+        last_date = history.last_date
+
+    if last_date is None:
+        if start_date is None:
+            raise ValueError(f"Start Date Needed To Sync An Empty Store [{store.folder}]")
+        dates = [start_date] + get_missing_dates(start_date, until)
+    else:
+        dates = get_missing_dates(last_date, until)
+
+    synced = []
+    for date in dates:
+        website = BillboardChartWebsite(chart,
+                                        date,
+                                        fetcher=fetcher,
+                                        cache=cache,
+                                        date_cache=date_cache,
+                                        parser=parser)
+        chart_date = website.resolve_chart_date()
+
+        if last_date is not None and chart_date <= last_date:
+            # The chart of this date isn't out yet, don't keep its page if
+            # it was read from the cache
+            website.cache.remove(website.chart.link, date)
+            continue
+
+        store.append_week(website.get_items())
+        synced.append(chart_date)
+        last_date = chart_date
+
+    return synced
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetches the chart weeks missing from a store")
+    parser.add_argument("chart", help="Key of the chart")
+    parser.add_argument("store", help="Folder of the chart store")
+    parser.add_argument("--start", type=datetime.date.fromisoformat, default=None,
+                        help="Date to start from when the store is empty (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    synced = sync(args.chart, ChartStore(args.store), args.start)
+    for chart_date in synced:
+        print(chart_date.isoformat())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,30 @@
-from typing import Optional
-
-import requests
+from typing import Optional, Union
 
 import datetime
-
-from .exceptions import ConnectionError, DateError
-from .filters import POSITIONS_FILTER, TITLES_FILTER, CREDITS_FILTER
-from .filters import EXTRAS_FILTER, IMAGES_FILTER, CARDS_FILTER, DATE_FILTER
-from .filters import MEANINGUL_DATES_FILTER, MEANINGUL_POSITIONS_FILTER
-from .filters import NodeFilter
+import hashlib
+
+from .cache import ChartDateCache, HtmlCache, get_cache, get_date_cache
+from .exceptions import DateError
+from .fetcher import ChartFetcher, get_fetcher
+from .instrumentation import Metrics, get_metrics, measure
+from .instrumentation import FETCH_STAGE, CACHE_STAGE, PARSE_STAGE, CARDS_STAGE, FILTERS_STAGE, BUILD_STAGE
+from .instrumentation import CACHE_HITS, CACHE_MISSES, BYTES_FETCHED, BYTES_CACHED, BYTES_PARSED, ITEMS_BUILT
+from .scanner import CardScanner
+from .stream import find_start_tag, iter_elements
+from . import filters
+from .parsers.backends import get_parser
+from .parsers.base import ParserBackend
 
 from ..constants import CHARTS_FILE
 
-from ..records.chart_item import ChartItem
-from ..chart_data.chart_index import ChartsIndex
-
-import os
-import sys
-
-THIS_FOLDER = os.path.dirname(__file__)
-AUTOMATIONS_FOLDER = os.path.dirname(os.path.dirname(os.path.dirname(THIS_FOLDER)))
-
-sys.path.append(AUTOMATIONS_FOLDER)
+from ..records.chart_item import ChartItem, NO_IMAGE
+from ..chart_data.chart_index import get_index
 
-from BeautifulSoup.src.parser import MySoup, Tag
+DATE_ATTRIBUTE = "data-date"
+DATE_MARKER = b"chart-date-picker"
 
 
-def read_date_from_node(node: Tag):
+def read_date_from_node(node):
     """
     Subtract the date in isoformat from the date node
 
@@ -40,60 +38,302 @@ def read_date_from_node(node: Tag):
     return date_item
 
 
+def pick_images(images_found: list):
+    """
+    Returns the image tags inside the image nodes found in a card.
+
+    Parameters:
+        - images_found: Nodes matching the images filter
+    """
+    images_nodes = []
+
+    for element in images_found:
+        image_tag = element.children[0].children[0]
+        images_nodes.append(image_tag)
+
+    return images_nodes
+
+
+def pick_extra_values(extra_nodes: list):
+    """
+    Returns the extra values (woc, last week & peaks) nodes out of the
+    nodes found in a card.
+
+    Parameters:
+        - extra_nodes: Nodes matching the extra values filter
+    """
+    final_nodes = []
+    for i, node in enumerate(extra_nodes):
+        if i % 6 < 3:
+            final_nodes.append(node)
+
+    return final_nodes
+
+
+def pick_debut_positions(debuts_pos_found: list):
+    """
+    Returns the debut position nodes out of the nodes found in a card.
+
+    Parameters:
+        - debuts_pos_found: Nodes matching the meaningful positions
+            filter
+    """
+    if len(debuts_pos_found) == 1:
+        return []
+
+    debuts_nodes = []
+
+    for i, element in enumerate(debuts_pos_found):
+        if i % 2 == 1:
+            continue
+        debuts_nodes.append(element)
+
+    return debuts_nodes
+
+
+def find_chart_date(data: bytes) -> Optional[datetime.date]:
+    """
+    Returns the chart date out of the first bytes of a chart page, or
+    None if the date picker hasn't been read yet.
+
+    Parameters:
+        - data: Bytes of the page read so far
+    """
+    date_filter = filters.DATE_FILTER
+    attributes = find_start_tag(data, date_filter.name, DATE_MARKER, date_filter.attrs)
+    if attributes is None or DATE_ATTRIBUTE not in attributes:
+        return None
+
+    return datetime.date.fromisoformat(attributes[DATE_ATTRIBUTE])
+
+
+CARD_SCANNER = None
+
+
+def get_card_scanner() -> CardScanner:
+    """
+    Returns the scanner reading the entry nodes of a card, built the
+    first time it is needed
+    """
+    global CARD_SCANNER
+
+    if CARD_SCANNER is None:
+        CARD_SCANNER = CardScanner(get_card_filters())
+
+    return CARD_SCANNER
+
+
+def get_card_filters() -> dict:
+    """
+    Returns the dictionary of {slot: filter} of the entry nodes read
+    out of every card
+    """
+    return {
+        "position": filters.POSITIONS_FILTER,
+        "title": filters.TITLES_FILTER,
+        "credits": filters.CREDITS_FILTER,
+        "meaningful_dates": filters.MEANINGUL_DATES_FILTER,
+        "meaningful_positions": filters.MEANINGUL_POSITIONS_FILTER,
+        "image": filters.IMAGES_FILTER,
+        "extra_values": filters.EXTRAS_FILTER,
+    }
+
+
 class BillboardChartWebsite():
     def __init__(self,
                  chart: str,
                  date: Optional[datetime.date] = None,
-                 yearly: bool = False) -> None:
-        index = ChartsIndex(CHARTS_FILE)
+                 yearly: bool = False,
+                 fetcher: Optional[ChartFetcher] = None,
+                 cache: Optional[HtmlCache] = None,
+                 date_cache: Optional[ChartDateCache] = None,
+                 parser: Optional[Union[str, ParserBackend]] = None,
+                 metrics: Optional[Metrics] = None) -> None:
+        index = get_index(CHARTS_FILE)
 
         self.chart = index[chart]
         self.date = date
         self.yearly = yearly
+        self.own_fetcher = fetcher
+        self.cache = cache if cache is not None else get_cache()
+        self.date_cache = date_cache if date_cache is not None else get_date_cache()
+        self.parser = get_parser(parser)
+        self.metrics = metrics if metrics is not None else get_metrics()
+
+        self.html = None
+        self.soup = None
+        self.chart_date = None
+
+        self.etag = None
+        self.last_modified = None
+        self.body_hash = None
+        # Whether the last page read by get_html was requested
+        self.downloaded = False
+
+    @property
+    def fetcher(self) -> ChartFetcher:
+        """
+        Returns the fetcher of the website. The shared one is only
+        created when a page has to be requested
+        """
+        if self.own_fetcher is not None:
+            return self.own_fetcher
 
-    def get_html(self):
+        return get_fetcher()
+
+    def set_html(self,
+                 html: str):
         """
-        Requests the Billboard website for the html code of the chart
+        Sets the html of the chart, dropping what was parsed from the
+        previous one.
+
+        Parameters:
+            - html: Html code of the chart
+        """
+        self.html = html
+        self.body_hash = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        self.soup = None
+        self.chart_date = None
+
+    def download(self):
+        """
+        Requests the Billboard website for the html code of the chart,
+        sending the validators of the last response. Returns None if
+        the page didn't change.
         """
         url = self.chart.get_url(self.date)
 
-        chart_response = requests.get(url)
-        if chart_response.status_code // 100 != 2:
-            raise ConnectionError(f"Could Not Connect To The Base Website [URL: {url} | Reason: {chart_response.reason}]")
+        html, self.etag, self.last_modified = self.fetcher.fetch_if_changed(url,
+                                                                           self.etag,
+                                                                           self.last_modified)
+
+        return html
+
+    def get_html(self):
+        """
+        Returns the html code of the chart, requesting the Billboard
+        website only if the page isn't cached
+        """
+        if self.html is not None:
+            return self.html
 
-        return chart_response.content.decode("utf-8")
+        html = self.get_cached_html()
+
+        self.downloaded = html is None
+        if html is None:
+            self.etag = None
+            self.last_modified = None
+
+            with measure(self.metrics, FETCH_STAGE, chart=self.chart.link):
+                html = self.download()
+
+            self.cache_downloaded_html(html)
+
+        self.set_html(html)
+
+        return self.html
+
+    def get_cached_html(self) -> Optional[str]:
+        """
+        Returns the cached page of the chart, or None if it isn't
+        cached, recording the cache read
+        """
+        metrics = self.metrics
+        labels = {"chart": self.chart.link}
+
+        with measure(metrics, CACHE_STAGE, **labels):
+            html = self.cache.get(self.chart.link, self.date)
+
+        if html is not None and metrics is not None:
+            metrics.add(CACHE_HITS, **labels)
+            metrics.add(BYTES_CACHED, len(html.encode("utf-8")), **labels)
+
+        return html
+
+    def cache_downloaded_html(self,
+                              html: str):
+        """
+        Caches a page that had to be requested, recording the miss.
+
+        Parameters:
+            - html: Html code of the chart
+        """
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.add(CACHE_MISSES, chart=self.chart.link)
+            metrics.add(BYTES_FETCHED, len(html.encode("utf-8")), chart=self.chart.link)
+
+        self.cache.set(self.chart.link, self.date, html)
+
+    def check_update(self):
+        """
+        Asks the Billboard website if the chart changed since it was
+        last read, using the ETag/Last-Modified validators. If the
+        server ignores them, the new page is compared by its hash. Only
+        a changed page is kept and parsed again. If the page had to be
+        requested to be read, it's already up to date. Returns a bool
+        indicating if the chart changed.
+        """
+        if self.html is None:
+            self.get_html()
+            if self.downloaded:
+                return False
+
+        html = self.download()
+        if html is None:
+            return False
+
+        if hashlib.sha256(html.encode("utf-8")).hexdigest() == self.body_hash:
+            return False
+
+        self.cache.set(self.chart.link, self.date, html)
+        self.set_html(html)
+
+        return True
 
     def get_soup(self):
         """
-        Gets the soup item of the chart
+        Gets the soup item of the chart. The page is fetched and parsed
+        only once, until refresh is called
         """
+        if self.soup is not None:
+            return self.soup
+
         html = self.get_html()
 
-        with open("chart.html", "w") as f:
-            f.write(html)
+        metrics = self.metrics
+
+        with measure(metrics, PARSE_STAGE, chart=self.chart.link):
+            self.soup = self.parser.parse(html)
 
-        return MySoup(html)
+        if metrics is not None:
+            metrics.add(BYTES_PARSED, len(html.encode("utf-8")), chart=self.chart.link)
+
+        return self.soup
+
+    def refresh(self):
+        """
+        Drops the parsed and cached page, fetching and parsing it again
+        """
+        self.cache.remove(self.chart.link, self.date)
+        self.html = None
+        self.soup = None
+        self.chart_date = None
+
+        return self.get_soup()
 
     def get_images(self,
-                   soup: Tag):
+                   soup):
         """
         Retrives the images nodes from the chart soup.
 
         Parameters:
             - soup: Chart soup to read
         """
-        images_found = soup.find_all(IMAGES_FILTER)
-
-        images_nodes = []
-
-        for i, element in enumerate(images_found, 1):
-            image_tag = element.children[0].children[0]
-            images_nodes.append(image_tag)
-
-        return images_nodes
+        return pick_images(soup.find_all(filters.IMAGES_FILTER))
 
     def get_extra_values(self,
-                         soup: Tag):
+                         soup):
         """
         Retrives the extra values (woc, last week & peaks) nodes from
         the chart soup.
@@ -101,130 +341,233 @@ class BillboardChartWebsite():
         Parameters:
             - soup: Chart soup to read
         """
-        extra_nodes = soup.find_all(EXTRAS_FILTER)
-
-        final_nodes = []
-        for i, node in enumerate(extra_nodes):
-            if i % 6 < 3:
-                final_nodes.append(node)
-
-        return final_nodes
+        return pick_extra_values(soup.find_all(filters.EXTRAS_FILTER))
 
     def get_debut_positions(self,
-                            soup: Tag):
+                            soup):
         """
         Retrives the debut position nodes from the chart soup.
 
         Parameters:
             - soup: Chart soup to read
         """
-        debuts_pos_found = soup.find_all(MEANINGUL_POSITIONS_FILTER)
+        return pick_debut_positions(soup.find_all(filters.MEANINGUL_POSITIONS_FILTER))
 
-        if len(debuts_pos_found) == 1:
-            return []
+    def get_known_chart_date(self) -> Optional[datetime.date]:
+        """
+        Returns the chart date if it is already known, from the page
+        read or from the chart dates cache, without reading the page.
+        None if it isn't known yet
+        """
+        if self.chart_date is None and self.html is None and self.date is not None:
+            self.chart_date = self.date_cache.get(self.chart.link, self.date)
 
-        debuts_nodes = []
+        return self.chart_date
 
+    def get_chart_date(self):
+        """
+        Returns the date as presented in the chart
+        """
+        chart_date = self.get_known_chart_date()
+        if chart_date is not None:
+            return chart_date
+
+        if self.soup is not None:
+            date_node = self.soup.find(filters.DATE_FILTER)
+            date_attrs = date_node.attrs if date_node is not None else None
+        else:
+            date_nodes = iter_elements(self.get_html(),
+                                       filters.DATE_FILTER.name,
+                                       filters.DATE_FILTER.attrs,
+                                       with_body=False)
+            date_attrs = next((attrs for attrs, _ in date_nodes), None)
+
+        if date_attrs is None:
+            raise DateError(f"Chart Date Not Found For {self.chart.get_url(self.date)}")
 
-        for i, element in enumerate(debuts_pos_found):
-            if i % 2 == 1:
-                continue
-            debuts_nodes.append(element)
+        self.chart_date = datetime.date.fromisoformat(date_attrs[DATE_ATTRIBUTE])
+        self.date_cache.set(self.chart.link, self.date, self.chart_date)
 
-        return debuts_nodes
+        return self.chart_date
 
-    def get_chart_date(self):
+    def resolve_chart_date(self):
         """
-        Returns the date as presented in the chart
+        Returns the date of the chart the asked date resolves to,
+        downloading only the head of the page if it isn't known yet.
+        The page itself isn't kept, so use get_chart_date instead when
+        the items are going to be read too
         """
-        soup = self.get_soup()
+        chart_date = self.get_known_chart_date()
+        if chart_date is not None:
+            return chart_date
 
-        date_node = soup.find(DATE_FILTER)
-        if date_node is None:
-            raise DateError(f"Chart Date Not Found For {self.chart.get_url(self.date)}")
+        if self.html is not None:
+            return self.get_chart_date()
 
-        chart_date = datetime.date.fromisoformat(date_node.attrs["data-date"])
+        html = self.cache.get(self.chart.link, self.date)
+        if html is not None:
+            self.set_html(html)
+            return self.get_chart_date()
+
+        url = self.chart.get_url(self.date)
+        chart_date, _ = self.fetcher.scan(url, find_chart_date)
+        if chart_date is None:
+            raise DateError(f"Chart Date Not Found For {url}")
+
+        self.chart_date = chart_date
+        self.date_cache.set(self.chart.link, self.date, chart_date)
 
         return chart_date
 
+    def iter_cards(self,
+                   cards_filter=None):
+        """
+        Yields the card node of each chart entry. If the page hasn't
+        been parsed yet, each card is parsed on its own as it is
+        reached, so the whole page is never built.
+
+        Parameters:
+            - cards_filter: Filter of the cards. If None, the one of
+                the filters file
+        """
+        cards_filter = cards_filter if cards_filter is not None else filters.CARDS_FILTER
+
+        if self.soup is not None:
+            yield from self.soup.find_all(cards_filter)
+            return
+
+        cards = iter_elements(self.get_html(),
+                              cards_filter.name,
+                              cards_filter.attrs)
+        for _, card_html in cards:
+            yield self.parser.parse(card_html).find(cards_filter)
+
+    def iter_items(self):
+        """
+        Yields the entries of the chart, one at a time as their cards
+        are read. If the page hasn't been parsed, each card is parsed on
+        its own, which only pays off when the caller stops early; use
+        get_items to read every entry
+        """
+        chart_date = self.get_chart_date()
+
+        metrics = self.metrics
+        if metrics is None:
+            for node in self.iter_cards():
+                yield self.build_item(node, chart_date)
+            return
+
+        labels = {"chart": self.chart.link}
+
+        scanner = CardScanner({slot: metrics.count_filter(slot, node_filter, **labels)
+                               for slot, node_filter in get_card_filters().items()})
+        cards = self.iter_cards(metrics.count_filter("cards", filters.CARDS_FILTER, **labels))
+
+        while True:
+            with measure(metrics, CARDS_STAGE, **labels):
+                node = next(cards, None)
+            if node is None:
+                return
+
+            with measure(metrics, FILTERS_STAGE, **labels):
+                found = scanner.scan(node)
+            with measure(metrics, BUILD_STAGE, **labels):
+                item = self.build_item_from_nodes(found, chart_date)
+            metrics.add(ITEMS_BUILT, **labels)
+
+            yield item
+
     def get_items(self):
         """
-        Returns a dict with the entries data of the chart
-        """
-        soup = self.get_soup()
-
-        items = []
-
-        date_node = soup.find(DATE_FILTER)
-        if date_node is None:
-            raise KeyError(f"Chart Date Not Found")
-
-        chart_date = datetime.date.fromisoformat(date_node.attrs["data-date"])
-
-        for node in soup.find_all(CARDS_FILTER):
-            positions_found = node.find(POSITIONS_FILTER)
-            titles_found = node.find(TITLES_FILTER)
-            credits_found = node.find(CREDITS_FILTER)
-            meaningful_dates = node.find_all(MEANINGUL_DATES_FILTER)
-  
-            images_found = self.get_images(node)
-            extras_found = self.get_extra_values(node)
-            debuts_nodes = self.get_debut_positions(node)
-
-            position = int(positions_found.text)
-            title = titles_found.text.strip()
-            image_url = images_found[0].attrs["src"]
-            last_week = extras_found[0].text.strip()
-            peak = int(extras_found[1].text)
-            weeks = int(extras_found[2].text)
-
-            if len(meaningful_dates) > 0:
-                debut_date = read_date_from_node(meaningful_dates[0])
-                if debut_date > chart_date:
-                    debut_year = debut_date.year % 1000
-                    debut_century = chart_date.year // 100
-                    new_year = debut_century * 100 + debut_year
-                    debut_date = debut_date.replace(year=new_year)
-
-                if len(debuts_nodes) == 0:
-                    debut_position = None
-                else:
-                    debut_position = int(debuts_nodes[0].text)
-            elif weeks == 1:
-                debut_date = chart_date
-                debut_position = position
-
-            if len(meaningful_dates) > 1:
-                peak_date = read_date_from_node(meaningful_dates[1])
-            elif weeks == 1:
-                peak_date = chart_date
+        Returns a list with the entries of the chart. The page is parsed
+        once and kept, so later calls reuse it
+        """
+        self.get_soup()
+
+        return list(self.iter_items())
+
+    def build_item(self,
+                   node,
+                   chart_date: datetime.date):
+        """
+        Builds the chart item of an entry card.
+
+        Parameters:
+            - node: Card node of the entry
+            - chart_date: Date of the chart the entry belongs to
+        """
+        return self.build_item_from_nodes(get_card_scanner().scan(node), chart_date)
+
+    def build_item_from_nodes(self,
+                              found: dict,
+                              chart_date: datetime.date):
+        """
+        Builds the chart item of an entry out of the nodes found in its
+        card.
+
+        Parameters:
+            - found: Dictionary of {slot: nodes} found by the card scanner
+            - chart_date: Date of the chart the entry belongs to
+        """
+        credits_found = found["credits"][0] if found["credits"] else None
+        meaningful_dates = found["meaningful_dates"]
+
+        images_found = pick_images(found["image"])
+        extras_found = pick_extra_values(found["extra_values"])
+        debuts_nodes = pick_debut_positions(found["meaningful_positions"])
+
+        position = int(found["position"][0].text)
+        title = found["title"][0].text.strip()
+        image_url = images_found[0].attrs["src"]
+        if image_url.find(NO_IMAGE) >= 0:
+            image_url = None
+        last_week = extras_found[0].text.strip()
+        last_week = int(last_week) if last_week.isdigit() else None
+        peak = int(extras_found[1].text)
+        weeks = int(extras_found[2].text)
+
+        if len(meaningful_dates) > 0:
+            debut_date = read_date_from_node(meaningful_dates[0])
+            if debut_date > chart_date:
+                debut_year = debut_date.year % 1000
+                debut_century = chart_date.year // 100
+                new_year = debut_century * 100 + debut_year
+                debut_date = debut_date.replace(year=new_year)
+
+            if len(debuts_nodes) == 0:
+                debut_position = None
             else:
-                peak_date = None
-
-            credits = None
-            if credits_found:
-                raw_credits = credits_found.text.strip().replace("\\n", " ")
-                credits = " ".join(raw_credits.split())
-                credits = credits_found.text.strip()
-
-            # Create ChartItem instance
-            chart_item = ChartItem(
-                position=position,
-                title=title,
-                image=image_url,
-                last_week=last_week,
-                peak=peak,
-                weeks=weeks,
-                debut_date=debut_date.isoformat(),
-                debut_position=debut_position,
-                peak_date=peak_date.isoformat(),
-                date=chart_date,
-                credits=credits
-            )
-
-            items.append(chart_item)
-
-        return items
+                debut_position = int(debuts_nodes[0].text)
+        elif weeks == 1:
+            debut_date = chart_date
+            debut_position = position
+
+        if len(meaningful_dates) > 1:
+            peak_date = read_date_from_node(meaningful_dates[1])
+        elif weeks == 1:
+            peak_date = chart_date
+        else:
+            peak_date = None
+
+        credits = None
+        if credits_found:
+            raw_credits = credits_found.text.strip().replace("\\n", " ")
+            credits = " ".join(raw_credits.split())
+            credits = credits_found.text.strip()
+
+        return ChartItem.from_parsed(
+            position=position,
+            title=title,
+            image=image_url,
+            last_week=last_week,
+            peak=peak,
+            weeks=weeks,
+            debut_date=debut_date,
+            debut_position=debut_position,
+            peak_date=peak_date,
+            date=chart_date,
+            credits=credits
+        )
 
     def __repr__(self) -> str:
         return f"BillboardChartWebsite(Chart: {self.chart.name} | Date: {self.date})"
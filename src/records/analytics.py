@@ -0,0 +1,216 @@
+from typing import Dict, List, Optional
+
+import array
+import datetime
+
+import numpy as np
+
+from .chart_item import NEW_CHANGE, RE_ENTRY_CHANGE, NO_CHANGE
+from .chart_item import NEW_PEAK_TEXT, RE_PEAK_TEXT, PEAK_TEXT
+from .columns import INT_COLUMNS, DATE_COLUMNS, NULL_INT
+
+EPOCH_ORDINAL = 719163
+ID_FACTOR = 10000
+
+
+def get_arrays(source) -> Dict[str, np.ndarray]:
+    """
+    Returns the number and date columns of a source as NumPy arrays,
+    without copying the buffers of ChartWeek and ChartHistory. Other
+    values, like lists, are copied into new arrays.
+
+    Parameters:
+        - source: ChartWeek, ChartHistory or dictionary of columns
+    """
+    if isinstance(source, dict):
+        columns = source
+    else:
+        columns = {name: source.column(name) for name in INT_COLUMNS + DATE_COLUMNS}
+
+    arrays = {}
+    for name in INT_COLUMNS + DATE_COLUMNS:
+        values = columns[name]
+        if isinstance(values, np.ndarray):
+            arrays[name] = values
+        elif len(values) == 0:
+            arrays[name] = np.zeros(0, dtype=np.int32)
+        elif isinstance(values, (memoryview, array.array)):
+            arrays[name] = np.frombuffer(values, dtype=np.int32)
+        else:
+            arrays[name] = np.asarray(values, dtype=np.int32)
+
+    return arrays
+
+
+def get_flags(source) -> Dict[str, np.ndarray]:
+    """
+    Returns the movement flags of every row, matching the ChartItem
+    properties of the same name, plus the change in positions.
+
+    Parameters:
+        - source: ChartWeek, ChartHistory or dictionary of columns
+    """
+    arrays = get_arrays(source)
+    position = arrays["position"]
+    last_week = arrays["last_week"]
+
+    no_last_week = last_week == NULL_INT
+    is_new = arrays["weeks"] == 1
+    is_peak = arrays["peak"] == position
+    is_new_peak = arrays["date"] == arrays["peak_date"]
+    has_changed = no_last_week | (position != last_week)
+
+    return {
+        "is_new": is_new,
+        "is_re_entry": no_last_week & ~is_new,
+        "has_changed": has_changed,
+        "is_peak": is_peak,
+        "is_new_peak": is_new_peak,
+        "is_repeak": is_peak & has_changed & ~is_new & ~is_new_peak,
+        "change": np.where(no_last_week, 0, last_week.astype(np.int64) - position),
+    }
+
+
+def get_change_texts(source) -> List[str]:
+    """
+    Returns the change text of every row, as ChartItem.change does.
+
+    Parameters:
+        - source: ChartWeek, ChartHistory or dictionary of columns
+    """
+    flags = get_flags(source)
+    change = flags["change"]
+
+    span = int(np.abs(change).max()) if len(change) else 0
+    change_table = np.array([f"{value:+d}" for value in range(-span, span + 1)], dtype=object)
+
+    texts = change_table[change + span]
+    texts[~flags["has_changed"]] = NO_CHANGE
+    texts[flags["is_re_entry"]] = RE_ENTRY_CHANGE
+    texts[flags["is_new"]] = NEW_CHANGE
+
+    return texts.tolist()
+
+
+def get_peak_texts(source) -> List[Optional[str]]:
+    """
+    Returns the peak text of every row, as ChartItem.peak_text does.
+
+    Parameters:
+        - source: ChartWeek, ChartHistory or dictionary of columns
+    """
+    flags = get_flags(source)
+
+    texts = np.full(len(flags["is_new"]), None, dtype=object)
+    texts[flags["is_peak"]] = PEAK_TEXT
+    texts[flags["is_repeak"]] = RE_PEAK_TEXT
+    texts[flags["is_new_peak"]] = NEW_PEAK_TEXT
+
+    return texts.tolist()
+
+
+def get_item_keys(arrays: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Returns a number per row identifying its item, built from the debut
+    date and debut position as ChartItem.item_id is.
+
+    Parameters:
+        - arrays: Columns of the rows
+    """
+    return arrays["debut_date"].astype(np.int64) * ID_FACTOR + arrays["debut_position"]
+
+
+def get_years(ordinals: np.ndarray) -> np.ndarray:
+    """
+    Returns the year of every day ordinal.
+
+    Parameters:
+        - ordinals: Day ordinals
+    """
+    days = (ordinals.astype(np.int64) - EPOCH_ORDINAL).astype("datetime64[D]")
+
+    return days.astype("datetime64[Y]").astype(np.int64) + 1970
+
+
+def longest_running(source,
+                    limit: int = 10) -> np.ndarray:
+    """
+    Returns the rows of the entries with the most weeks on the chart,
+    one row per entry (the one with its highest week count), sorted
+    from the longest running.
+
+    Parameters:
+        - source: ChartWeek, ChartHistory or dictionary of columns
+        - limit: Amount of entries to return
+    """
+    arrays = get_arrays(source)
+    keys = get_item_keys(arrays)
+    weeks = arrays["weeks"]
+
+    order = np.lexsort((weeks, keys))
+    last_of_key = np.ones(len(order), dtype=bool)
+    last_of_key[:-1] = keys[order][1:] != keys[order][:-1]
+    rows = order[last_of_key]
+
+    ranking = np.argsort(-weeks[rows], kind="stable")
+
+    return rows[ranking][:limit]
+
+
+def biggest_climbers(source,
+                     limit: int = 1) -> Dict:
+    """
+    Returns a dictionary of {chart date: rows} with the rows that
+    climbed the most positions each week. New entries and re-entries
+    are left out.
+
+    Parameters:
+        - source: ChartWeek, ChartHistory or dictionary of columns
+        - limit: Amount of climbers per week
+    """
+    arrays = get_arrays(source)
+    flags = get_flags(arrays)
+
+    candidates = np.flatnonzero(~flags["is_new"] & ~flags["is_re_entry"] & (flags["change"] > 0))
+    dates = arrays["date"][candidates]
+    changes = flags["change"][candidates]
+
+    order = candidates[np.lexsort((-changes, dates))]
+    dates = arrays["date"][order]
+    week_dates, starts = np.unique(dates, return_index=True)
+    ends = np.append(starts[1:], len(order))
+
+    climbers = {}
+    for date, start, end in zip(week_dates.tolist(), starts, ends):
+        climbers[datetime.date.fromordinal(date)] = order[start:min(end, start + limit)]
+
+    return climbers
+
+
+def number_ones_by_year(source) -> Dict[int, np.ndarray]:
+    """
+    Returns a dictionary of {year: rows} with the first week at number
+    one of every entry that reached it that year.
+
+    Parameters:
+        - source: ChartWeek, ChartHistory or dictionary of columns
+    """
+    arrays = get_arrays(source)
+
+    rows = np.flatnonzero(arrays["position"] == 1)
+    years = get_years(arrays["date"][rows])
+    keys = get_item_keys(arrays)[rows]
+
+    order = np.lexsort((arrays["date"][rows], keys, years))
+    rows, years, keys = rows[order], years[order], keys[order]
+
+    first = np.ones(len(rows), dtype=bool)
+    first[1:] = (years[1:] != years[:-1]) | (keys[1:] != keys[:-1])
+    rows, years = rows[first], years[first]
+
+    number_ones = {}
+    for year in np.unique(years).tolist():
+        year_rows = rows[years == year]
+        number_ones[year] = year_rows[np.argsort(arrays["date"][year_rows], kind="stable")]
+
+    return number_ones
@@ -13,37 +13,21 @@ PEAK_TEXT = "PEAK"
 NO_IMAGE = "lazyload-fallback"
 
 
-class ChartItem:
-    def __init__(self,
-                 position: int,
-                 title: str,
-                 image: str,
-                 last_week: str,
-                 peak: int,
-                 weeks: int,
-                 debut_date: str,
-                 debut_position: int,
-                 peak_date: str,
-                 date: datetime.date,
-                 credits: Optional[str] = None):
-        self.position = position
-        self.title = title
-        if image.find(NO_IMAGE) >= 0:
-            image = None
-        self.image = image
+# Derived properties shared by ChartItem and the ChartWeek views, which
+# only have to provide the fields
+class ChartItemBase():
+    __slots__ = ()
 
-        if last_week.isdigit():
-            self.last_week = int(last_week)
-        else:
-            self.last_week = None
+    def build_item_id(self) -> str:
+        """
+        Returns the id of the item, built from its debut date, debut
+        position and version
+        """
+        item_id = f"{self.debut_date}-{self.debut_position}"
+        if self.version:
+            item_id += f"-{self.version}"
 
-        self.peak = peak
-        self.weeks = weeks
-        self.debut_date = datetime.date.fromisoformat(debut_date)
-        self.debut_position = debut_position
-        self.peak_date = datetime.date.fromisoformat(peak_date)
-        self.date = date
-        self.credits = credits
+        return item_id
 
     @property
     def item_id(self):
@@ -51,7 +35,7 @@ class ChartItem:
         Returns a string that represents the chart uniquely, based on
         its debut position and debut date
         """
-        return f"{self.debut_date}-{self.debut_position}"
+        return self.build_item_id()
 
     @property
     def is_new_peak(self):
@@ -187,5 +171,135 @@ class ChartItem:
     def __str__(self):
         return self.text
 
-    def __eq__(self, other: "ChartItem"):
-        return self.item_id == other.item_id
\ No newline at end of file
+    def __eq__(self, other: "ChartItemBase"):
+        if not isinstance(other, ChartItemBase):
+            return NotImplemented
+
+        return self.item_id == other.item_id
+
+    def __hash__(self):
+        # Versions of the same debut share the hash, so it doesn't
+        # change when update_version is called
+        return hash((self.debut_date, self.debut_position))
+
+
+class ChartItem(ChartItemBase):
+    __slots__ = ("position", "title", "image", "last_week", "peak", "weeks",
+                 "_debut_date", "_debut_position", "peak_date", "date",
+                 "credits", "version", "_item_id")
+
+    def __init__(self,
+                 position: int,
+                 title: str,
+                 image: str,
+                 last_week: str,
+                 peak: int,
+                 weeks: int,
+                 debut_date: str,
+                 debut_position: int,
+                 peak_date: str,
+                 date: datetime.date,
+                 credits: Optional[str] = None):
+        self.position = position
+        self.title = title
+        if image.find(NO_IMAGE) >= 0:
+            image = None
+        self.image = image
+
+        if last_week.isdigit():
+            self.last_week = int(last_week)
+        else:
+            self.last_week = None
+
+        self.peak = peak
+        self.weeks = weeks
+        self._debut_date = datetime.date.fromisoformat(debut_date)
+        self._debut_position = debut_position
+        self.peak_date = datetime.date.fromisoformat(peak_date)
+        self.date = date
+        self.credits = credits
+        self.version = 0
+        self._item_id = None
+
+    @classmethod
+    def from_parsed(cls,
+                    position: int,
+                    title: str,
+                    image: Optional[str],
+                    last_week: Optional[int],
+                    peak: int,
+                    weeks: int,
+                    debut_date: datetime.date,
+                    debut_position: Optional[int],
+                    peak_date: datetime.date,
+                    date: datetime.date,
+                    credits: Optional[str] = None) -> "ChartItem":
+        """
+        Builds an item out of values that are already typed, skipping
+        the parsing done by the constructor.
+
+        Parameters:
+            - position: Position in the chart
+            - title: Title of the entry
+            - image: Url of the image, None if it has none
+            - last_week: Position the week before, None if it wasn't on
+                the chart
+            - peak: Peak position
+            - weeks: Weeks on the chart
+            - debut_date: Date of the debut
+            - debut_position: Position of the debut
+            - peak_date: Date of the peak
+            - date: Date of the chart
+            - credits: Credits of the entry
+        """
+        item = cls.__new__(cls)
+        item.position = position
+        item.title = title
+        item.image = image
+        item.last_week = last_week
+        item.peak = peak
+        item.weeks = weeks
+        item._debut_date = debut_date
+        item._debut_position = debut_position
+        item.peak_date = peak_date
+        item.date = date
+        item.credits = credits
+        item.version = 0
+        item._item_id = None
+
+        return item
+
+    @property
+    def debut_date(self) -> datetime.date:
+        """
+        Returns the date of the debut. It is part of the identity of
+        the item, so it can't be changed
+        """
+        return self._debut_date
+
+    @property
+    def debut_position(self) -> Optional[int]:
+        """
+        Returns the position of the debut. It is part of the identity
+        of the item, so it can't be changed
+        """
+        return self._debut_position
+
+    @property
+    def item_id(self):
+        """
+        Returns a string that represents the chart uniquely, based on
+        its debut position and debut date
+        """
+        if self._item_id is None:
+            self._item_id = self.build_item_id()
+
+        return self._item_id
+
+    def update_version(self):
+        """
+        Marks the record as a new version of the same debut, changing
+        its id
+        """
+        self.version += 1
+        self._item_id = None
@@ -0,0 +1,192 @@
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from array import array
+
+import datetime
+import sys
+
+from .chart_item import ChartItem, ChartItemBase
+from .columns import INT_COLUMNS, DATE_COLUMNS, STRING_COLUMNS
+from .columns import to_int, to_ordinal, from_int, from_ordinal
+
+INT_CODE = "i"
+
+
+def int_field(name: str):
+    return property(lambda self: from_int(self.week.columns[name][self.index]))
+
+
+def date_field(name: str):
+    return property(lambda self: from_ordinal(self.week.columns[name][self.index]))
+
+
+def string_field(name: str):
+    return property(lambda self: self.week.columns[name][self.index])
+
+
+class ChartItemView(ChartItemBase):
+    __slots__ = ("week", "index")
+
+    # Rows of a week are always the first version of their debut
+    version = 0
+
+    position = int_field("position")
+    last_week = int_field("last_week")
+    peak = int_field("peak")
+    weeks = int_field("weeks")
+    debut_position = int_field("debut_position")
+    date = date_field("date")
+    debut_date = date_field("debut_date")
+    peak_date = date_field("peak_date")
+    title = string_field("title")
+    credits = string_field("credits")
+    image = string_field("image")
+
+    def __init__(self,
+                 week: "ChartWeek",
+                 index: int) -> None:
+        """
+        Read only chart item backed by a row of a chart week.
+
+        Parameters:
+            - week: Week holding the item values
+            - index: Row of the item in the week
+        """
+        self.week = week
+        self.index = index
+
+
+class ChartWeek():
+    def __init__(self,
+                 date: datetime.date,
+                 items: Iterable[ChartItem] = ()) -> None:
+        """
+        Entries of a single chart week, kept in parallel arrays: one
+        int array per number or date (as day ordinal) column and one
+        list per string column.
+
+        Parameters:
+            - date: Date of the chart
+            - items: Items of the week
+        """
+        self.date = date
+        self.columns = {}
+
+        for name in INT_COLUMNS + DATE_COLUMNS:
+            self.columns[name] = array(INT_CODE)
+        for name in STRING_COLUMNS:
+            self.columns[name] = []
+
+        for item in items:
+            self.append(item)
+
+    @classmethod
+    def from_history(cls,
+                     history,
+                     start: int,
+                     end: int) -> "ChartWeek":
+        """
+        Builds the week stored between two rows of a chart history.
+
+        Parameters:
+            - history: ChartHistory read from a chart store
+            - start: First row of the week
+            - end: End row of the week, not included
+        """
+        week = cls(from_ordinal(history.column("date")[start]))
+
+        for name in INT_COLUMNS + DATE_COLUMNS:
+            week.columns[name] = array(INT_CODE, history.column(name)[start:end])
+        for name in STRING_COLUMNS:
+            week.columns[name] = [history.get_string(string_id)
+                                  for string_id in history.column(name)[start:end]]
+
+        return week
+
+    def append(self,
+               item: ChartItem):
+        """
+        Adds an item at the end of the week.
+
+        Parameters:
+            - item: Item to add
+        """
+        columns = self.columns
+
+        for name in INT_COLUMNS:
+            columns[name].append(to_int(getattr(item, name)))
+        for name in DATE_COLUMNS:
+            columns[name].append(to_ordinal(getattr(item, name)))
+        for name in STRING_COLUMNS:
+            value = getattr(item, name)
+            columns[name].append(value if value is None else sys.intern(value))
+
+    def column(self,
+               name: str):
+        """
+        Returns the values of a column. Dates are day ordinals.
+
+        Parameters:
+            - name: Name of the column
+        """
+        return self.columns[name]
+
+    def get_by_id(self,
+                  item_id: str) -> Optional[ChartItemView]:
+        """
+        Returns the item with the given id, or None if it isn't in the
+        week.
+
+        Parameters:
+            - item_id: Id of the item
+        """
+        return self.items_by_id().get(item_id)
+
+    def items_by_id(self) -> Dict[str, ChartItemView]:
+        """
+        Returns a dictionary of {item_id: item} with the week items
+        """
+        return {item.item_id: item for item in self}
+
+    def to_items(self) -> List[ChartItem]:
+        """
+        Returns standalone chart items copied out of the week
+        """
+        items = []
+        for view in self:
+            items.append(ChartItem.from_parsed(position=view.position,
+                                               title=view.title,
+                                               image=view.image,
+                                               last_week=view.last_week,
+                                               peak=view.peak,
+                                               weeks=view.weeks,
+                                               debut_date=view.debut_date,
+                                               debut_position=view.debut_position,
+                                               peak_date=view.peak_date,
+                                               date=view.date,
+                                               credits=view.credits))
+
+        return items
+
+    def __getitem__(self,
+                    index: int) -> ChartItemView:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(f"Chart Week Index Out Of Range [{index}]")
+
+        return ChartItemView(self, index)
+
+    def __iter__(self) -> Iterator[ChartItemView]:
+        for index in range(len(self)):
+            yield ChartItemView(self, index)
+
+    def __len__(self):
+        return len(self.columns["position"])
+
+    def __repr__(self) -> str:
+        return f"ChartWeek(Date: {self.date} | Items: {len(self)})"
+
+    def __str__(self) -> str:
+        return f"ChartWeek(Date: {self.date} | Items: {len(self)})"
@@ -0,0 +1,53 @@
+from typing import Optional
+
+import datetime
+
+INT_COLUMNS = ("position", "last_week", "peak", "weeks", "debut_position")
+DATE_COLUMNS = ("date", "debut_date", "peak_date")
+STRING_COLUMNS = ("title", "credits", "image")
+
+COLUMNS = INT_COLUMNS + DATE_COLUMNS + STRING_COLUMNS
+
+NULL_INT = -1
+NULL_DATE = 0
+NULL_STRING = -1
+
+
+def to_int(value: Optional[int]) -> int:
+    """
+    Returns the column value of an optional integer.
+
+    Parameters:
+        - value: Integer to store, or None
+    """
+    return NULL_INT if value is None else value
+
+
+def from_int(value: int) -> Optional[int]:
+    """
+    Returns the optional integer of a column value.
+
+    Parameters:
+        - value: Stored integer
+    """
+    return None if value == NULL_INT else value
+
+
+def to_ordinal(date: Optional[datetime.date]) -> int:
+    """
+    Returns the column value of an optional date, its day ordinal.
+
+    Parameters:
+        - date: Date to store, or None
+    """
+    return NULL_DATE if date is None else date.toordinal()
+
+
+def from_ordinal(ordinal: int) -> Optional[datetime.date]:
+    """
+    Returns the optional date of a column value.
+
+    Parameters:
+        - ordinal: Stored day ordinal
+    """
+    return None if ordinal == NULL_DATE else datetime.date.fromordinal(ordinal)
@@ -0,0 +1,119 @@
+from typing import Dict, Iterable, List, Optional
+
+from .chart_item import ChartItem
+from .chart_item import NEW_PEAK_TEXT, RE_PEAK_TEXT
+
+DEBUT_EVENT = "debut"
+RE_ENTRY_EVENT = "re-entry"
+DROP_OUT_EVENT = "drop-out"
+CLIMB_EVENT = "climb"
+FALL_EVENT = "fall"
+NEW_PEAK_EVENT = "new-peak"
+RE_PEAK_EVENT = "re-peak"
+
+EVENTS = (DEBUT_EVENT, RE_ENTRY_EVENT, DROP_OUT_EVENT, CLIMB_EVENT, FALL_EVENT, NEW_PEAK_EVENT, RE_PEAK_EVENT)
+
+
+class ChartEvent():
+    def __init__(self,
+                 kind: str,
+                 item: ChartItem,
+                 position: Optional[int],
+                 last_position: Optional[int]) -> None:
+        """
+        Movement of an entry between two chart weeks.
+
+        Parameters:
+            - kind: Kind of the event, one of EVENTS
+            - item: Item of the entry in the current week, or in the
+                previous one for drop outs
+            - position: Position in the current week, None for drop outs
+            - last_position: Position in the previous week, None if the
+                entry wasn't on it
+        """
+        self.kind = kind
+        self.item = item
+        self.position = position
+        self.last_position = last_position
+
+    @property
+    def item_id(self) -> str:
+        return self.item.item_id
+
+    @property
+    def change(self) -> Optional[int]:
+        """
+        Returns the positions gained since the previous week, negative
+        when fallen. None if the entry isn't on both weeks
+        """
+        if self.position is None or self.last_position is None:
+            return None
+
+        return self.last_position - self.position
+
+    def __repr__(self) -> str:
+        return f"ChartEvent(Kind: {self.kind} | Title: {self.item.title} | Position: {self.position} | Last Week: {self.last_position})"
+
+    def __str__(self) -> str:
+        return f"ChartEvent(Kind: {self.kind} | Title: {self.item.title} | Position: {self.position} | Last Week: {self.last_position})"
+
+
+def diff_weeks(previous: Iterable[ChartItem],
+               current: Iterable[ChartItem]) -> List[ChartEvent]:
+    """
+    Returns the events between two consecutive weeks of a chart, with
+    the entries matched by item id. Events follow the current week
+    order, with the drop outs last in the previous week order.
+
+    An entry not on the previous week is a debut on its first week and
+    a re-entry otherwise. Entries on both weeks climb or fall by their
+    change in position. Peaks are reported as ChartItem.peak_text does,
+    except the new peak of a debut, which is implied.
+
+    Parameters:
+        - previous: Items of the previous week, ChartItem or ChartWeek
+        - current: Items of the current week, ChartItem or ChartWeek
+    """
+    remaining = {item.item_id: item for item in previous}
+    events = []
+
+    for item in current:
+        position = item.position
+        last_item = remaining.pop(item.item_id, None)
+
+        if last_item is None:
+            kind = DEBUT_EVENT if item.is_new else RE_ENTRY_EVENT
+            events.append(ChartEvent(kind, item, position, None))
+            last_position = None
+        else:
+            last_position = last_item.position
+            if last_position > position:
+                events.append(ChartEvent(CLIMB_EVENT, item, position, last_position))
+            elif last_position < position:
+                events.append(ChartEvent(FALL_EVENT, item, position, last_position))
+
+        peak_text = item.peak_text
+        if peak_text == NEW_PEAK_TEXT and not item.is_new:
+            events.append(ChartEvent(NEW_PEAK_EVENT, item, position, last_position))
+        elif peak_text == RE_PEAK_TEXT:
+            events.append(ChartEvent(RE_PEAK_EVENT, item, position, last_position))
+
+    for item in remaining.values():
+        events.append(ChartEvent(DROP_OUT_EVENT, item, None, item.position))
+
+    return events
+
+
+def group_events(events: Iterable[ChartEvent]) -> Dict[str, List[ChartEvent]]:
+    """
+    Returns the events as a dictionary of {kind: events}, with every
+    kind present.
+
+    Parameters:
+        - events: Events to group
+    """
+    groups = {kind: [] for kind in EVENTS}
+    for event in events:
+        groups[event.kind].append(event)
+
+    return groups
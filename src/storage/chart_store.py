@@ -0,0 +1,398 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from array import array
+
+import datetime
+import json
+import mmap
+import os
+
+from ..records.chart_item import ChartItem
+from ..records.columns import INT_COLUMNS, DATE_COLUMNS, STRING_COLUMNS
+from ..records.columns import NULL_STRING, to_int, to_ordinal
+from ..records.columns import from_int, from_ordinal
+from .identity_index import IdentityIndex
+
+INT_CODE = "i"
+OFFSET_CODE = "q"
+
+COLUMN_EXTENSION = ".i32"
+META_FILE = "meta.json"
+STRINGS_FILE = "strings.bin"
+STRING_OFFSETS_FILE = "strings.idx"
+WEEKS_FILE = "week_index.bin"
+
+ROWS_FIELD = "rows"
+STRINGS_FIELD = "strings"
+WEEKS_FIELD = "weeks"
+STRINGS_SIZE_FIELD = "strings_size"
+
+
+def map_file(path: str,
+             code: str,
+             length: int):
+    """
+    Returns the memory map of a file and a typed view over its first
+    length values. The map is None when there is nothing to map.
+
+    Parameters:
+        - path: Path of the file
+        - code: Array type code of the values
+        - length: Amount of values to view
+    """
+    if length == 0:
+        return None, memoryview(array(code))
+
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    size = length * array(code).itemsize
+    view = memoryview(mapped)[:size].cast(code)
+
+    return mapped, view
+
+
+class ChartHistory():
+    def __init__(self,
+                 folder: str,
+                 meta: dict) -> None:
+        """
+        Read only, memory mapped view of every week in a chart store.
+
+        Parameters:
+            - folder: Folder of the store
+            - meta: Counts stored in the store meta file
+        """
+        self.folder = folder
+        self.rows = meta[ROWS_FIELD]
+        self.maps = []
+        self.columns = {}
+
+        for name in INT_COLUMNS + DATE_COLUMNS + STRING_COLUMNS:
+            path = os.path.join(folder, f"{name}{COLUMN_EXTENSION}")
+            self.columns[name] = self.map(path, INT_CODE, self.rows)
+
+        self.weeks = meta[WEEKS_FIELD]
+        self.week_index = self.map(os.path.join(folder, WEEKS_FILE), INT_CODE, 2 * self.weeks)
+
+        self.string_offsets = self.map(os.path.join(folder, STRING_OFFSETS_FILE),
+                                       OFFSET_CODE,
+                                       meta[STRINGS_FIELD] + 1 if meta[STRINGS_FIELD] else 0)
+        self.strings = self.map(os.path.join(folder, STRINGS_FILE),
+                                "B",
+                                meta[STRINGS_SIZE_FIELD])
+
+    def map(self,
+            path: str,
+            code: str,
+            length: int):
+        mapped, view = map_file(path, code, length)
+        if mapped is not None:
+            self.maps.append((mapped, view))
+
+        return view
+
+    def column(self,
+               name: str) -> memoryview:
+        """
+        Returns the values of a column. Dates are day ordinals and
+        strings are ids of the strings table.
+
+        Parameters:
+            - name: Name of the column
+        """
+        return self.columns[name]
+
+    def get_string(self,
+                   string_id: int) -> Optional[str]:
+        """
+        Returns a string of the strings table.
+
+        Parameters:
+            - string_id: Id of the string
+        """
+        if string_id == NULL_STRING:
+            return None
+
+        start = self.string_offsets[string_id]
+        end = self.string_offsets[string_id + 1]
+
+        return bytes(self.strings[start:end]).decode("utf-8")
+
+    def iter_weeks(self) -> Iterator[Tuple[datetime.date, int, int]]:
+        """
+        Yields the date, first row and end row of every stored week
+        """
+        week_index = self.week_index
+        for i in range(0, 2 * self.weeks, 2):
+            end = week_index[i + 3] if i + 2 < 2 * self.weeks else self.rows
+            yield datetime.date.fromordinal(week_index[i]), week_index[i + 1], end
+
+    @property
+    def last_date(self) -> Optional[datetime.date]:
+        """
+        Returns the date of the last stored week
+        """
+        if self.weeks == 0:
+            return None
+
+        return datetime.date.fromordinal(self.week_index[-2])
+
+    def get_item(self,
+                 row: int) -> ChartItem:
+        """
+        Builds the chart item stored at a row.
+
+        Parameters:
+            - row: Row of the item
+        """
+        columns = self.columns
+
+        return ChartItem.from_parsed(
+            position=columns["position"][row],
+            title=self.get_string(columns["title"][row]),
+            image=self.get_string(columns["image"][row]),
+            last_week=from_int(columns["last_week"][row]),
+            peak=columns["peak"][row],
+            weeks=columns["weeks"][row],
+            debut_date=from_ordinal(columns["debut_date"][row]),
+            debut_position=from_int(columns["debut_position"][row]),
+            peak_date=from_ordinal(columns["peak_date"][row]),
+            date=from_ordinal(columns["date"][row]),
+            credits=self.get_string(columns["credits"][row])
+        )
+
+    def get_items(self,
+                  start: int = 0,
+                  end: Optional[int] = None) -> List[ChartItem]:
+        """
+        Builds the chart items stored between two rows.
+
+        Parameters:
+            - start: First row
+            - end: End row, not included. If None, up to the last row
+        """
+        end = self.rows if end is None else end
+
+        return [self.get_item(row) for row in range(start, end)]
+
+    def close(self):
+        """
+        Releases the views of the columns and closes the memory maps, so
+        the views given by column can't be read afterwards. A map still
+        exported, by a slice or a NumPy array of a column, is left open
+        until those are dropped
+        """
+        for mapped, view in self.maps:
+            try:
+                view.release()
+                mapped.close()
+            except BufferError:
+                pass
+        self.maps = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self.rows
+
+    def __repr__(self) -> str:
+        return f"ChartHistory(folder={self.folder} | Rows: {self.rows})"
+
+    def __str__(self) -> str:
+        return f"ChartHistory(folder={self.folder} | Rows: {self.rows})"
+
+
+class ChartStore():
+    def __init__(self,
+                 folder: str) -> None:
+        """
+        Columnar, append only store of the weeks of a single chart.
+
+        Integers and dates (as day ordinals) are stored as int32 files,
+        one per column, and strings as ids of a shared strings table.
+        The meta file is written last, so a partially appended week is
+        dropped the next time the store is opened.
+
+        Parameters:
+            - folder: Folder of the store. Created if it doesn't exist
+        """
+        self.folder = folder
+        os.makedirs(folder, exist_ok=True)
+
+        self.meta = self.read_meta()
+        self.string_ids = None
+        self.identity_index = None
+        self.truncate()
+
+    def get_path(self,
+                 name: str):
+        return os.path.join(self.folder, name)
+
+    def read_meta(self) -> dict:
+        """
+        Returns the counts of the store
+        """
+        meta = {ROWS_FIELD: 0, WEEKS_FIELD: 0, STRINGS_FIELD: 0, STRINGS_SIZE_FIELD: 0}
+
+        path = self.get_path(META_FILE)
+        if os.path.isfile(path):
+            with open(path) as f:
+                meta.update(json.load(f))
+
+        return meta
+
+    def write_meta(self,
+                   meta: dict):
+        path = self.get_path(META_FILE)
+        temp_path = f"{path}.tmp"
+
+        with open(temp_path, "w") as f:
+            json.dump(meta, f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(temp_path, path)
+
+    def truncate(self):
+        """
+        Drops any data written after the last complete append
+        """
+        int_size = array(INT_CODE).itemsize
+        offset_size = array(OFFSET_CODE).itemsize
+        strings = self.meta[STRINGS_FIELD]
+
+        sizes = {f"{name}{COLUMN_EXTENSION}": self.meta[ROWS_FIELD] * int_size
+                 for name in INT_COLUMNS + DATE_COLUMNS + STRING_COLUMNS}
+        sizes[WEEKS_FILE] = 2 * self.meta[WEEKS_FIELD] * int_size
+        sizes[STRING_OFFSETS_FILE] = (strings + 1) * offset_size if strings else 0
+        sizes[STRINGS_FILE] = self.meta[STRINGS_SIZE_FIELD]
+
+        for name, size in sizes.items():
+            path = self.get_path(name)
+            with open(path, "ab") as f:
+                if f.tell() != size:
+                    f.truncate(size)
+
+    def load_strings(self) -> Dict[str, int]:
+        """
+        Returns the dictionary of {string: id} of the strings table
+        """
+        if self.string_ids is not None:
+            return self.string_ids
+
+        self.string_ids = {}
+        with self.read() as history:
+            for string_id in range(self.meta[STRINGS_FIELD]):
+                self.string_ids[history.get_string(string_id)] = string_id
+
+        return self.string_ids
+
+    def append_week(self,
+                    items: List[ChartItem]):
+        """
+        Appends the items of a chart week to the store.
+
+        Parameters:
+            - items: Items of the week, all of the same chart date
+        """
+        if len(items) == 0:
+            return
+
+        string_ids = self.load_strings()
+        # Ids of the strings this week adds, merged into string_ids
+        # only once the files are written
+        new_ids = {}
+        new_strings = []
+
+        def get_string_id(value: Optional[str]) -> int:
+            if value is None:
+                return NULL_STRING
+            string_id = string_ids.get(value)
+            if string_id is None:
+                string_id = new_ids.get(value)
+            if string_id is None:
+                string_id = len(string_ids) + len(new_ids)
+                new_ids[value] = string_id
+                new_strings.append(value.encode("utf-8"))
+            return string_id
+
+        columns = {name: array(INT_CODE) for name in INT_COLUMNS + DATE_COLUMNS + STRING_COLUMNS}
+        for item in items:
+            for name in INT_COLUMNS:
+                columns[name].append(to_int(getattr(item, name)))
+            for name in DATE_COLUMNS:
+                columns[name].append(to_ordinal(getattr(item, name)))
+            for name in STRING_COLUMNS:
+                columns[name].append(get_string_id(getattr(item, name)))
+
+        strings_size = self.meta[STRINGS_SIZE_FIELD]
+        offsets = array(OFFSET_CODE)
+        if new_strings and self.meta[STRINGS_FIELD] == 0:
+            offsets.append(0)
+        for value in new_strings:
+            strings_size += len(value)
+            offsets.append(strings_size)
+
+        meta = dict(self.meta)
+        meta[ROWS_FIELD] += len(items)
+        meta[WEEKS_FIELD] += 1
+        meta[STRINGS_FIELD] += len(new_ids)
+        meta[STRINGS_SIZE_FIELD] = strings_size
+
+        try:
+            if new_strings:
+                with open(self.get_path(STRINGS_FILE), "ab") as f:
+                    f.write(b"".join(new_strings))
+                with open(self.get_path(STRING_OFFSETS_FILE), "ab") as f:
+                    offsets.tofile(f)
+
+            for name, values in columns.items():
+                with open(self.get_path(f"{name}{COLUMN_EXTENSION}"), "ab") as f:
+                    values.tofile(f)
+
+            week = array(INT_CODE, [items[0].date.toordinal(), self.meta[ROWS_FIELD]])
+            with open(self.get_path(WEEKS_FILE), "ab") as f:
+                week.tofile(f)
+
+            self.write_meta(meta)
+        except BaseException:
+            # Drops what was written, the store keeps its last week
+            self.truncate()
+            raise
+
+        self.meta = meta
+        string_ids.update(new_ids)
+
+    def read(self) -> ChartHistory:
+        """
+        Returns a memory mapped view of every stored week
+        """
+        return ChartHistory(self.folder, dict(self.meta))
+
+    def get_identity_index(self) -> IdentityIndex:
+        """
+        Returns the identity index of the store, indexing first the
+        weeks appended since it was last asked for
+        """
+        if self.identity_index is None:
+            self.identity_index = IdentityIndex()
+
+        if self.identity_index.indexed < self.meta[ROWS_FIELD]:
+            with self.read() as history:
+                self.identity_index.update(history)
+
+        return self.identity_index
+
+    def __len__(self):
+        return self.meta[ROWS_FIELD]
+
+    def __repr__(self) -> str:
+        return f"ChartStore(folder={self.folder} | Rows: {self.meta[ROWS_FIELD]})"
+
+    def __str__(self) -> str:
+        return f"ChartStore(folder={self.folder} | Rows: {self.meta[ROWS_FIELD]})"
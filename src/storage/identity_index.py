@@ -0,0 +1,192 @@
+from typing import TYPE_CHECKING, Dict, List, Set
+
+from array import array
+
+import re
+
+from ..records.chart_item import ChartItem
+from ..records.columns import NULL_STRING, from_int, from_ordinal
+
+if TYPE_CHECKING:
+    from .chart_store import ChartHistory
+
+ROWS_CODE = "i"
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+ARTISTS_SEPARATOR_PATTERN = re.compile(r"\s+(?:featuring|feat\.?|ft\.?|with|x|&|and)\s+|\s*[,/;]\s*",
+                                       re.IGNORECASE)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Returns the form in which titles and artists are compared: lower
+    cased words split by single spaces.
+
+    Parameters:
+        - text: Text to normalize
+    """
+    return " ".join(WORD_PATTERN.findall(text.lower()))
+
+
+def get_artists(credits: str) -> List[str]:
+    """
+    Returns the normalized artists named in the credits of an entry,
+    starting with the whole credits.
+
+    Parameters:
+        - credits: Credits of the entry
+    """
+    artists = [normalize_text(credits)]
+
+    for artist in ARTISTS_SEPARATOR_PATTERN.split(credits):
+        artist = normalize_text(artist)
+        if artist and artist not in artists:
+            artists.append(artist)
+
+    return artists
+
+
+def get_item_id(debut_date: int,
+                debut_position: int) -> str:
+    """
+    Returns the item id of an entry out of its stored columns, the same
+    way ChartItem.item_id builds it.
+
+    Parameters:
+        - debut_date: Stored day ordinal of the debut date
+        - debut_position: Stored debut position
+    """
+    date = from_ordinal(debut_date)
+    date_text = date.isoformat() if date is not None else None
+
+    return f"{date_text}-{from_int(debut_position)}"
+
+
+class IdentityIndex():
+    def __init__(self) -> None:
+        """
+        Index of the entries of a chart store by identity. Maps every
+        item id to the rows where it appears, and normalized titles and
+        artists to the item ids they belong to.
+
+        The store is append only, so update only reads the rows added
+        since the last call.
+        """
+        self.rows: Dict[str, array] = {}
+        self.titles: Dict[str, Set[str]] = {}
+        self.artists: Dict[str, Set[str]] = {}
+        self.indexed = 0
+
+    def update(self,
+               history: "ChartHistory"):
+        """
+        Indexes the rows of the history not indexed yet.
+
+        Parameters:
+            - history: History of the store being indexed
+        """
+        debut_dates = history.column("debut_date")
+        debut_positions = history.column("debut_position")
+        titles = history.column("title")
+        credits = history.column("credits")
+
+        ids = {}
+        title_texts = {}
+        credits_artists = {}
+
+        for row in range(self.indexed, history.rows):
+            key = (debut_dates[row], debut_positions[row])
+            item_id = ids.get(key)
+            if item_id is None:
+                item_id = ids[key] = get_item_id(*key)
+
+            rows = self.rows.get(item_id)
+            if rows is None:
+                rows = self.rows[item_id] = array(ROWS_CODE)
+            rows.append(row)
+
+            title_id = titles[row]
+            if title_id != NULL_STRING:
+                title = title_texts.get(title_id)
+                if title is None:
+                    title = title_texts[title_id] = normalize_text(history.get_string(title_id))
+                self.titles.setdefault(title, set()).add(item_id)
+
+            credits_id = credits[row]
+            if credits_id != NULL_STRING:
+                artists = credits_artists.get(credits_id)
+                if artists is None:
+                    artists = credits_artists[credits_id] = get_artists(history.get_string(credits_id))
+                for artist in artists:
+                    self.artists.setdefault(artist, set()).add(item_id)
+
+        self.indexed = history.rows
+
+    def get_rows(self,
+                 item_id: str) -> List[int]:
+        """
+        Returns the rows where an entry appears, in chart order.
+
+        Parameters:
+            - item_id: Id of the entry
+        """
+        return list(self.rows.get(item_id, ()))
+
+    def find_title(self,
+                   title: str) -> List[str]:
+        """
+        Returns the ids of the entries with a title.
+
+        Parameters:
+            - title: Title to look for, compared normalized
+        """
+        return sorted(self.titles.get(normalize_text(title), ()))
+
+    def find_artist(self,
+                    artist: str) -> List[str]:
+        """
+        Returns the ids of the entries crediting an artist, alone or
+        together with others.
+
+        Parameters:
+            - artist: Artist to look for, compared normalized
+        """
+        return sorted(self.artists.get(normalize_text(artist), ()))
+
+    def get_run(self,
+                history: "ChartHistory",
+                item_id: str) -> List[ChartItem]:
+        """
+        Returns every week of an entry in the chart, in chart order.
+
+        Parameters:
+            - history: History of the indexed store
+            - item_id: Id of the entry
+        """
+        return [history.get_item(row) for row in self.rows.get(item_id, ())]
+
+    def get_artist_items(self,
+                         history: "ChartHistory",
+                         artist: str) -> Dict[str, List[ChartItem]]:
+        """
+        Returns the runs of every entry crediting an artist, as a
+        dictionary of {item_id: items}.
+
+        Parameters:
+            - history: History of the indexed store
+            - artist: Artist to look for, compared normalized
+        """
+        return {item_id: self.get_run(history, item_id)
+                for item_id in self.find_artist(artist)}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, item_id: str):
+        return item_id in self.rows
+
+    def __repr__(self) -> str:
+        return f"IdentityIndex(Entries: {len(self.rows)} | Rows: {self.indexed})"
+
+    def __str__(self) -> str:
+        return f"IdentityIndex(Entries: {len(self.rows)} | Rows: {self.indexed})"
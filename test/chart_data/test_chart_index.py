@@ -1,8 +1,10 @@
+import json
 import os
+import shutil
 import pytest
 
 from src.chart_data.chart_data import ChartData
-from src.chart_data.chart_index import ChartsIndex
+from src.chart_data.chart_index import ChartsIndex, LOADED_INDEXES, get_index
 
 THIS_FOLDER = os.path.dirname(__file__)
 TEST_FILE = os.path.join(THIS_FOLDER, "charts_test.json")
@@ -59,3 +61,64 @@ def test_charts_index_repr_and_str():
     text = str(index)
     assert "ChartsIndex(file=" in text
     assert "Items: 3" in text
+
+
+def test_charts_index_lookup_ignores_spaces_and_case():
+    index = ChartsIndex(TEST_FILE)
+    assert index.get_chart("  billboard 200 ").abbreviation == "BB200"
+
+
+def test_get_index_is_shared():
+    assert get_index(TEST_FILE) is get_index(TEST_FILE)
+
+
+def test_get_index_reloads_changed_file(tmp_path):
+    file = tmp_path / "charts.json"
+    shutil.copy(TEST_FILE, file)
+    first = get_index(str(file))
+
+    with open(file) as f:
+        charts = json.load(f)
+    charts.append({"abbreviation": "new", "name": "New Chart"})
+    with open(file, "w") as f:
+        json.dump(charts, f)
+    os.utime(file, (0, os.path.getmtime(file) + 10))
+
+    second = get_index(str(file))
+    assert second is not first
+    assert len(second) == 4
+
+
+def test_get_index_snapshot(tmp_path):
+    file = tmp_path / "charts.json"
+    snapshot = tmp_path / "charts.pickle"
+    shutil.copy(TEST_FILE, file)
+
+    get_index(str(file), str(snapshot))
+    assert snapshot.is_file()
+
+    LOADED_INDEXES.clear()
+    index = get_index(str(file), str(snapshot))
+    assert index["hot100"].name == "Hot 100"
+
+
+def test_snapshot_leaves_searcher_out(tmp_path):
+    file = tmp_path / "charts.json"
+    snapshot = tmp_path / "charts.pickle"
+    shutil.copy(TEST_FILE, file)
+
+    index = get_index(str(file))
+    expected = index.search("hot")
+    assert index.searcher is not None
+    index.save_snapshot(str(snapshot))
+
+    LOADED_INDEXES.clear()
+    loaded = get_index(str(file), str(snapshot))
+    assert loaded is not index
+    assert loaded.searcher is None
+    assert [chart.abbreviation for _, chart in loaded.search("hot")] == [chart.abbreviation for _, chart in expected]
+
+
+def test_get_index_file_not_found():
+    with pytest.raises(OSError):
+        get_index("non_existent_file.json")
@@ -0,0 +1,56 @@
+import os
+
+from src.chart_data.chart_data import ChartData
+from src.chart_data.chart_index import ChartsIndex
+from src.chart_data.chart_search import ChartSearch, get_trigrams
+
+THIS_FOLDER = os.path.dirname(__file__)
+TEST_FILE = os.path.join(THIS_FOLDER, "charts_test.json")
+
+
+def test_get_trigrams():
+    assert get_trigrams("Hot") == {"  h", " ho", "hot", "ot "}
+    assert get_trigrams("HOT!") == get_trigrams("hot")
+
+
+def test_search_exact_key_first():
+    index = ChartsIndex(TEST_FILE)
+    score, chart = index.search("hot-100")[0]
+    assert chart.abbreviation == "HOT100"
+
+
+def test_search_misspelled():
+    index = ChartsIndex(TEST_FILE)
+    _, chart = index.search("bilboard 20")[0]
+    assert chart.abbreviation == "BB200"
+
+
+def test_search_prefix():
+    index = ChartsIndex(TEST_FILE)
+    names = [chart.name for _, chart in index.search("glob")]
+    assert names[0] == "Global 200"
+
+
+def test_search_ranked_and_limited():
+    index = ChartsIndex(TEST_FILE)
+    results = index.search("200", limit=1)
+    assert len(results) == 1
+    scores = [score for score, _ in index.search("200")]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_search_no_match():
+    index = ChartsIndex(TEST_FILE)
+    assert index.search("zzzz") == []
+
+
+def test_search_trailing_spaces():
+    search = ChartSearch([ChartData("tla", "Top Livestream Artists ", "top-livestream")])
+    _, chart = search.search("top livestream artists")[0]
+    assert chart.abbreviation == "TLA"
+
+
+def test_unfetchable_charts():
+    index = ChartsIndex(TEST_FILE)
+    assert [chart.abbreviation for chart in index.get_unfetchable()] == ["GLOBAL200"]
+    assert [chart.abbreviation for chart in index.get_fetchable()] == ["HOT100", "BB200"]
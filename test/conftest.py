@@ -0,0 +1,49 @@
+import datetime
+
+import pytest
+
+from src.records.chart_item import ChartItem
+
+
+def get_iso_date(date):
+    return date.isoformat() if isinstance(date, datetime.date) else date
+
+
+def build_item(position, date, title=None, image="image_url", last_week="", peak=None, weeks=1,
+               debut_date=None, debut_position=None, peak_date=None, credits="Artist"):
+    return ChartItem(
+        position=position,
+        title=title if title is not None else f"Song {position}",
+        image=image,
+        last_week=str(last_week or ""),
+        peak=peak if peak is not None else position,
+        weeks=weeks,
+        debut_date=get_iso_date(debut_date if debut_date is not None else date),
+        debut_position=debut_position if debut_position is not None else position,
+        peak_date=get_iso_date(peak_date if peak_date is not None else date),
+        date=date,
+        credits=credits
+    )
+
+
+def build_week(date, size=3, title="Song {}", credits="Artist", **fields):
+    items = []
+    for position in range(1, size + 1):
+        items.append(build_item(position, date,
+                                title=title.format(position),
+                                image="image_url" if position % 2 else "lazyload-fallback",
+                                last_week=position + 1 if position > 1 else None,
+                                weeks=2,
+                                credits=credits if position != 2 else None,
+                                **fields))
+    return items
+
+
+@pytest.fixture
+def make_item():
+    return build_item
+
+
+@pytest.fixture
+def make_week():
+    return build_week
@@ -0,0 +1,114 @@
+import csv
+import datetime
+import gzip
+import json
+
+import pytest
+
+from src.export.export import export_history, export_items, get_format, get_writer
+from src.export.rows import FIELDS, iter_history_rows, iter_item_rows
+from src.storage.chart_store import ChartStore
+
+FIRST_WEEK = datetime.date(1958, 8, 4)
+
+
+@pytest.fixture
+def items(make_week):
+    weeks = [FIRST_WEEK, FIRST_WEEK + datetime.timedelta(days=7)]
+    return [item for date in weeks
+            for item in make_week(date, title="Song \"{}\"", credits="Artist, Ñandú", debut_date=FIRST_WEEK)]
+
+
+@pytest.fixture
+def history(tmp_path, items):
+    store = ChartStore(str(tmp_path / "hot-100"))
+    store.append_week(items[:3])
+    store.append_week(items[3:])
+    with store.read() as history:
+        yield history
+
+
+def test_get_format():
+    assert get_format("hot-100.ndjson") == "ndjson"
+    assert get_format("hot-100.csv.gz") == "csv"
+    assert get_format("hot-100.parquet") == "parquet"
+    with pytest.raises(ValueError):
+        get_format("hot-100.txt")
+
+
+def test_history_rows_match_items(items, history):
+    assert list(iter_history_rows(history)) == list(iter_item_rows(items))
+    assert list(iter_history_rows(history, 1, 2)) == list(iter_item_rows(items[1:2]))
+
+
+@pytest.mark.parametrize("name", ["items.ndjson", "items.ndjson.gz", "items.jsonl.xz"])
+def test_export_ndjson(tmp_path, items, name):
+    file = str(tmp_path / name)
+    assert export_items(items, file, batch_size=4) == len(items)
+
+    opener = gzip.open if name.endswith(".gz") else None
+    if name.endswith(".xz"):
+        import lzma
+        opener = lzma.open
+    with (opener or open)(file, "rt", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+
+    assert lines == [item.to_dict() for item in items]
+
+
+def test_export_csv(tmp_path, items):
+    file = str(tmp_path / "items.csv")
+    export_items(items, file)
+
+    with open(file, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+
+    assert rows[0] == list(FIELDS)
+    expected = [["" if value is None else str(value) for value in item.to_dict().values()]
+                for item in items]
+    assert rows[1:] == expected
+
+
+def test_export_history(tmp_path, items, history):
+    file = str(tmp_path / "history.ndjson")
+    assert export_history(history, file) == len(items)
+
+    with open(file, encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == [item.to_dict() for item in items]
+
+
+def test_unknown_compression(tmp_path):
+    with pytest.raises(ValueError):
+        get_writer(str(tmp_path / "items.csv"), compression="zip")
+
+
+def test_export_parquet(tmp_path, items, history):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    file = str(tmp_path / "history.parquet")
+    assert export_history(history, file, batch_size=2) == len(items)
+
+    table = pq.read_table(file)
+    assert table.column_names == list(FIELDS)
+    assert table.column("date").to_pylist() == [item.date for item in items]
+    assert table.column("credits").to_pylist() == [item.credits for item in items]
+
+
+def test_export_parquet_rows(tmp_path, items, history):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    file = str(tmp_path / "history.parquet")
+    assert export_history(history, file, batch_size=4, start=1) == len(items) - 1
+
+    expected = [dict(zip(FIELDS, row)) for row in iter_item_rows(items[1:], text_dates=False)]
+    assert pq.read_table(file).to_pylist() == expected
+
+
+def test_export_empty_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    file = str(tmp_path / "empty.parquet")
+    with ChartStore(str(tmp_path / "empty")).read() as history:
+        assert export_history(history, file) == 0
+
+    assert pq.read_table(file).num_rows == 0
@@ -0,0 +1,93 @@
+import datetime
+import random
+
+import pytest
+
+from src.records.analytics import get_flags, get_change_texts, get_peak_texts
+from src.records.analytics import longest_running, biggest_climbers, number_ones_by_year
+from src.records.chart_week import ChartWeek
+from src.records.columns import DATE_COLUMNS, INT_COLUMNS
+
+FIRST_WEEK = datetime.date(1999, 12, 4)
+
+
+@pytest.fixture
+def random_week(make_item):
+    rng = random.Random(7)
+    items = []
+    for position in range(1, 201):
+        weeks = rng.choice([1, 1, 2, 5, 30])
+        last_week = rng.choice(["", str(position), str(rng.randint(1, 200))])
+        peak = rng.choice([position, max(1, position - rng.randint(0, 5))])
+        peak_date = rng.choice([FIRST_WEEK, FIRST_WEEK - datetime.timedelta(days=70)])
+        items.append(make_item(position, FIRST_WEEK, last_week=last_week, peak=peak, weeks=weeks,
+                               debut_date=FIRST_WEEK - datetime.timedelta(days=7 * position),
+                               debut_position=1, peak_date=peak_date))
+    return ChartWeek(FIRST_WEEK, items), items
+
+
+@pytest.fixture
+def history(make_item):
+    weeks = []
+    songs = [FIRST_WEEK - datetime.timedelta(days=7 * i) for i in range(3)]
+    for n in range(6):
+        date = FIRST_WEEK + datetime.timedelta(days=7 * n)
+        order = songs if n < 3 else list(reversed(songs))
+        items = []
+        for position, debut in enumerate(order, 1):
+            last_week = "" if n == 0 else str(position if n != 3 else 4 - position)
+            items.append(make_item(position, date, last_week=last_week, peak=1, weeks=n + 1,
+                                   debut_date=debut, debut_position=1))
+        weeks.extend(items)
+    return ChartWeek(FIRST_WEEK, weeks)
+
+
+def test_flags_match_item_properties(random_week):
+    week, items = random_week
+    flags = get_flags(week)
+    for name in ["is_new", "is_re_entry", "has_changed", "is_peak", "is_new_peak", "is_repeak"]:
+        assert flags[name].tolist() == [getattr(item, name) for item in items], name
+
+
+
+def test_flags_from_lists(random_week):
+    week, _ = random_week
+    columns = {name: list(week.column(name)) for name in INT_COLUMNS + DATE_COLUMNS}
+    flags = get_flags(columns)
+    for name, values in get_flags(week).items():
+        assert flags[name].tolist() == values.tolist(), name
+
+def test_texts_match_item_properties(random_week):
+    week, items = random_week
+    assert get_change_texts(week) == [item.change for item in items]
+    assert get_peak_texts(week) == [item.peak_text for item in items]
+
+
+def test_empty_week():
+    week = ChartWeek(FIRST_WEEK)
+    assert get_change_texts(week) == []
+    assert len(longest_running(week)) == 0
+
+
+def test_longest_running(history):
+    merged = history
+    rows = longest_running(merged, limit=2)
+    assert len(rows) == 2
+    assert [merged[row].weeks for row in rows] == [6, 6]
+    assert merged[rows[0]].item_id != merged[rows[1]].item_id
+
+
+def test_biggest_climbers(history):
+    merged = history
+    climbers = biggest_climbers(merged)
+    week_four = FIRST_WEEK + datetime.timedelta(days=21)
+    assert list(climbers) == [week_four]
+    assert merged[climbers[week_four][0]].change == "+2"
+
+
+def test_number_ones_by_year(history):
+    merged = history
+    number_ones = number_ones_by_year(merged)
+    assert sorted(number_ones) == [1999, 2000]
+    assert [merged[row].date for row in number_ones[1999]] == [FIRST_WEEK, FIRST_WEEK + datetime.timedelta(days=21)]
+    assert [merged[row].date for row in number_ones[2000]] == [FIRST_WEEK + datetime.timedelta(days=28)]
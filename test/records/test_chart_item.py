@@ -122,3 +122,31 @@ def test_re_entry_item_flags():
     assert item.is_re_entry is True
     assert item.change == "RE"
     assert item.peak_text is None
+
+
+def test_from_parsed_matches_constructor(base_item):
+    item = ChartItem.from_parsed(
+        position=5,
+        title="Test Song",
+        image="image_url",
+        last_week=8,
+        peak=5,
+        weeks=6,
+        debut_date=datetime.date(2023, 12, 1),
+        debut_position=20,
+        peak_date=datetime.date(2025, 8, 7),
+        date=datetime.date(2025, 8, 7),
+        credits="Artist"
+    )
+    assert item.to_dict() == base_item.to_dict()
+    assert item.item_id == base_item.item_id
+    assert item.change == base_item.change
+    assert item.peak_text == base_item.peak_text
+
+
+def test_from_parsed_without_last_week():
+    item = ChartItem.from_parsed(1, "Song", None, None, 1, 1,
+                                 datetime.date(2025, 8, 7), 1,
+                                 datetime.date(2025, 8, 7), datetime.date(2025, 8, 7))
+    assert item.image is None
+    assert item.change == "NEW"
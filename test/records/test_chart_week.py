@@ -0,0 +1,99 @@
+import datetime
+import pickle
+
+import pytest
+
+from src.records.chart_item import ChartItem
+from src.records.chart_week import ChartWeek
+
+DATE = datetime.date(2025, 8, 9)
+DEBUT_DATE = datetime.date(2025, 7, 26)
+
+
+@pytest.fixture
+def items(make_item):
+    return [make_item(1, DATE, last_week=2, weeks=3, debut_date=DEBUT_DATE),
+            make_item(2, DATE, last_week=1, weeks=3, debut_date=DEBUT_DATE, credits=None),
+            make_item(3, DATE, weeks=3, debut_date=DEBUT_DATE)]
+
+
+@pytest.fixture
+def week(items):
+    return ChartWeek(DATE, items)
+
+
+def test_chart_item_is_slotted(items):
+    assert not hasattr(items[0], "__dict__")
+
+
+def test_chart_item_is_hashable(items, make_item):
+    same = make_item(1, DATE, weeks=3, debut_date=DEBUT_DATE)
+    assert len({items[0], same}) == 1
+    assert items[0] in set(items)
+    assert items[0] != "2025-07-26-1"
+
+
+def test_chart_item_kept_in_set_after_new_version(items):
+    kept = set(items)
+    items[0].update_version()
+    assert items[0].item_id == "2025-07-26-1-1"
+    assert items[0] in kept
+
+
+def test_chart_item_identity_is_read_only(items):
+    with pytest.raises(AttributeError):
+        items[0].debut_position = 5
+    with pytest.raises(AttributeError):
+        items[0].debut_date = DATE
+
+
+def test_week_views_have_no_item_slots(week):
+    view = week[0]
+    assert not isinstance(view, ChartItem)
+    assert not hasattr(view, "__dict__")
+    assert view == week.to_items()[0]
+
+
+def test_chart_item_pickles(items):
+    copy = pickle.loads(pickle.dumps(items[0]))
+    assert copy.to_dict() == items[0].to_dict()
+    assert copy == items[0]
+
+
+def test_week_views_match_items(week, items):
+    assert len(week) == 3
+    for view, item in zip(week, items):
+        assert view.to_dict() == item.to_dict()
+        assert view.item_id == item.item_id
+        assert view.change == item.change
+        assert view.peak_text == item.peak_text
+        assert view.text == item.text
+
+
+def test_week_views_are_read_only(week):
+    with pytest.raises(AttributeError):
+        week[0].position = 10
+
+
+def test_week_indexing(week):
+    assert week[-1].position == 3
+    with pytest.raises(IndexError):
+        week[3]
+
+
+def test_week_diff_with_sets(week, make_item):
+    next_items = [make_item(1, DATE, last_week=1, debut_date=DEBUT_DATE), make_item(4, DATE, debut_date=DEBUT_DATE)]
+    next_week = ChartWeek(DATE + datetime.timedelta(days=7), next_items)
+    dropped = set(week) - set(next_week)
+    assert {item.item_id for item in dropped} == {"2025-07-26-2", "2025-07-26-3"}
+
+
+def test_week_get_by_id(week):
+    assert week.get_by_id("2025-07-26-2").position == 2
+    assert week.get_by_id("missing") is None
+
+
+def test_week_to_items(week, items):
+    copies = week.to_items()
+    assert [item.to_dict() for item in copies] == [item.to_dict() for item in items]
+    assert all(type(item) is ChartItem for item in copies)
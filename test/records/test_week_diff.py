@@ -0,0 +1,97 @@
+import datetime
+
+import pytest
+
+from src.records.chart_week import ChartWeek
+from src.records.week_diff import CLIMB_EVENT, DEBUT_EVENT, DROP_OUT_EVENT, FALL_EVENT
+from src.records.week_diff import NEW_PEAK_EVENT, RE_ENTRY_EVENT, RE_PEAK_EVENT
+from src.records.week_diff import diff_weeks, group_events
+
+LAST_WEEK = datetime.date(2025, 8, 2)
+THIS_WEEK = datetime.date(2025, 8, 9)
+
+
+@pytest.fixture
+def weeks(make_item):
+    previous = [
+        make_item(2, LAST_WEEK, title="Fallen", last_week=1, peak=1, weeks=10,
+                  debut_date="2025-06-01", debut_position=3, peak_date="2025-06-08"),
+        make_item(3, LAST_WEEK, title="Repeaked", last_week=2, peak=1, weeks=8,
+                  debut_date="2025-06-14", debut_position=9, peak_date="2025-06-21"),
+        make_item(10, LAST_WEEK, title="Climber", last_week=12, peak=10, weeks=5,
+                  debut_date="2025-07-05", debut_position=30, peak_date="2025-08-02"),
+        make_item(60, LAST_WEEK, title="Dropped", last_week=55, peak=40, weeks=12,
+                  debut_date="2025-05-17", debut_position=70, peak_date="2025-06-07"),
+        make_item(50, LAST_WEEK, title="Steady", last_week=48, peak=45, weeks=7,
+                  debut_date="2025-06-21", debut_position=80, peak_date="2025-07-12"),
+    ]
+    current = [
+        make_item(1, THIS_WEEK, title="Repeaked", last_week=3, peak=1, weeks=9,
+                  debut_date="2025-06-14", debut_position=9, peak_date="2025-06-21"),
+        make_item(5, THIS_WEEK, title="Climber", last_week=10, peak=5, weeks=6,
+                  debut_date="2025-07-05", debut_position=30, peak_date="2025-08-09"),
+        make_item(8, THIS_WEEK, title="Fallen", last_week=2, peak=1, weeks=11,
+                  debut_date="2025-06-01", debut_position=3, peak_date="2025-06-08"),
+        make_item(20, THIS_WEEK, title="Debut", peak=20, weeks=1,
+                  debut_date="2025-08-09", debut_position=20, peak_date="2025-08-09"),
+        make_item(40, THIS_WEEK, title="Returning", peak=15, weeks=9,
+                  debut_date="2025-03-01", debut_position=50, peak_date="2025-04-05"),
+        make_item(50, THIS_WEEK, title="Steady", last_week=50, peak=45, weeks=8,
+                  debut_date="2025-06-21", debut_position=80, peak_date="2025-07-12"),
+    ]
+    return previous, current
+
+
+def test_diff_weeks(weeks):
+    events = [(event.kind, event.item.title) for event in diff_weeks(*weeks)]
+    assert events == [
+        (CLIMB_EVENT, "Repeaked"),
+        (RE_PEAK_EVENT, "Repeaked"),
+        (CLIMB_EVENT, "Climber"),
+        (NEW_PEAK_EVENT, "Climber"),
+        (FALL_EVENT, "Fallen"),
+        (DEBUT_EVENT, "Debut"),
+        (RE_ENTRY_EVENT, "Returning"),
+        (DROP_OUT_EVENT, "Dropped"),
+    ]
+
+
+def test_events_positions(weeks):
+    groups = group_events(diff_weeks(*weeks))
+
+    dropped = groups[DROP_OUT_EVENT][0]
+    assert dropped.position is None
+    assert dropped.last_position == 60
+    assert dropped.change is None
+
+    fallen = groups[FALL_EVENT][0]
+    assert fallen.change == -6
+    assert groups[DEBUT_EVENT][0].last_position is None
+
+
+def test_events_reconcile_with_items(weeks):
+    for event in diff_weeks(*weeks):
+        item = event.item
+        if event.kind in (CLIMB_EVENT, FALL_EVENT):
+            assert item.change == f"{event.change:+d}"
+        elif event.kind == DEBUT_EVENT:
+            assert item.change == "NEW"
+        elif event.kind == RE_ENTRY_EVENT:
+            assert item.change == "RE"
+        elif event.kind == NEW_PEAK_EVENT:
+            assert item.peak_text == "NEW PEAK"
+        elif event.kind == RE_PEAK_EVENT:
+            assert item.peak_text == "RE-PEAK"
+
+
+def test_diff_chart_weeks(weeks):
+    previous, current = weeks
+    expected = [(event.kind, event.item_id) for event in diff_weeks(previous, current)]
+    events = diff_weeks(ChartWeek(LAST_WEEK, previous), ChartWeek(THIS_WEEK, current))
+    assert [(event.kind, event.item_id) for event in events] == expected
+
+
+def test_diff_same_week(weeks):
+    _, current = weeks
+    events = diff_weeks(current, current)
+    assert {event.kind for event in events} <= {NEW_PEAK_EVENT, RE_PEAK_EVENT}
@@ -0,0 +1,88 @@
+import datetime
+import os
+
+import pytest
+
+from src.storage.chart_store import ChartStore
+
+FIRST_WEEK = datetime.date(1958, 8, 4)
+
+
+@pytest.fixture
+def store(tmp_path, make_week):
+    store = ChartStore(str(tmp_path / "hot-100"))
+    store.append_week(make_week(FIRST_WEEK))
+    store.append_week(make_week(FIRST_WEEK + datetime.timedelta(days=7)))
+    return store
+
+
+def test_store_roundtrip(store, make_week):
+    expected = make_week(FIRST_WEEK) + make_week(FIRST_WEEK + datetime.timedelta(days=7))
+    with store.read() as history:
+        items = history.get_items()
+    assert [item.to_dict() for item in items] == [item.to_dict() for item in expected]
+
+
+def test_store_columns(store):
+    with store.read() as history:
+        assert len(history) == 6
+        assert list(history.column("position")) == [1, 2, 3, 1, 2, 3]
+        assert list(history.column("last_week")) == [-1, 3, 4, -1, 3, 4]
+        assert history.column("date")[0] == FIRST_WEEK.toordinal()
+
+
+def test_store_strings_are_shared(store):
+    with store.read() as history:
+        titles = list(history.column("title"))
+    assert titles[:3] == titles[3:]
+
+
+def test_store_weeks(store):
+    second_week = FIRST_WEEK + datetime.timedelta(days=7)
+    with store.read() as history:
+        assert list(history.iter_weeks()) == [(FIRST_WEEK, 0, 3), (second_week, 3, 6)]
+        assert history.last_date == second_week
+
+
+def test_store_reopen(store, make_week):
+    reopened = ChartStore(store.folder)
+    reopened.append_week(make_week(FIRST_WEEK + datetime.timedelta(days=14)))
+    with reopened.read() as history:
+        assert len(history) == 9
+        assert history.get_item(8).title == "Song 3"
+
+
+def test_store_drops_partial_append(store):
+    with open(os.path.join(store.folder, "position.i32"), "ab") as f:
+        f.write(b"\x01\x00")
+    reopened = ChartStore(store.folder)
+    assert len(reopened) == 6
+    assert os.path.getsize(os.path.join(store.folder, "position.i32")) == 6 * 4
+
+
+def test_store_failed_append(store, make_week, monkeypatch):
+    third_week = FIRST_WEEK + datetime.timedelta(days=14)
+
+    def fail(meta):
+        raise OSError("Disk Full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(store, "write_meta", fail)
+        with pytest.raises(OSError):
+            store.append_week(make_week(third_week, title="New Song {}"))
+
+    assert len(store) == 6
+    assert "New Song 1" not in store.string_ids
+
+    store.append_week(make_week(third_week, title="Other Song {}"))
+    with store.read() as history:
+        assert [item.title for item in history.get_items(6)] == ["Other Song 1", "Other Song 2", "Other Song 3"]
+    assert len(ChartStore(store.folder)) == 9
+
+
+def test_empty_store(tmp_path):
+    store = ChartStore(str(tmp_path / "empty"))
+    with store.read() as history:
+        assert len(history) == 0
+        assert history.last_date is None
+        assert list(history.iter_weeks()) == []
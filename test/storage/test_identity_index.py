@@ -0,0 +1,77 @@
+import datetime
+
+import pytest
+
+from src.storage.chart_store import ChartStore
+from src.storage.identity_index import get_artists, normalize_text
+
+FIRST_WEEK = datetime.date(1958, 8, 4)
+SECOND_WEEK = FIRST_WEEK + datetime.timedelta(days=7)
+
+
+@pytest.fixture
+def store(tmp_path, make_item):
+    store = ChartStore(str(tmp_path / "hot-100"))
+    store.append_week([
+        make_item(1, FIRST_WEEK, title="Poor Little Fool", credits="Ricky Nelson"),
+        make_item(2, FIRST_WEEK, title="Patricia", credits="Perez Prado And His Orchestra"),
+    ])
+    store.append_week([
+        make_item(1, SECOND_WEEK, title="Patricia", credits="Perez Prado And His Orchestra",
+                  debut_date=FIRST_WEEK, debut_position=2),
+        make_item(2, SECOND_WEEK, title="Poor Little Fool", credits="Ricky Nelson",
+                  debut_date=FIRST_WEEK, debut_position=1),
+        make_item(3, SECOND_WEEK, title="Splish Splash", credits="Bobby Darin Featuring Ricky Nelson"),
+    ])
+    return store
+
+
+def test_normalize_text():
+    assert normalize_text("  Don't  Stop-Believin' ") == "don t stop believin"
+
+
+def test_get_artists():
+    assert get_artists("Drake Featuring Future & Young Thug") == [
+        "drake featuring future young thug", "drake", "future", "young thug"]
+
+
+def test_identity_rows(store):
+    index = store.get_identity_index()
+    assert len(index) == 3
+    assert index.get_rows("1958-08-04-1") == [0, 3]
+    assert index.get_rows("1958-08-04-2") == [1, 2]
+    assert index.get_rows("missing") == []
+
+
+def test_identity_ids_match_items(store):
+    index = store.get_identity_index()
+    with store.read() as history:
+        for item in history.get_items():
+            assert item.item_id in index
+
+
+def test_identity_run(store):
+    index = store.get_identity_index()
+    with store.read() as history:
+        run = index.get_run(history, "1958-08-04-1")
+    assert [item.date for item in run] == [FIRST_WEEK, SECOND_WEEK]
+    assert [item.position for item in run] == [1, 2]
+
+
+def test_identity_title_and_artist(store):
+    index = store.get_identity_index()
+    assert index.find_title("poor little FOOL") == ["1958-08-04-1"]
+    assert index.find_artist("Ricky Nelson") == ["1958-08-04-1", "1958-08-11-3"]
+    assert index.find_artist("Perez Prado And His Orchestra") == ["1958-08-04-2"]
+    assert index.find_artist("nobody") == []
+
+
+def test_identity_incremental(store, make_item):
+    index = store.get_identity_index()
+    third_week = SECOND_WEEK + datetime.timedelta(days=7)
+    store.append_week([make_item(1, third_week, title="Poor Little Fool", credits="Ricky Nelson",
+                                 debut_date=FIRST_WEEK, debut_position=1)])
+
+    assert store.get_identity_index() is index
+    assert index.get_rows("1958-08-04-1") == [0, 3, 5]
+    assert index.indexed == 6
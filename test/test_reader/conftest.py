@@ -0,0 +1,205 @@
+import datetime
+import gzip
+import os
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.reader.cache import ChartDateCache, HtmlCache
+from src.reader.exceptions import ConnectionError
+from src.reader.website import BillboardChartWebsite
+
+TEST_FOLDER = os.path.dirname(os.path.dirname(__file__))
+FIXTURES_FOLDER = os.path.join(os.path.dirname(TEST_FOLDER), "benchmarks", "fixtures")
+
+HOT_100_DATE = datetime.date(2025, 8, 9)
+FIRST_HOT_100_DATE = datetime.date(1958, 8, 4)
+
+ETAG = '"v1"'
+
+
+def read_fixture(chart, date):
+    path = os.path.join(FIXTURES_FOLDER, f"{chart}-{date.isoformat()}.html.gz")
+    with gzip.open(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+class OfflineFetcher():
+    def __init__(self):
+        self.urls = []
+
+    def fetch_if_changed(self, url, etag=None, last_modified=None):
+        self.urls.append(url)
+        raise ConnectionError(f"Unexpected Request To {url}")
+
+    def scan(self, url, finder, chunk_size=None):
+        self.urls.append(url)
+        raise ConnectionError(f"Unexpected Request To {url}")
+
+
+class OfflineAsyncFetcher():
+    def __init__(self):
+        self.closed = False
+
+    async def fetch(self, url):
+        raise ConnectionError(f"Unexpected Request To {url}")
+
+    async def close(self):
+        self.closed = True
+
+
+class FixtureFetcher():
+    def __init__(self, pages):
+        self.pages = pages
+        self.urls = []
+
+    def fetch_if_changed(self, url, etag=None, last_modified=None):
+        self.urls.append(url)
+        return self.pages[url], None, None
+
+    def scan(self, url, finder, chunk_size=None):
+        self.urls.append(url)
+        data = self.pages[url].encode("utf-8")
+        return finder(bytearray(data)), len(data)
+
+
+class ScriptedFetcher():
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def fetch_if_changed(self, url, etag=None, last_modified=None):
+        self.requests.append((url, etag, last_modified))
+        html = self.responses.pop(0)
+        return html, ETAG, None
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        server.hits[self.path] = server.hits.get(self.path, 0) + 1
+        hits = server.hits[self.path]
+
+        if self.path == "/flaky" and hits < 3:
+            status = 503
+        elif self.path == "/limited" and hits < 2:
+            status = 429
+        elif self.path == "/missing":
+            status = 404
+        else:
+            status = 200
+
+        if self.path == "/etag" and self.headers.get("If-None-Match") == ETAG:
+            status = 304
+
+        body = f"page {self.path}".encode("utf-8") if status != 304 else b""
+        if self.path == "/long":
+            body = b"head <found> " + b"x" * 1024 * 1024
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        if self.path == "/etag":
+            self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    httpd.hits = {}
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def url_for(server):
+    host, port = server.server_address
+
+    def get_url(path):
+        return f"http://{host}:{port}{path}"
+
+    return get_url
+
+
+@pytest.fixture
+def hot_100_date():
+    return HOT_100_DATE
+
+
+@pytest.fixture
+def first_hot_100_date():
+    return FIRST_HOT_100_DATE
+
+
+@pytest.fixture
+def etag():
+    return ETAG
+
+
+@pytest.fixture
+def fixture_page():
+    return read_fixture
+
+
+@pytest.fixture
+def offline_fetcher():
+    return OfflineFetcher()
+
+
+@pytest.fixture
+def offline_async_fetcher():
+    return OfflineAsyncFetcher()
+
+
+@pytest.fixture
+def fixture_fetcher():
+    return FixtureFetcher
+
+
+@pytest.fixture
+def scripted_fetcher():
+    return ScriptedFetcher
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = HtmlCache(str(tmp_path / "pages"))
+    cache.set("hot-100", HOT_100_DATE, read_fixture("hot-100", HOT_100_DATE))
+    cache.set("hot-100", FIRST_HOT_100_DATE, read_fixture("hot-100", FIRST_HOT_100_DATE))
+    cache.set("billboard-global-200", HOT_100_DATE, read_fixture("billboard-global-200", HOT_100_DATE))
+    return cache
+
+
+@pytest.fixture
+def get_website(cache, offline_fetcher):
+    def build(chart="hot-100", date=HOT_100_DATE, **kwargs):
+        kwargs.setdefault("fetcher", offline_fetcher)
+        kwargs.setdefault("cache", cache)
+        kwargs.setdefault("date_cache", ChartDateCache())
+        return BillboardChartWebsite(chart, date, **kwargs)
+
+    return build
+
+
+@pytest.fixture
+def get_async_website(cache, offline_async_fetcher):
+    # aiohttp is only needed by the async tests
+    from src.reader.async_website import AsyncBillboardChartWebsite
+
+    def build(chart="hot-100", date=HOT_100_DATE, **kwargs):
+        kwargs.setdefault("fetcher", offline_async_fetcher)
+        kwargs.setdefault("cache", cache)
+        kwargs.setdefault("date_cache", ChartDateCache())
+        return AsyncBillboardChartWebsite(chart, date, **kwargs)
+
+    return build
@@ -0,0 +1,38 @@
+import asyncio
+import time
+
+import pytest
+
+from src.reader.async_fetcher import AsyncChartFetcher
+from src.reader.exceptions import ConnectionError
+
+
+async def fetch_all(urls, rate=None, **kwargs):
+    async with AsyncChartFetcher(backoff=0, rate=rate, **kwargs) as fetcher:
+        return await asyncio.gather(*(fetcher.fetch(url) for url in urls))
+
+
+def test_async_fetch_concurrently(url_for):
+    paths = [f"/chart/{i}" for i in range(20)]
+    pages = asyncio.run(fetch_all([url_for(path) for path in paths], workers=4))
+    assert pages == [f"page {path}" for path in paths]
+
+
+def test_async_fetch_retries(server, url_for):
+    pages = asyncio.run(fetch_all([url_for("/flaky")]))
+    assert pages == ["page /flaky"]
+    assert server.hits["/flaky"] == 3
+
+
+def test_async_fetch_client_error(server, url_for):
+    with pytest.raises(ConnectionError):
+        asyncio.run(fetch_all([url_for("/missing")]))
+    assert server.hits["/missing"] == 1
+
+
+def test_async_fetch_rate_limited(url_for):
+    paths = [f"/chart/{i}" for i in range(5)]
+    start = time.monotonic()
+    pages = asyncio.run(fetch_all([url_for(path) for path in paths], rate=50))
+    assert pages == [f"page {path}" for path in paths]
+    assert time.monotonic() - start >= 4 / 50
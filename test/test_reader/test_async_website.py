@@ -0,0 +1,89 @@
+import asyncio
+import datetime
+
+import pytest
+
+from src.reader.async_fetcher import AsyncChartFetcher
+from src.reader.cache import ChartDateCache
+from src.reader.exceptions import ConnectionError
+from src.reader.instrumentation import Metrics
+
+
+def test_async_get_items(get_async_website, get_website):
+    async def read():
+        async with get_async_website() as website:
+            return await website.get_items()
+
+    items = asyncio.run(read())
+    assert [item.to_dict() for item in items] == [item.to_dict() for item in get_website().get_items()]
+
+
+def test_async_get_chart_date(get_async_website, hot_100_date):
+    async def read():
+        async with get_async_website("billboard-global-200") as website:
+            return await website.get_chart_date()
+
+    assert asyncio.run(read()) == hot_100_date
+
+
+def test_async_iter_items(get_async_website):
+    async def read():
+        async with get_async_website() as website:
+            return [item.position async for item in website]
+
+    assert asyncio.run(read()) == list(range(1, 101))
+
+
+def test_async_missing_page(get_async_website, hot_100_date):
+    async def read():
+        async with get_async_website(date=hot_100_date + datetime.timedelta(days=7)) as website:
+            return await website.get_items()
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(read())
+
+
+def test_async_shared_fetcher_left_open(get_async_website, offline_async_fetcher):
+    async def read():
+        async with get_async_website() as website:
+            return await website.get_items()
+
+    asyncio.run(read())
+    assert not offline_async_fetcher.closed
+
+
+def test_async_own_fetcher_closed(get_async_website):
+    async def read():
+        async with get_async_website(fetcher=None) as website:
+            assert isinstance(website.fetcher, AsyncChartFetcher)
+            session = website.fetcher.get_session()
+        return session
+
+    session = asyncio.run(read())
+    assert session.closed
+
+
+def test_async_chart_date_from_date_cache(get_async_website, hot_100_date):
+    date = hot_100_date + datetime.timedelta(days=3)
+    date_cache = ChartDateCache()
+    date_cache.set("hot-100", date, hot_100_date)
+
+    async def read():
+        async with get_async_website(date=date, date_cache=date_cache) as website:
+            return await website.get_chart_date()
+
+    assert asyncio.run(read()) == hot_100_date
+
+
+def test_async_metrics_match(get_async_website, get_website):
+    metrics = Metrics()
+
+    async def read():
+        async with get_async_website(metrics=metrics) as website:
+            return await website.get_html()
+
+    asyncio.run(read())
+    expected = Metrics()
+    get_website(metrics=expected).get_html()
+
+    assert metrics.get_counters() == expected.get_counters()
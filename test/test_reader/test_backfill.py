@@ -0,0 +1,87 @@
+import datetime
+
+import pytest
+
+from src.reader.backfill import BackfillCheckpoint, backfill, get_week_dates, get_worker_state
+from src.reader.cache import HtmlCache
+from src.reader.exceptions import DateError
+
+PUBLISHED_WEEK = datetime.date(2025, 8, 9)
+BROKEN_WEEK = datetime.date(2025, 8, 16)
+
+
+def test_get_week_dates():
+    dates = get_week_dates(datetime.date(1958, 8, 4), datetime.date(1958, 9, 1))
+    assert dates[0] == datetime.date(1958, 8, 4)
+    assert dates[-1] == datetime.date(1958, 9, 1)
+    assert len(dates) == 5
+
+
+def test_get_week_dates_empty_range():
+    assert get_week_dates(datetime.date(2000, 1, 8), datetime.date(2000, 1, 1)) == []
+
+
+def test_checkpoint_resumes(tmp_path):
+    file = str(tmp_path / "progress.log")
+    date = datetime.date(1958, 8, 4)
+
+    checkpoint = BackfillCheckpoint(file)
+    assert not checkpoint.is_done(date)
+    checkpoint.mark_done(date)
+
+    resumed = BackfillCheckpoint(file)
+    assert resumed.is_done(date)
+    assert len(resumed) == 1
+
+
+def test_checkpoint_ignores_partial_lines(tmp_path):
+    file = tmp_path / "progress.log"
+    file.write_text("1958-08-04\n1958-08-1")
+
+    checkpoint = BackfillCheckpoint(str(file))
+    assert len(checkpoint) == 1
+
+
+def test_worker_state_is_reused(tmp_path):
+    state = get_worker_state(2.5, str(tmp_path))
+    assert state["fetcher"].limiter.interval == 0.4
+    assert state["cache"].folder == str(tmp_path)
+    assert get_worker_state(2.5, str(tmp_path)) is state
+
+
+def test_backfill(tmp_path, fixture_page):
+    folder = str(tmp_path / "cache")
+    cache = HtmlCache(folder)
+    cache.set("hot-100", PUBLISHED_WEEK, fixture_page("hot-100", PUBLISHED_WEEK))
+    cache.set("hot-100", BROKEN_WEEK, "<html><body></body></html>")
+    checkpoint = str(tmp_path / "progress.log")
+
+    weeks = []
+
+    def sink(chart_date, items):
+        weeks.append((chart_date, len(items)))
+
+    failures = backfill("hot-100", PUBLISHED_WEEK, BROKEN_WEEK, sink,
+                        workers=2, checkpoint=checkpoint, cache_folder=folder)
+
+    assert weeks == [(PUBLISHED_WEEK, 100)]
+    assert list(failures) == [BROKEN_WEEK]
+    assert isinstance(failures[BROKEN_WEEK], DateError)
+    assert BackfillCheckpoint(checkpoint).done == {PUBLISHED_WEEK}
+
+    # Only the failed week is read again when resuming
+    cache.set("hot-100", BROKEN_WEEK, fixture_page("hot-100", PUBLISHED_WEEK))
+    weeks.clear()
+
+    failures = backfill("hot-100", PUBLISHED_WEEK, BROKEN_WEEK, sink,
+                        workers=2, checkpoint=checkpoint, cache_folder=folder)
+
+    assert failures == {}
+    assert weeks == [(PUBLISHED_WEEK, 100)]
+    assert BackfillCheckpoint(checkpoint).done == {PUBLISHED_WEEK, BROKEN_WEEK}
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_backfill_needs_workers(workers):
+    with pytest.raises(ValueError):
+        backfill("hot-100", PUBLISHED_WEEK, BROKEN_WEEK, lambda chart_date, items: None, workers=workers)
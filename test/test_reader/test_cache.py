@@ -0,0 +1,122 @@
+import datetime
+import gzip
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.reader.cache import ChartDateCache, HtmlCache
+
+PACKAGE_FOLDER = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PRINT_DATES_FILE = "from src.reader.cache import CHART_DATES_FILE; print(CHART_DATES_FILE)"
+
+HTML = "<html><body>Hot 100</body></html>"
+DATE = datetime.date(1958, 8, 4)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HtmlCache(str(tmp_path), ttl=60)
+
+
+def test_cache_miss(cache):
+    assert cache.get("hot-100", DATE) is None
+
+
+def test_cache_roundtrip(cache):
+    cache.set("hot-100", DATE, HTML)
+    assert cache.get("hot-100", DATE) == HTML
+
+
+def test_cache_is_compressed(cache):
+    cache.set("hot-100", DATE, HTML)
+    with gzip.open(cache.get_path("hot-100", DATE), "rb") as f:
+        assert f.read().decode("utf-8") == HTML
+
+
+def test_cache_keys_by_link_and_date(cache):
+    cache.set("hot-100", DATE, HTML)
+    assert cache.get("billboard-200", DATE) is None
+    assert cache.get("hot-100", DATE + datetime.timedelta(days=7)) is None
+    assert cache.get("hot-100") is None
+
+
+def test_cache_past_dates_never_expire(cache):
+    cache.set("hot-100", DATE, HTML)
+    old = time.time() - 10 * 365 * 24 * 60 * 60
+    os.utime(cache.get_path("hot-100", DATE), (old, old))
+    assert cache.get("hot-100", DATE) == HTML
+
+
+def test_cache_current_chart_expires(cache):
+    cache.set("hot-100", None, HTML)
+    assert cache.get("hot-100") == HTML
+    old = time.time() - 120
+    os.utime(cache.get_path("hot-100"), (old, old))
+    assert cache.get("hot-100") is None
+
+
+def test_cache_unsettled_dates_expire(cache):
+    for date in [datetime.date.today(), datetime.date.today() + datetime.timedelta(days=3)]:
+        cache.set("hot-100", date, HTML)
+        assert cache.get("hot-100", date) == HTML
+        old = time.time() - 120
+        os.utime(cache.get_path("hot-100", date), (old, old))
+        assert cache.get("hot-100", date) is None
+
+
+def test_cache_leaves_no_temporary_files(cache, tmp_path):
+    cache.set("hot-100", DATE, HTML)
+    cache.set("hot-100", DATE, HTML)
+    files = [name for _, _, names in os.walk(tmp_path) for name in names]
+    assert len(files) == 1
+
+
+def test_cache_remove(cache):
+    cache.set("hot-100", DATE, HTML)
+    cache.remove("hot-100", DATE)
+    cache.remove("hot-100", DATE)
+    assert cache.get("hot-100", DATE) is None
+
+
+def test_date_cache_persists(tmp_path):
+    file = str(tmp_path / "dates.log")
+    dates = ChartDateCache(file)
+    dates.set("hot-100", datetime.date(1958, 8, 6), DATE)
+
+    assert ChartDateCache(file).get("hot-100", datetime.date(1958, 8, 6)) == DATE
+
+
+def test_date_cache_skips_unsettled():
+    dates = ChartDateCache()
+    dates.set("hot-100", None, DATE)
+    dates.set("hot-100", DATE + datetime.timedelta(days=7), DATE)
+
+    today = datetime.date.today()
+    dates.set("hot-100", today, today - datetime.timedelta(days=3))
+
+    assert len(dates) == 0
+
+
+def get_default_folder(**variables):
+    env = {key: value for key, value in os.environ.items() if key != "BILLBOARD_CACHE_FOLDER"}
+    env.update(variables)
+    result = subprocess.run([sys.executable, "-c", PRINT_DATES_FILE],
+                            cwd=PACKAGE_FOLDER,
+                            env=env,
+                            capture_output=True,
+                            text=True)
+    assert result.returncode == 0, result.stderr
+    return os.path.dirname(result.stdout.strip())
+
+
+def test_cache_folder_in_user_cache(tmp_path):
+    assert get_default_folder(XDG_CACHE_HOME=str(tmp_path)) == str(tmp_path / "billboard")
+
+
+def test_cache_folder_from_variable(tmp_path):
+    folder = str(tmp_path / "pages")
+    assert get_default_folder(BILLBOARD_CACHE_FOLDER=folder) == folder
@@ -0,0 +1,93 @@
+import time
+
+import pytest
+
+from src.reader.exceptions import ConnectionError
+from src.reader.fetcher import ChartFetcher, HostRateLimiter
+
+
+@pytest.fixture
+def fetcher():
+    with ChartFetcher(workers=4, backoff=0, rate=None) as fetcher:
+        yield fetcher
+
+
+def test_fetch_ok(fetcher, url_for):
+    assert fetcher.fetch(url_for("/hot-100")) == "page /hot-100"
+
+
+def test_fetch_retries_server_errors(server, fetcher, url_for):
+    assert fetcher.fetch(url_for("/flaky")) == "page /flaky"
+    assert server.hits["/flaky"] == 3
+
+
+def test_fetch_retries_rate_limited(server, fetcher, url_for):
+    assert fetcher.fetch(url_for("/limited")) == "page /limited"
+    assert server.hits["/limited"] == 2
+
+
+def test_fetch_gives_up_after_retries(server, url_for):
+    with ChartFetcher(retries=1, backoff=0, rate=None) as fetcher:
+        with pytest.raises(ConnectionError):
+            fetcher.fetch(url_for("/flaky"))
+    assert server.hits["/flaky"] == 2
+
+
+def test_fetch_client_error_not_retried(server, fetcher, url_for):
+    with pytest.raises(ConnectionError):
+        fetcher.fetch(url_for("/missing"))
+    assert server.hits["/missing"] == 1
+
+
+def test_fetch_many_keeps_order(fetcher, url_for):
+    paths = [f"/chart/{i}" for i in range(10)]
+    pages = fetcher.fetch_many(url_for(path) for path in paths)
+    assert pages == [f"page {path}" for path in paths]
+
+
+def test_rate_limiter_spaces_same_host():
+    limiter = HostRateLimiter(rate=50)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.wait("example.com")
+    assert time.monotonic() - start >= 4 / 50
+
+
+def test_rate_limiter_hosts_are_independent():
+    limiter = HostRateLimiter(rate=1)
+    start = time.monotonic()
+    limiter.wait("a.com")
+    limiter.wait("b.com")
+    assert time.monotonic() - start < 0.5
+
+
+def test_fetch_if_changed_not_modified(fetcher, url_for):
+    url = url_for("/etag")
+    html, etag, last_modified = fetcher.fetch_if_changed(url)
+    assert html == "page /etag"
+    assert etag == '"v1"'
+
+    html, etag, _ = fetcher.fetch_if_changed(url, etag, last_modified)
+    assert html is None
+    assert etag == '"v1"'
+
+
+def test_fetch_if_changed_without_validators(fetcher, url_for):
+    html, etag, last_modified = fetcher.fetch_if_changed(url_for("/plain"), "old")
+    assert html == "page /plain"
+    assert etag == "old"
+
+
+def test_scan_stops_early(fetcher, url_for):
+    def find(data):
+        return "found" if b"<found>" in data else None
+
+    found, read = fetcher.scan(url_for("/long"), find, chunk_size=1024)
+    assert found == "found"
+    assert read < 1024 * 1024
+
+
+def test_scan_not_found(fetcher, url_for):
+    found, read = fetcher.scan(url_for("/plain"), lambda data: None)
+    assert found is None
+    assert read == len("page /plain")
@@ -1,4 +1,5 @@
 from src.reader.filters import evaluate_rule, attrs_filter, get_filter, Actions, NodeFilter
+from src.reader.filters import compile_rule, compile_attrs
 
 
 def test_evaluate_rule_equals():
@@ -80,3 +81,65 @@ def test_get_filter_builds_node_filter():
     assert nf.name == "div"
     assert nf.attrs({"class": "container"}) is True
     assert nf.attrs({"class": "box"}) is False
+
+
+def test_named_filter_keeps_its_key():
+    from src.reader import filters
+
+    assert filters.CARDS_FILTER.key == "node"
+    assert filters.DATE_FILTER.key == "date"
+    assert get_filter({"tag": "div"}).key is None
+
+
+def test_named_filters_stay_out_of_module_globals():
+    from src.reader import filters
+
+    assert filters.CARDS_FILTER is filters.CARDS_FILTER
+    assert "CARDS_FILTER" not in vars(filters)
+    assert "FILTERS_DATA" not in vars(filters)
+
+
+def test_compile_rule_matches_evaluate_rule():
+    values = ["music", "pop music", "music pop", "  music  ", "rock"]
+    for action in ["equals", "starts_with", "contains", "ends_with", "not_equals"]:
+        rule = {"action": action, "value": "music"}
+        check = compile_rule(rule)
+        for value in values:
+            assert check(value.strip()) == evaluate_rule(value, rule)
+
+
+def test_compile_rule_invalid_input():
+    assert compile_rule({}) is None
+    assert compile_rule({"action": "equals"}) is None
+    assert compile_rule("not_a_dict") is None
+
+
+def test_compile_attrs_matches_attrs_filter():
+    rules_list = [
+        {},
+        {"class": {"action": "equals", "value": "chart-title"}},
+        {"class": [
+            {"action": "starts_with", "value": "c-label a-no"},
+            {"action": "starts_with", "value": "c-label  a-font"},
+        ]},
+        {"class": [
+            {"action": "contains", "value": "credits"},
+            {"action": "ends_with", "value": "text"},
+        ]},
+        {"id": {"action": "equals", "value": "main"},
+         "class": {"action": "not_equals", "value": "hidden"}},
+        {"class": [{"action": "equals"}]},
+    ]
+    attrs_list = [
+        {},
+        {"id": "main"},
+        {"id": "main", "class": "hidden"},
+        {"id": "main", "class": " chart-title "},
+        {"class": "c-label a-no-trucate"},
+        {"class": "c-label  a-font-secondary"},
+        {"class": "credits big-text"},
+    ]
+    for rules in rules_list:
+        matcher = compile_attrs(rules)
+        for attrs in attrs_list:
+            assert matcher(attrs) == attrs_filter(attrs, rules)
@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+import os
+
+PACKAGE_FOLDER = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CHECK = """
+import sys
+path = list(sys.path)
+import src.reader.website
+import src.reader.filters as filters
+assert sys.path == path, "sys.path changed"
+assert "requests" not in sys.modules, "requests imported"
+assert "BeautifulSoup" not in sys.modules, "BeautifulSoup imported"
+assert filters.load_filters_data.cache_info().currsize == 0, "filters file read"
+"""
+
+
+def test_website_import_is_lazy():
+    result = subprocess.run([sys.executable, "-c", CHECK],
+                            cwd=PACKAGE_FOLDER,
+                            capture_output=True,
+                            text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,117 @@
+import json
+import threading
+
+from src.reader.filters import NodeFilter
+from src.reader.instrumentation import Metrics, get_metrics, measure, set_metrics
+from src.reader.instrumentation import CACHE_HITS, CACHE_MISSES, FILTER_CHECKS, FILTER_MATCHES, PARSE_STAGE
+
+
+def test_timings_are_aggregated():
+    metrics = Metrics()
+    metrics.time(PARSE_STAGE, 0.5, chart="hot-100")
+    metrics.time(PARSE_STAGE, 1.5, chart="hot-100")
+
+    timing, = metrics.to_dict()["timings"]
+    assert timing == {"stage": PARSE_STAGE, "labels": {"chart": "hot-100"},
+                      "count": 2, "total_seconds": 2.0, "max_seconds": 1.5}
+
+
+def test_counters_by_label():
+    metrics = Metrics()
+    metrics.add(CACHE_HITS, chart="hot-100")
+    metrics.add(CACHE_HITS, 2, chart="billboard-200")
+    metrics.add(CACHE_MISSES, chart="hot-100")
+
+    assert metrics.get_counter(CACHE_HITS) == 3
+    assert metrics.get_cache_hit_rate() == 0.75
+
+
+def test_measure():
+    metrics = Metrics()
+    with measure(metrics, PARSE_STAGE, chart="hot-100"):
+        pass
+    with measure(None, PARSE_STAGE, chart="hot-100"):
+        pass
+
+    timing, = metrics.to_dict()["timings"]
+    assert timing["count"] == 1
+
+
+def test_filter_counts_by_chart():
+    metrics = Metrics()
+    node_filter = NodeFilter("li", None, lambda attrs: attrs == "title")
+    hot_100 = metrics.count_filter("title", node_filter, chart="hot-100")
+    global_200 = metrics.count_filter("title", node_filter, chart="billboard-global-200")
+    assert metrics.count_filter("title", node_filter, chart="hot-100") is hot_100
+
+    def check():
+        for _ in range(1000):
+            hot_100.attrs("title")
+            global_200.attrs("other")
+
+    threads = [threading.Thread(target=check) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    counters = metrics.get_counters()
+    assert counters[(FILTER_CHECKS, (("chart", "hot-100"), ("filter", "title")))] == 4000
+    assert counters[(FILTER_MATCHES, (("chart", "hot-100"), ("filter", "title")))] == 4000
+    assert counters[(FILTER_CHECKS, (("chart", "billboard-global-200"), ("filter", "title")))] == 4000
+    assert counters[(FILTER_MATCHES, (("chart", "billboard-global-200"), ("filter", "title")))] == 0
+
+
+def test_cache_hit_rate_without_reads():
+    assert Metrics().get_cache_hit_rate() is None
+
+
+def test_callback_gets_every_measure():
+    events = []
+    metrics = Metrics(events.append)
+    metrics.time(PARSE_STAGE, 0.25, chart="hot-100")
+    metrics.add(CACHE_HITS, chart="hot-100")
+
+    assert events == [
+        {"event": "timing", "stage": PARSE_STAGE, "seconds": 0.25, "chart": "hot-100"},
+        {"event": "counter", "name": CACHE_HITS, "value": 1, "chart": "hot-100"},
+    ]
+
+
+def test_prometheus_text():
+    metrics = Metrics()
+    metrics.time(PARSE_STAGE, 0.25, chart="hot-100")
+    metrics.add(CACHE_HITS, chart="hot-100")
+
+    text = metrics.to_prometheus()
+    assert '# TYPE billboard_stage_seconds summary' in text
+    assert 'billboard_stage_seconds_count{stage="parse",chart="hot-100"} 1' in text
+    assert 'billboard_stage_seconds_sum{stage="parse",chart="hot-100"} 0.25' in text
+    assert 'billboard_cache_hits_total{chart="hot-100"} 1' in text
+
+
+def test_json_export():
+    metrics = Metrics()
+    metrics.add(CACHE_MISSES, chart="hot-100")
+
+    data = json.loads(metrics.to_json())
+    assert data["counters"] == [{"name": CACHE_MISSES, "labels": {"chart": "hot-100"}, "value": 1}]
+    assert data["cache_hit_rate"] == 0.0
+
+
+def test_reset():
+    metrics = Metrics()
+    metrics.add(CACHE_HITS)
+    metrics.reset()
+    assert metrics.to_dict()["counters"] == []
+
+
+def test_shared_metrics_disabled_by_default():
+    assert get_metrics() is None
+
+    metrics = Metrics()
+    set_metrics(metrics)
+    try:
+        assert get_metrics() is metrics
+    finally:
+        set_metrics(None)
@@ -0,0 +1,102 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.reader.filters import CARDS_FILTER, DATE_FILTER, IMAGES_FILTER, TITLES_FILTER
+from src.reader.parsers.backends import get_parser
+from src.reader.parsers.base import ParserBackend
+from src.reader.scanner import CardScanner
+
+pytest.importorskip("lxml")
+
+PAGE = """
+<html><body>
+<div id="chart-date-picker" data-date="2025-08-09"></div>
+<!-- comment -->
+<div class="o-chart-results-list-row-container">
+    <div class="c-lazy-image  lrv-u-width-100p"><div class="wrapper"><img src="a.jpg"/></div></div>
+    <h3 id="title-of-a-story" class="c-title  a-font-basic u-letter-spacing-0010">
+        First &amp; Song
+    </h3>
+</div>
+<div class="o-chart-results-list-row-container">
+    <h3 id="title-of-a-story" class="c-title  a-font-basic u-letter-spacing-0010">Second</h3>
+</div>
+</body></html>
+"""
+
+
+PACKAGE_FOLDER = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Reads a fixture page with lxml while the BeautifulSoup package can't be
+# imported
+WITHOUT_SOUP = """
+import datetime
+import sys
+import tempfile
+sys.modules["BeautifulSoup"] = None
+from benchmarks.bench_pipeline import read_page
+from benchmarks.make_fixtures import get_fixture_path
+from src.reader.cache import ChartDateCache, HtmlCache
+from src.reader.website import BillboardChartWebsite
+date = datetime.date(2025, 8, 9)
+cache = HtmlCache(tempfile.mkdtemp())
+cache.set("hot-100", date, read_page(get_fixture_path("hot-100", date)))
+website = BillboardChartWebsite("hot-100", date, cache=cache, date_cache=ChartDateCache(), parser="lxml")
+assert len(website.get_items()) == 100
+assert len(list(website.iter_items())) == 100
+"""
+
+
+def test_get_parser_by_name():
+    parser = get_parser("lxml")
+    assert parser.name == "lxml"
+    assert get_parser("lxml") is parser
+    assert get_parser(parser) is parser
+
+
+def test_get_parser_unknown():
+    with pytest.raises(ValueError):
+        get_parser("html5")
+
+
+def test_custom_backend_passes_through():
+    class Backend(ParserBackend):
+        name = "custom"
+
+    backend = Backend()
+    assert get_parser(backend) is backend
+
+
+def test_lxml_find():
+    root = get_parser("lxml").parse(PAGE)
+    date_node = root.find(DATE_FILTER)
+    assert date_node.name == "div"
+    assert date_node.attrs["data-date"] == "2025-08-09"
+    assert root.find(IMAGES_FILTER).children[0].children[0].attrs["src"] == "a.jpg"
+
+
+def test_lxml_find_all_text():
+    root = get_parser("lxml").parse(PAGE)
+    cards = root.find_all(CARDS_FILTER)
+    assert len(cards) == 2
+    titles = [card.find(TITLES_FILTER).text.strip() for card in cards]
+    assert titles == ["First & Song", "Second"]
+
+
+def test_lxml_scanner_fast_path():
+    root = get_parser("lxml").parse(PAGE)
+    scanner = CardScanner({"title": TITLES_FILTER, "image": IMAGES_FILTER})
+    found = scanner.scan(root.find_all(CARDS_FILTER)[0])
+    assert found["title"] == [root.find(TITLES_FILTER)]
+    assert len(found["image"]) == 1
+
+
+def test_lxml_does_not_need_soup_package():
+    result = subprocess.run([sys.executable, "-c", WITHOUT_SOUP],
+                            cwd=PACKAGE_FOLDER,
+                            capture_output=True,
+                            text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,58 @@
+from src.reader.filters import get_filter
+from src.reader.scanner import CardScanner
+
+
+class Node():
+    def __init__(self, name, attrs=None, children=None):
+        self.name = name
+        self.attrs = attrs or {}
+        self.children = children or []
+
+
+SPAN_FILTER = get_filter({
+    "tag": "span",
+    "attributes": {"class": {"action": "starts_with", "value": "label"}}
+})
+LINK_FILTER = get_filter({
+    "tag": "a",
+    "attributes": {"class": {"action": "equals", "value": "date"}}
+})
+
+
+def build_card():
+    first = Node("span", {"class": "label first"})
+    nested = Node("span", {"class": "label nested"})
+    outer = Node("span", {"class": "label outer"}, [nested])
+    link = Node("a", {"class": "date"})
+    other = Node("a", {"class": "other"})
+    card = Node("div", {"class": "card"}, [
+        Node("li", {}, [first, "text"]),
+        Node("li", {}, [outer, link, other]),
+    ])
+    return card, [first, outer, nested], [link]
+
+
+def test_scan_collects_every_slot_in_document_order():
+    card, spans, links = build_card()
+    scanner = CardScanner({"spans": SPAN_FILTER, "links": LINK_FILTER})
+
+    found = scanner.scan(card)
+
+    assert found["spans"] == spans
+    assert found["links"] == links
+
+
+def test_scan_empty_slots():
+    scanner = CardScanner({"spans": SPAN_FILTER, "links": LINK_FILTER})
+
+    found = scanner.scan(Node("div", {}, [Node("p")]))
+
+    assert found == {"spans": [], "links": []}
+
+
+def test_scan_skips_the_scanned_node():
+    scanner = CardScanner({"spans": SPAN_FILTER})
+
+    found = scanner.scan(Node("span", {"class": "label"}))
+
+    assert found["spans"] == []
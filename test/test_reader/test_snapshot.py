@@ -0,0 +1,57 @@
+import datetime
+
+from src.chart_data.chart_index import get_index
+from src.constants import CHARTS_FILE
+from src.reader.cache import ChartDateCache
+from src.reader.exceptions import ConnectionError
+from src.reader.snapshot import get_snapshot_charts, iter_snapshot, snapshot
+
+SNAPSHOT_DATE = datetime.date(2025, 8, 9)
+
+
+def test_get_snapshot_charts():
+    index = get_index(CHARTS_FILE)
+    assert get_snapshot_charts() == index.get_fetchable()
+
+    charts = get_snapshot_charts(["hot-100", "HSI", "billboard-global-200"])
+    assert [chart.link for chart in charts] == ["hot-100", "billboard-global-200"]
+
+
+def test_snapshot(cache, offline_fetcher):
+    fetcher = offline_fetcher
+    results = snapshot(SNAPSHOT_DATE,
+                       ["billboard-global-200", "hot-100", "billboard-200"],
+                       concurrency=3,
+                       fetcher=fetcher,
+                       cache=cache,
+                       date_cache=ChartDateCache())
+
+    assert [result.chart.link for result in results.values()] == ["billboard-global-200", "hot-100", "billboard-200"]
+
+    hot_100 = results["HSI"]
+    assert hot_100.ok
+    assert hot_100.chart_date == SNAPSHOT_DATE
+    assert len(hot_100.items) == 100
+    assert len(results["GLO"].items) == 200
+
+    failed = results["TLP"]
+    assert not failed.ok
+    assert isinstance(failed.error, ConnectionError)
+    assert failed.items == []
+    assert len(fetcher.urls) == 1
+
+
+def test_snapshot_unfetchable_chart(cache, offline_fetcher):
+    chart = get_index(CHARTS_FILE).get_unfetchable()[0]
+    results = snapshot(SNAPSHOT_DATE, [chart], fetcher=offline_fetcher, cache=cache, date_cache=ChartDateCache())
+    assert isinstance(results[chart.abbreviation].error, ValueError)
+
+
+def test_iter_snapshot_streams_results(cache, offline_fetcher):
+    results = list(iter_snapshot(SNAPSHOT_DATE,
+                                 ["hot-100", "billboard-global-200"],
+                                 fetcher=offline_fetcher,
+                                 cache=cache,
+                                 date_cache=ChartDateCache()))
+    assert sorted(result.chart.link for result in results) == ["billboard-global-200", "hot-100"]
+    assert all(result.ok for result in results)
@@ -0,0 +1,73 @@
+from src.reader.stream import find_start_tag, iter_elements, read_attributes
+
+PAGE = """
+<html><body>
+<div id="chart-date-picker" data-date="2025-08-09"></div>
+<div class="o-chart-results-list-row-container">
+    <div class="inner"><span>1</span></div>
+    <img src="a.jpg"/>
+</div>
+<div class="other"><div class="o-chart-results-list-row-container"><span>2</span></div></div>
+<DIV class='o-chart-results-list-row-container'><span>3</span></DIV>
+<divider class="o-chart-results-list-row-container"></divider>
+</body></html>
+"""
+
+
+def is_card(attrs):
+    return attrs.get("class") == "o-chart-results-list-row-container"
+
+
+def test_read_attributes():
+    attrs = read_attributes(' id="a" class=\'b c\' data-x=1 hidden title="&amp;"')
+    assert attrs == {"id": "a", "class": "b c", "data-x": "1", "hidden": "", "title": "&"}
+
+
+def test_iter_elements_bodies():
+    cards = [body for _, body in iter_elements(PAGE, "div", is_card)]
+    assert len(cards) == 3
+    assert cards[0].startswith('<div class="o-chart-results-list-row-container">')
+    assert cards[0].endswith("</div>")
+    assert '<img src="a.jpg"/>' in cards[0]
+    assert cards[1] == '<div class="o-chart-results-list-row-container"><span>2</span></div>'
+    assert cards[2] == "<DIV class='o-chart-results-list-row-container'><span>3</span></DIV>"
+
+
+def test_iter_elements_attributes_only():
+    elements = iter_elements(PAGE, "div", lambda attrs: attrs.get("id") == "chart-date-picker", with_body=False)
+    attrs, body = next(elements)
+    assert attrs["data-date"] == "2025-08-09"
+    assert body is None
+
+
+def test_iter_elements_stops_early():
+    elements = iter_elements(PAGE, "div", is_card)
+    next(elements)
+    elements.close()
+
+
+def test_iter_elements_unclosed_element():
+    bodies = [body for _, body in iter_elements('<div class="a"><span>x', "div")]
+    assert bodies == ['<div class="a"><span>x']
+
+
+def is_date_picker(attrs):
+    return attrs.get("id") == "chart-date-picker"
+
+
+def test_find_start_tag():
+    data = PAGE.encode("utf-8")
+    attrs = find_start_tag(data, "div", b"chart-date-picker", is_date_picker)
+    assert attrs == {"id": "chart-date-picker", "data-date": "2025-08-09"}
+
+
+def test_find_start_tag_cut_tag():
+    data = PAGE.encode("utf-8")
+    cut = data[:data.index(b"data-date")]
+    assert find_start_tag(cut, "div", b"chart-date-picker", is_date_picker) is None
+
+
+def test_find_start_tag_skips_other_tags():
+    data = b'<a href="#chart-date-picker">x</a><div id="chart-date-picker" data-date="1">'
+    attrs = find_start_tag(data, "div", b"chart-date-picker", is_date_picker)
+    assert attrs["data-date"] == "1"
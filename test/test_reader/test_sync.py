@@ -0,0 +1,79 @@
+import datetime
+
+import pytest
+
+from src.reader.cache import ChartDateCache
+from src.reader.sync import get_missing_dates, sync
+from src.storage.chart_store import ChartStore
+
+LAST_WEEK = datetime.date(2025, 8, 2)
+PUBLISHED_WEEK = datetime.date(2025, 8, 9)
+NEXT_WEEK = datetime.date(2025, 8, 16)
+
+
+def get_url(date):
+    return f"https://www.billboard.com/charts/hot-100/{date.isoformat()}"
+
+
+@pytest.fixture
+def fetcher(fixture_page, fixture_fetcher):
+    # The chart of the next week isn't out, its url serves the last one
+    page = fixture_page("hot-100", PUBLISHED_WEEK)
+    return fixture_fetcher({get_url(PUBLISHED_WEEK): page, get_url(NEXT_WEEK): page})
+
+
+def run_sync(store, fetcher, cache, date_cache, start_date=None):
+    return sync("hot-100", store, start_date, until=datetime.date(2025, 8, 20),
+                fetcher=fetcher, cache=cache, date_cache=date_cache)
+
+
+def test_get_missing_dates():
+    dates = get_missing_dates(LAST_WEEK, datetime.date(2025, 8, 20))
+    assert dates == [datetime.date(2025, 8, 9), datetime.date(2025, 8, 16)]
+
+
+def test_get_missing_dates_up_to_date():
+    assert get_missing_dates(LAST_WEEK, datetime.date(2025, 8, 8)) == []
+
+
+def test_sync_needs_start_date_on_empty_store(tmp_path, fetcher, cache):
+    with pytest.raises(ValueError):
+        run_sync(ChartStore(str(tmp_path / "hot-100")), fetcher, cache, ChartDateCache())
+
+
+def test_sync_appends_published_weeks(tmp_path, fetcher, cache):
+    store = ChartStore(str(tmp_path / "hot-100"))
+
+    synced = run_sync(store, fetcher, cache, ChartDateCache(), start_date=PUBLISHED_WEEK)
+
+    assert synced == [PUBLISHED_WEEK]
+    assert len(store) == 100
+    with store.read() as history:
+        assert history.last_date == PUBLISHED_WEEK
+    # The published week was read from the cache, only the head of the
+    # next one was requested
+    assert fetcher.urls == [get_url(NEXT_WEEK)]
+
+
+def test_sync_skips_unpublished_week(tmp_path, fetcher, cache, fixture_page):
+    store = ChartStore(str(tmp_path / "hot-100"))
+    run_sync(store, fetcher, cache, ChartDateCache(), start_date=PUBLISHED_WEEK)
+
+    # A page of the next week cached before its chart came out
+    cache.set("hot-100", NEXT_WEEK, fixture_page("hot-100", PUBLISHED_WEEK))
+    fetcher.urls = []
+
+    assert run_sync(store, fetcher, cache, ChartDateCache()) == []
+    assert len(store) == 100
+    assert fetcher.urls == []
+    assert cache.get("hot-100", NEXT_WEEK) is None
+
+
+def test_sync_rerun_appends_nothing(tmp_path, fetcher, cache):
+    store = ChartStore(str(tmp_path / "hot-100"))
+    date_cache = ChartDateCache()
+    run_sync(store, fetcher, cache, date_cache, start_date=PUBLISHED_WEEK)
+
+    assert run_sync(store, fetcher, cache, date_cache) == []
+    assert run_sync(ChartStore(store.folder), fetcher, cache, date_cache) == []
+    assert len(ChartStore(store.folder)) == 100
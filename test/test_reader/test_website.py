@@ -0,0 +1,198 @@
+import datetime
+
+import pytest
+
+from src.reader.cache import HtmlCache
+from src.reader.exceptions import DateError
+from src.reader.instrumentation import Metrics
+from src.reader.parsers.backends import get_parser
+from src.reader.parsers.base import ParserBackend
+from src.reader.website import find_chart_date
+
+
+def test_chart_date(get_website, hot_100_date):
+    assert get_website().get_chart_date() == hot_100_date
+
+
+def test_chart_date_missing(get_website):
+    website = get_website()
+    website.set_html("<html><body></body></html>")
+    with pytest.raises(DateError):
+        website.get_chart_date()
+
+
+def test_find_chart_date(fixture_page, hot_100_date):
+    data = fixture_page("hot-100", hot_100_date).encode("utf-8")
+    assert find_chart_date(data) == hot_100_date
+    assert find_chart_date(data[:100]) is None
+
+
+def test_resolve_chart_date_from_cache(get_website, fixture_page, hot_100_date):
+    website = get_website(date=hot_100_date + datetime.timedelta(days=3))
+    website.cache.set("hot-100", website.date, fixture_page("hot-100", hot_100_date))
+    assert website.resolve_chart_date() == hot_100_date
+    assert website.date_cache.get("hot-100", website.date) == hot_100_date
+
+
+@pytest.mark.parametrize("chart, date_fixture, size", [
+    ("hot-100", "hot_100_date", 100),
+    ("hot-100", "first_hot_100_date", 100),
+    ("billboard-global-200", "hot_100_date", 200),
+])
+def test_get_items(chart, date_fixture, size, get_website, request):
+    date = request.getfixturevalue(date_fixture)
+    items = get_website(chart, date).get_items()
+    assert len(items) == size
+    assert [item.position for item in items] == list(range(1, size + 1))
+    assert all(item.date == date for item in items)
+    assert all(item.debut_date <= date for item in items)
+
+
+def test_get_items_parsed_and_streamed_match(get_website):
+    parsed = get_website()
+    parsed.get_soup()
+    streamed = get_website()
+    assert [item.to_dict() for item in parsed.get_items()] == [item.to_dict() for item in streamed.iter_items()]
+    assert streamed.soup is None
+
+
+def test_get_items_parses_once(get_website):
+    class CountingParser(ParserBackend):
+        name = "counting"
+
+        def __init__(self):
+            self.calls = 0
+
+        def parse(self, html):
+            self.calls += 1
+            return get_parser().parse(html)
+
+    parser = CountingParser()
+    website = get_website(parser=parser)
+    website.get_chart_date()
+    first = website.get_items()
+    second = website.get_items()
+    assert parser.calls == 1
+    assert [item.to_dict() for item in first] == [item.to_dict() for item in second]
+
+
+def test_get_items_fields(get_website):
+    item = get_website().get_items()[0]
+    assert item.title == "Love Light"
+    assert item.credits == "Ana Sol"
+    assert item.image.endswith("artist-1-180x180.jpg")
+    assert item.last_week == 3
+    assert item.weeks == 30
+    assert item.debut_date == datetime.date(2025, 1, 18)
+
+
+def test_get_items_old_chart(get_website, first_hot_100_date):
+    items = get_website(date=first_hot_100_date).get_items()
+    assert all(item.image is None for item in items)
+    assert items[0].debut_date == datetime.date(1958, 5, 19)
+
+
+def test_new_entries(get_website, hot_100_date):
+    items = get_website().get_items()
+    new_items = [item for item in items if item.weeks == 1]
+    assert new_items
+    for item in new_items:
+        assert item.debut_date == hot_100_date
+        assert item.debut_position == item.position
+
+
+@pytest.mark.parametrize("chart, date_fixture", [
+    ("hot-100", "first_hot_100_date"),
+    ("billboard-global-200", "hot_100_date"),
+])
+def test_parsers_give_the_same_items(chart, date_fixture, get_website, request):
+    pytest.importorskip("lxml")
+    date = request.getfixturevalue(date_fixture)
+    reference = get_website(chart, date)
+    reference.get_soup()
+    expected = [item.to_dict() for item in reference.get_items()]
+
+    parsed = get_website(chart, date, parser="lxml")
+    parsed.get_soup()
+    streamed = get_website(chart, date, parser="lxml")
+
+    assert [item.to_dict() for item in parsed.get_items()] == expected
+    assert [item.to_dict() for item in streamed.iter_items()] == expected
+
+
+def test_metrics(get_website):
+    metrics = Metrics()
+    website = get_website(metrics=metrics)
+    website.get_soup()
+    items = website.get_items()
+
+    counters = {(counter["name"], tuple(counter["labels"].items())): counter["value"]
+                for counter in metrics.to_dict()["counters"]}
+    assert counters[("cache_hits", (("chart", "hot-100"),))] == 1
+    assert counters[("items_built", (("chart", "hot-100"),))] == len(items)
+    assert counters[("filter_matches", (("chart", "hot-100"), ("filter", "title")))] == len(items)
+    assert counters[("filter_checks", (("chart", "hot-100"), ("filter", "title")))] >= len(items)
+
+    stages = {timing["stage"]: timing["count"] for timing in metrics.to_dict()["timings"]}
+    assert stages["parse"] == 1
+    assert stages["build"] == len(items)
+    assert metrics.get_cache_hit_rate() == 1.0
+
+
+def test_metrics_keep_items(get_website):
+    measured = get_website(metrics=Metrics())
+    expected = [item.to_dict() for item in get_website().get_items()]
+    assert [item.to_dict() for item in measured.get_items()] == expected
+
+
+@pytest.fixture
+def get_updated_website(tmp_path, get_website):
+    def build(fetcher):
+        return get_website(fetcher=fetcher, cache=HtmlCache(str(tmp_path / "fresh")))
+
+    return build
+
+
+def test_check_update_after_download(get_updated_website, scripted_fetcher, fixture_page, hot_100_date):
+    fetcher = scripted_fetcher(fixture_page("hot-100", hot_100_date))
+    website = get_updated_website(fetcher)
+
+    assert not website.check_update()
+    assert len(fetcher.requests) == 1
+
+
+def test_check_update_not_modified(get_updated_website, scripted_fetcher, fixture_page, hot_100_date, etag):
+    html = fixture_page("hot-100", hot_100_date)
+    fetcher = scripted_fetcher(html, None)
+    website = get_updated_website(fetcher)
+    website.get_html()
+
+    assert not website.check_update()
+    assert len(fetcher.requests) == 2
+    assert fetcher.requests[-1][1] == etag
+    assert website.html == html
+
+
+def test_check_update_same_body(get_updated_website, scripted_fetcher, fixture_page, hot_100_date, etag):
+    html = fixture_page("hot-100", hot_100_date)
+    fetcher = scripted_fetcher(html, html)
+    website = get_updated_website(fetcher)
+    soup = website.get_soup()
+
+    assert not website.check_update()
+    assert len(fetcher.requests) == 2
+    assert fetcher.requests[-1][1] == etag
+    assert website.get_soup() is soup
+
+
+def test_check_update_changed_body(get_updated_website, scripted_fetcher, fixture_page, hot_100_date):
+    old_html = fixture_page("hot-100", hot_100_date)
+    new_html = old_html + "<!-- updated -->"
+    fetcher = scripted_fetcher(old_html, new_html)
+    website = get_updated_website(fetcher)
+    website.get_items()
+
+    assert website.check_update()
+    assert len(fetcher.requests) == 2
+    assert website.html == new_html
+    assert website.cache.get("hot-100", hot_100_date) == new_html